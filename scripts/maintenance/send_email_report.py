@@ -3,10 +3,12 @@ Email Report System for AI x Blockchain Strategic Monitoring
 Sends comprehensive reports on opportunities, account monitoring, and system performance
 """
 
+import io
 import os
 import smtplib
 import json
 import asyncio
+from bisect import bisect_right
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
@@ -22,6 +24,11 @@ from bot.api.claude_client import ClaudeAPIClient
 from bot.accounts.tracker import StrategicAccountTracker
 from bot.scheduling.cron_monitor import CronMonitorSystem, AlertConfiguration
 
+# Red / amber / green for engagement and voice predictions, matching the cron monitor alerts
+_PREDICTION_COLORS = ('#e74c3c', '#f39c12', '#27ae60')
+_ENGAGEMENT_COLOR_BINS = (0.5, 0.7)
+_VOICE_COLOR_BINS = (0.6, 0.8)
+
 class EmailReportSystem:
     """
     Comprehensive email reporting system for strategic monitoring
@@ -208,7 +215,9 @@ class EmailReportSystem:
     
     def _generate_report_html(self, report_data: Dict) -> str:
         """Generate HTML email report"""
-        opportunities_html = ""
+        # Write fragments into one growing buffer rather than re-copying a str per +=
+        opportunities_buf = io.StringIO()
+        write_opportunity = opportunities_buf.write
         for i, opp in enumerate(report_data['recent_opportunities'], 1):
             priority_emoji = "🔥" if opp['strategic_value'] == 'high' else "⚡" if opp['strategic_value'] == 'medium' else "📊"
             
@@ -226,7 +235,7 @@ class EmailReportSystem:
                 quote_url = f"https://twitter.com/intent/tweet?text={opp.get('generated_reply', '')}"
             
             # Alternative responses
-            alternatives_html = ""
+            alternatives_buf = io.StringIO()
             if opp.get('alternative_responses'):
                 for j, alt in enumerate(opp['alternative_responses'][:2], 1):
                     if tweet_id and tweet_id.isdigit():
@@ -234,18 +243,20 @@ class EmailReportSystem:
                     else:
                         alt_reply_text = f"@{opp['account']} {alt}"
                         alt_reply_url = f"https://twitter.com/intent/tweet?text={alt_reply_text}"
-                    alternatives_html += f"""
+                    alternatives_buf.write(f"""
                     <div style="background: #f0f0f0; padding: 8px; margin: 5px 0; border-radius: 4px; border-left: 3px solid #3498db;">
                         <strong>Alternative {j}:</strong> {alt}<br>
                         <a href="{alt_reply_url}" style="font-size: 12px; color: #3498db; text-decoration: none;">📝 Use This Reply</a>
                     </div>
-                    """
+                    """)
+            
+            alternatives_html = alternatives_buf.getvalue()
             
             # Performance indicators
-            engagement_color = "#27ae60" if opp.get('engagement_prediction', 0) >= 0.7 else "#f39c12" if opp.get('engagement_prediction', 0) >= 0.5 else "#e74c3c"
-            voice_color = "#27ae60" if opp.get('voice_alignment_score', 0) >= 0.8 else "#f39c12" if opp.get('voice_alignment_score', 0) >= 0.6 else "#e74c3c"
+            engagement_color = _PREDICTION_COLORS[bisect_right(_ENGAGEMENT_COLOR_BINS, opp.get('engagement_prediction') or 0.0)]
+            voice_color = _PREDICTION_COLORS[bisect_right(_VOICE_COLOR_BINS, opp.get('voice_alignment_score') or 0.0)]
             
-            opportunities_html += f"""
+            write_opportunity(f"""
             <div style="border: 1px solid #ddd; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fafafa;">
                 <h4 style="color: #2c3e50; margin: 0 0 15px 0; border-bottom: 2px solid #3498db; padding-bottom: 8px;">
                     {priority_emoji} Opportunity {i}: {opp['account']}
@@ -313,7 +324,8 @@ class EmailReportSystem:
                     {f' | <a href="https://twitter.com/intent/like?tweet_id={tweet_id}" style="color: #3498db; text-decoration: none; margin: 0 8px;">❤️ Like</a>' if tweet_id and tweet_id.isdigit() else ''}
                 </div>
             </div>
-            """
+            """)
+        opportunities_html = opportunities_buf.getvalue()
         
         voice_evolution = report_data['voice_evolution']
         performance = report_data['performance_metrics']
@@ -509,14 +521,14 @@ class EmailReportSystem:
         # Generate report data
         report_data = await self.generate_comprehensive_report()
         
-        # Generate HTML content
-        html_content = self._generate_report_html(report_data)
+        # Render and send in worker threads so the event loop stays responsive
+        html_content = await asyncio.to_thread(self._generate_report_html, report_data)
         
         # Create subject line
         subject = f"🎯 AI x Blockchain KOL Report - {datetime.now().strftime('%Y-%m-%d')} - {len(report_data['recent_opportunities'])} Opportunities"
         
         # Send email
-        success = self.send_email_report(subject, html_content)
+        success = await asyncio.to_thread(self.send_email_report, subject, html_content)
         
         if success:
             print("\n🎉 Strategic monitoring report sent successfully!")
@@ -40,7 +40,7 @@ class EmailSender:
             ''')
             
         html = '<html><body>' + ''.join(html_parts) + '</body></html>'
-        msg.attach(MIMEText(html, 'html'))
+        msg.attach(MIMEText(html, 'html', 'utf-8'))
         
         # Send email
         try:
@@ -60,7 +60,7 @@ class EmailSender:
         msg['To'] = self.recipient_email
         msg['Subject'] = subject
         
-        msg.attach(MIMEText(html_content, 'html'))
+        msg.attach(MIMEText(html_content, 'html', 'utf-8'))
         
         try:
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
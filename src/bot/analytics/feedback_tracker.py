@@ -3,7 +3,6 @@ Feedback Tracking System for Voice Evolution
 Tracks opportunity quality ratings and reply version selections to improve voice over time
 """
 
-import json
 import os
 import uuid
 from datetime import datetime, timedelta
@@ -11,6 +10,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import structlog
+import orjson
 from bot.utils.logging_config import get_component_logger
 
 logger = get_component_logger("feedback_tracker")
@@ -100,8 +100,8 @@ class FeedbackTracker:
         """Load existing feedback data"""
         try:
             if self.feedback_file.exists():
-                with open(self.feedback_file, 'r') as f:
-                    feedback_data = json.load(f)
+                with open(self.feedback_file, 'rb') as f:
+                    feedback_data = orjson.loads(f.read())
                     self.feedback_data = [
                         OpportunityFeedback.from_dict(item) 
                         for item in feedback_data
@@ -117,8 +117,8 @@ class FeedbackTracker:
         """Load pending feedback requests"""
         try:
             if self.pending_feedback_file.exists():
-                with open(self.pending_feedback_file, 'r') as f:
-                    self.pending_feedback = json.load(f)
+                with open(self.pending_feedback_file, 'rb') as f:
+                    self.pending_feedback = orjson.loads(f.read())
                 logger.info(f"Loaded {len(self.pending_feedback)} pending feedback requests")
             else:
                 logger.info("No pending feedback found")
@@ -130,8 +130,8 @@ class FeedbackTracker:
         """Save feedback data to disk"""
         try:
             feedback_dicts = [item.to_dict() for item in self.feedback_data]
-            with open(self.feedback_file, 'w') as f:
-                json.dump(feedback_dicts, f, indent=2)
+            with open(self.feedback_file, 'wb') as f:
+                f.write(orjson.dumps(feedback_dicts, option=orjson.OPT_INDENT_2))
             logger.info(f"Saved {len(self.feedback_data)} feedback records")
         except Exception as e:
             logger.error(f"Error saving feedback data: {e}")
@@ -139,8 +139,8 @@ class FeedbackTracker:
     def _save_pending_feedback(self):
         """Save pending feedback to disk"""
         try:
-            with open(self.pending_feedback_file, 'w') as f:
-                json.dump(self.pending_feedback, f, indent=2)
+            with open(self.pending_feedback_file, 'wb') as f:
+                f.write(orjson.dumps(self.pending_feedback, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Error saving pending feedback: {e}")
     
@@ -149,31 +149,43 @@ class FeedbackTracker:
         Create tracking for a new opportunity sent in email alerts
         Returns unique opportunity ID for feedback tracking
         """
-        opportunity_id = str(uuid.uuid4())[:8]
-        
-        tracking_data = {
-            'opportunity_id': opportunity_id,
-            'timestamp': datetime.now().isoformat(),
-            'account_username': opportunity_data.get('account_username'),
-            'opportunity_type': opportunity_data.get('opportunity_type'),
-            'overall_score': opportunity_data.get('overall_score'),
-            'generated_reply': opportunity_data.get('generated_reply'),
-            'alternative_responses': opportunity_data.get('alternative_responses', []),
-            'voice_alignment_score': opportunity_data.get('voice_alignment_score'),
-            'content_url': opportunity_data.get('content_url')
-        }
+        return self.create_opportunity_tracking_batch([opportunity_data])[0]
+    
+    def create_opportunity_tracking_batch(self, opportunities_data: List[Dict]) -> List[str]:
+        """
+        Create tracking for several opportunities with a single write of the pending file
+        Returns opportunity IDs in the same order as the input
+        """
+        opportunity_ids = []
+        timestamp = datetime.now().isoformat()
         
-        self.pending_feedback[opportunity_id] = tracking_data
-        self._save_pending_feedback()
+        for opportunity_data in opportunities_data:
+            opportunity_id = str(uuid.uuid4())[:8]
+            
+            self.pending_feedback[opportunity_id] = {
+                'opportunity_id': opportunity_id,
+                'timestamp': timestamp,
+                'account_username': opportunity_data.get('account_username'),
+                'opportunity_type': opportunity_data.get('opportunity_type'),
+                'overall_score': opportunity_data.get('overall_score'),
+                'generated_reply': opportunity_data.get('generated_reply'),
+                'alternative_responses': opportunity_data.get('alternative_responses', []),
+                'voice_alignment_score': opportunity_data.get('voice_alignment_score'),
+                'content_url': opportunity_data.get('content_url')
+            }
+            opportunity_ids.append(opportunity_id)
+            
+            logger.info(
+                "opportunity_tracking_created",
+                opportunity_id=opportunity_id,
+                account=opportunity_data.get('account_username'),
+                score=opportunity_data.get('overall_score')
+            )
         
-        logger.info(
-            "opportunity_tracking_created",
-            opportunity_id=opportunity_id,
-            account=opportunity_data.get('account_username'),
-            score=opportunity_data.get('overall_score')
-        )
+        if opportunity_ids:
+            self._save_pending_feedback()
         
-        return opportunity_id
+        return opportunity_ids
     
     def record_quality_feedback(self, opportunity_id: str, quality_rating: int, reason: str = None):
         """Record quality rating for an opportunity (1-5 scale)"""
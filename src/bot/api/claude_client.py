@@ -205,7 +205,8 @@ Focus on whether this represents a good opportunity for meaningful engagement.""
                              opportunity_type: str,
                              context: Dict,
                              target_topics: List[str],
-                             voice_guidelines: str = None) -> ContentGeneration:
+                             voice_guidelines: str = None,
+                             system_prompt: str = None) -> ContentGeneration:
         """
         Generate content for a specific opportunity.
         
@@ -214,6 +215,10 @@ Focus on whether this represents a good opportunity for meaningful engagement.""
         - Context of the conversation
         - Your target topics and expertise
         - Your voice and brand guidelines
+        
+        A caller-supplied system_prompt replaces the built-in instructions and
+        output schema; the model's raw text is then returned as content for the
+        caller to parse. context['prompt'], when present, is sent as the user turn.
         """
         start_time = time.time()
         
@@ -225,13 +230,17 @@ Focus on whether this represents a good opportunity for meaningful engagement.""
             timestamp=datetime.now().isoformat()
         )
         
-        # Build context-aware prompt
-        prompt = self._build_content_prompt(opportunity_type, context, target_topics, voice_guidelines)
+        # Static instructions go in a cacheable system block, the post itself in the user turn
+        caller_schema = system_prompt is not None
+        if not caller_schema:
+            system_prompt = self._build_content_system_prompt(opportunity_type, target_topics, voice_guidelines)
+        prompt = context.get('prompt') or self._build_content_context(opportunity_type, context)
         
         try:
             response_data = await self._make_api_call("messages", {
                 "model": "claude-3-sonnet-20240229",  # Higher quality model for content generation
                 "max_tokens": 500,
+                "system": [self._system_block(system_prompt)],
                 "messages": [{"role": "user", "content": prompt}]
             })
             
@@ -240,6 +249,21 @@ Focus on whether this represents a good opportunity for meaningful engagement.""
             # Parse the response
             content = response_data.get("content", [{}])[0].get("text", "")
             
+            if caller_schema:
+                logger.info(
+                    "content_generation_completed",
+                    content_length=len(content),
+                    response_time=response_time
+                )
+                return ContentGeneration(
+                    content=content,
+                    content_type=opportunity_type,
+                    confidence=0.5,
+                    reasoning="",
+                    alternatives=[],
+                    estimated_engagement=0.5
+                )
+            
             try:
                 # Extract JSON from response
                 json_start = content.find('{')
@@ -305,24 +329,14 @@ Focus on whether this represents a good opportunity for meaningful engagement.""
                 estimated_engagement=0.0
             )
     
-    def _build_content_prompt(self, opportunity_type: str, context: Dict, 
-                            target_topics: List[str], voice_guidelines: str = None) -> str:
-        """Build a context-aware prompt for content generation."""
+    def _build_content_system_prompt(self, opportunity_type: str, target_topics: List[str],
+                                     voice_guidelines: str = None) -> str:
+        """Build the static content-generation instructions shared across opportunities."""
         
-        base_prompt = f"""You are helping create engaging social media content for someone with expertise in: {', '.join(target_topics)}.
+        return f"""You are helping create engaging social media content for someone with expertise in: {', '.join(target_topics)}.
 
 OPPORTUNITY TYPE: {opportunity_type}
 
-CONTEXT:
-"""
-        
-        if opportunity_type == "reply" and context.get("text"):
-            base_prompt += f"Original post: \"{context['text']}\"\n"
-            base_prompt += f"Author: @{context.get('author_id', 'unknown')}\n"
-        elif opportunity_type == "keyword_engagement" and context.get("search_text"):
-            base_prompt += f"Found post about '{context['keyword']}': \"{context['search_text']}\"\n"
-        
-        base_prompt += f"""
 YOUR EXPERTISE: {', '.join(target_topics)}
 
 {f'VOICE GUIDELINES: {voice_guidelines}' if voice_guidelines else 'VOICE: Professional but approachable, knowledgeable without being condescending'}
@@ -343,8 +357,31 @@ Please generate engaging content and provide a JSON response with:
 
 Make it valuable, authentic, crypto-native, and likely to generate positive engagement.
 """
+    
+    def _build_content_prompt(self, opportunity_type: str, context: Dict, 
+                            target_topics: List[str], voice_guidelines: str = None) -> str:
+        """Build a context-aware prompt for content generation."""
         
-        return base_prompt
+        return (self._build_content_system_prompt(opportunity_type, target_topics, voice_guidelines)
+                + "\n" + self._build_content_context(opportunity_type, context))
+    
+    def _build_content_context(self, opportunity_type: str, context: Dict) -> str:
+        """Build the per-opportunity context for content generation."""
+        
+        prompt = "CONTEXT:\n"
+        
+        if opportunity_type == "reply" and context.get("text"):
+            prompt += f"Original post: \"{context['text']}\"\n"
+            prompt += f"Author: @{context.get('author_id', 'unknown')}\n"
+        elif opportunity_type == "keyword_engagement" and context.get("search_text"):
+            prompt += f"Found post about '{context['keyword']}': \"{context['search_text']}\"\n"
+        
+        return prompt
+    
+    def _system_block(self, text: str) -> Dict:
+        """Wrap system text as a block marked for prompt caching."""
+        # Prefixes shorter than the model's cache minimum are simply processed uncached
+        return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
     
     async def _make_api_call(self, endpoint: str, payload: Dict) -> Dict:
         """Make API call to Claude with error handling and logging."""
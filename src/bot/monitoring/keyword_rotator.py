@@ -7,6 +7,7 @@ to create organic, narrative-following search patterns.
 
 import random
 import json
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import List, Dict, Set, Tuple
 from pathlib import Path
@@ -14,6 +15,20 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Weighted choices as names plus cumulative weights, sampled with one bisect per pick
+_NARRATIVE_TYPES = ("primary", "secondary", "emerging")
+_NARRATIVE_CUM_WEIGHTS = (0.5, 0.8, 1.0)
+
+# Chronically online search habits: narrative checks 30%, memecoin checks 15%,
+# technical deep dives 25%, yield hunting 15%, general scrolling 15%
+_SEARCH_PATTERNS = ("narrative_check", "memecoin_degen", "technical_deep", "yield_hunting", "general_scroll")
+_SEARCH_PATTERN_CUM_WEIGHTS = (0.3, 0.45, 0.7, 0.85, 1.0)
+
+
+def _weighted_choice(names: Tuple[str, ...], cum_weights: Tuple[float, ...]) -> str:
+    """Pick a name with probability proportional to its share of the cumulative weights"""
+    return names[bisect_right(cum_weights, random.random() * cum_weights[-1])]
+
 
 class KeywordRotator:
     """Manages dynamic keyword rotation for organic search behavior"""
@@ -162,18 +177,9 @@ class KeywordRotator:
         """Get keywords based on current narratives"""
         keywords = []
         
-        # Weight by narrative importance
-        narrative_weights = {
-            "primary": 0.5,
-            "secondary": 0.3,
-            "emerging": 0.2
-        }
-        
         for _ in range(count):
-            narrative_type = random.choices(
-                list(narrative_weights.keys()),
-                weights=list(narrative_weights.values())
-            )[0]
+            # Weight by narrative importance
+            narrative_type = _weighted_choice(_NARRATIVE_TYPES, _NARRATIVE_CUM_WEIGHTS)
             
             base_term = random.choice(self.current_narratives[narrative_type])
             
@@ -190,20 +196,9 @@ class KeywordRotator:
         """Get organic mix of keywords - most realistic behavior"""
         keywords = []
         
-        # Simulate chronically online behavior patterns
-        patterns = [
-            ("narrative_check", 0.3),    # Checking current narratives
-            ("memecoin_degen", 0.15),    # Quick memecoin checks
-            ("technical_deep", 0.25),    # Deep technical searches
-            ("yield_hunting", 0.15),     # Looking for yield opportunities
-            ("general_scroll", 0.15)     # General crypto scrolling
-        ]
-        
         for _ in range(count):
-            pattern = random.choices(
-                [p[0] for p in patterns],
-                weights=[p[1] for p in patterns]
-            )[0]
+            # Simulate chronically online behavior patterns
+            pattern = _weighted_choice(_SEARCH_PATTERNS, _SEARCH_PATTERN_CUM_WEIGHTS)
             
             if pattern == "narrative_check":
                 # Check trending narratives
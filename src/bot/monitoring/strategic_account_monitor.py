@@ -7,7 +7,7 @@ Implements tier-based prioritization and intelligent deduplication.
 import json
 import os
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 import structlog
 
@@ -162,7 +162,6 @@ class StrategicAccountMonitor:
                 # Make both times timezone-aware for comparison
                 now = datetime.now()
                 if tweet_time.tzinfo:
-                    from datetime import timezone
                     now = datetime.now(timezone.utc)
                     
                 if now - tweet_time > timedelta(hours=2):
@@ -6,6 +6,7 @@ opportunities for relevant banger posts.
 """
 
 import asyncio
+import re
 import time
 import logging
 from datetime import datetime, timedelta
@@ -697,7 +698,6 @@ class TrendMonitor:
         ]
         
         # Count bot pattern matches
-        import re
         pattern_matches = 0
         for pattern in bot_indicators:
             if isinstance(pattern, str):
@@ -752,7 +752,6 @@ class TrendMonitor:
         created_at = tweet.get('author', {}).get('created_at', '')
         if created_at:
             try:
-                from datetime import datetime
                 account_age_days = (datetime.now() - datetime.fromisoformat(created_at.replace('Z', '+00:00'))).days
                 if account_age_days < 30 and tweet.get('author', {}).get('public_metrics', {}).get('tweet_count', 0) > 500:
                     # New account with high activity - likely bot
@@ -855,7 +854,6 @@ class TrendMonitor:
         ]
         
         # Count human discussion indicators
-        import re
         human_score = 0
         for pattern in human_indicators:
             if re.search(pattern, text.lower()):
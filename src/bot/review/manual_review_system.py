@@ -403,18 +403,18 @@ class ManualReviewSystem:
         if not pending:
             return "No content pending review."
         
-        email_content = "📋 **Content Pending Review**\\n\\n"
+        email_parts = ["📋 **Content Pending Review**\\n\\n"]
         
         for item in pending:
-            email_content += f"**ID:** {item.id}\\n"
-            email_content += f"**Type:** {item.content_type.value}\\n"
-            email_content += f"**Content:** {item.text}\\n"
+            email_parts.append(f"**ID:** {item.id}\\n")
+            email_parts.append(f"**Type:** {item.content_type.value}\\n")
+            email_parts.append(f"**Content:** {item.text}\\n")
             
             if item.context:
-                email_content += f"**Context:** {item.context[:100]}...\\n"
+                email_parts.append(f"**Context:** {item.context[:100]}...\\n")
             
-            email_content += f"**Scores:** Voice={item.voice_alignment_score:.2f}, Growth={item.follower_growth_potential:.2f}\\n"
-            email_content += f"**Created:** {datetime.fromtimestamp(item.created_at).strftime('%H:%M')}\\n"
-            email_content += "---\\n\\n"
+            email_parts.append(f"**Scores:** Voice={item.voice_alignment_score:.2f}, Growth={item.follower_growth_potential:.2f}\\n")
+            email_parts.append(f"**Created:** {datetime.fromtimestamp(item.created_at).strftime('%H:%M')}\\n")
+            email_parts.append("---\\n\\n")
         
-        return email_content
\ No newline at end of file
+        return "".join(email_parts)
\ No newline at end of file
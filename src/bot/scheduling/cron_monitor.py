@@ -4,16 +4,29 @@ Continuous monitoring with intelligent email alerts for AI x blockchain opportun
 """
 
 import asyncio
+import functools
+import hashlib
+import heapq
+import html
 import smtplib
-import json
 import random
+import re
+import threading
+import time
+import urllib.parse
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from itertools import chain
+from types import SimpleNamespace
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 import structlog
+import orjson
 import os
 
 # Import enhanced logging and feedback tracking
@@ -26,7 +39,804 @@ SYSTEM_VERSION = "v2.1-sprotogremlin"  # Feature branch: authentic voice improve
 
 logger = get_monitoring_logger()
 
-@dataclass
+# Max concurrent X API fetches (accounts or keywords) within one cycle
+FETCH_CONCURRENCY = 5
+
+# Max concurrent Claude content generations when processing a batch
+CLAUDE_CONCURRENCY = 5
+
+# Keyword searches allowed per minute, matching the X API search tier
+SEARCH_RATE_PER_MINUTE = 30
+
+# Time sensitivity categories: score cut-offs (inclusive) and suggested response windows
+_SENSITIVITY_THRESHOLDS = (0.4, 0.6, 0.8)
+_SENSITIVITY_CATEGORIES = ('digest', 'within_day', 'within_hour', 'immediate')
+_RESPONSE_TIMEFRAMES = {
+    'immediate': '30 minutes',
+    'within_hour': '1 hour',
+    'within_day': '4 hours',
+    'digest': '24 hours'
+}
+
+# Processed opportunity IDs kept for duplicate detection, oldest evicted first
+_MAX_PROCESSED_IDS = 10000
+_MAX_ALERT_HISTORY = 1000
+
+# Alerts queued within this window share one SMTP session, up to the batch cap
+_EMAIL_BATCH_WAIT_SECONDS = 0.05
+_EMAIL_BATCH_MAX = 32
+
+# How long the background writer waits to coalesce saves into one write
+_SAVE_BATCH_SECONDS = 0.1
+
+# Lexical scoring vocabulary for the basic (non-Claude) analysis path
+_AI_TERMS = frozenset({'ai', 'machine learning', 'ml', 'neural', 'algorithm', 'intelligent', 'autonomous', 'predictive'})
+_BLOCKCHAIN_TERMS = frozenset({'blockchain', 'crypto', 'defi', 'uniswap', 'ethereum', 'protocol', 'smart contract'})
+_TECHNICAL_TERMS = frozenset({'implementation', 'architecture', 'optimization', 'performance', 'framework'})
+_INNOVATION_TERMS = frozenset({'new', 'breakthrough', 'revolutionary'})
+_TIME_SENSITIVE_TERMS = frozenset({'breaking', 'just', 'announced'})
+
+# Basic-analysis score below which tweets that don't contain their search keyword skip
+# Claude. The lexical score is a fraction of each vocabulary bucket, so this needs
+# roughly two distinct term hits
+_CLAUDE_PREFILTER_SCORE = 0.1
+
+# Single term -> category lookup so text is scanned once for every bucket
+_TERM_CATEGORIES = {
+    term: category
+    for category, terms in (
+        ('ai', _AI_TERMS),
+        ('blockchain', _BLOCKCHAIN_TERMS),
+        ('technical', _TECHNICAL_TERMS),
+        ('innovation', _INNOVATION_TERMS),
+        ('time_sensitive', _TIME_SENSITIVE_TERMS),
+    )
+    for term in terms
+}
+
+# Matches every term as a substring, like `term in text` ("smart contracts", "blockchains").
+# The lookahead finds overlapping hits; no term is a prefix of another, so at most one
+# term can start at any position and none is shadowed
+_TERM_RE = re.compile('(?=(' + '|'.join(map(re.escape, _TERM_CATEGORIES)) + '))')
+
+# Claude prompt for keyword-search analysis, filled with str.format per tweet
+_ANALYSIS_PROMPT_TEMPLATE = """
+Analyze this tweet found via keyword search for '{keyword}' for AI x blockchain engagement opportunities:
+
+Tweet: "{text}"
+
+Provide analysis focusing on:
+1. AI x blockchain convergence relevance (0-1)
+2. Technical depth and complexity (0-1)
+3. Innovation and forward-thinking content (0-1)
+4. Engagement opportunity potential (0-1)
+5. Time sensitivity for response (0-1)
+
+Return JSON:
+{{
+    "ai_blockchain_relevance": 0.0-1.0,
+    "technical_depth": 0.0-1.0,
+    "innovation_score": 0.0-1.0,
+    "engagement_opportunity": 0.0-1.0,
+    "time_sensitivity": 0.0-1.0,
+    "content_themes": ["theme1", "theme2"],
+    "opportunity_type": "technical_discussion|breakthrough_announcement|collaboration|educational",
+    "strategic_value": "high|medium|low",
+    "suggested_approach": "technical_insight|question|collaboration|educational_support"
+}}
+"""
+
+# Static reply voice and output schema, sent as the cached system prompt; kept byte-identical across calls
+VOICE_GUIDELINES_STATIC = """
+Voice Guidelines - SingleDivorcedDad Sprotogremlin:
+- 42-year-old single dad with sprotogremlin energy
+- Chaotic but knowledgeable - crypto expertise expressed casually
+- Dad wisdom mixed with degen gremlin vibes
+- Technical knowledge but not corporate or formal
+- Slightly unhinged but endearing energy
+- NO buzzwords, NO "alpha", NO press release language
+- NEVER use hashtags or emojis
+
+Generate a reply that:
+1. Sounds like a real person, not a crypto influencer
+2. Adds genuine insight but in gremlin language
+3. Shows technical knowledge casually, not formally
+4. Stays under 280 characters
+5. Has authentic dad/gremlin personality
+6. NO corporate speak or marketing language
+
+AI x blockchain technical authority voice:
+- Conversational and approachable - use "chat" for addressing readers
+- Forward-thinking innovation expert - relaxed crypto-native language
+- Educational but confident - no corporate fluff or rigid tone
+- NEVER use hashtags - clean text only
+- Always use lowercase "v4" for Uniswap v4
+- Use "Uniswap community/ecosystem/foundation/labs" not just "Uniswap"
+- Relaxed, authentic voice - less formal, more natural
+
+Respond with JSON only:
+{"primary_reply":"str<=280","reasoning":"str","alternatives":["str","str"],"engagement_prediction":0.0,"voice_alignment":0.0}
+"""
+_REPLY_TARGET_TOPICS = ["ai blockchain", "autonomous trading", "uniswap v4"]
+
+# Keyword strategies with cumulative weights: focused 30% (core AI x blockchain),
+# narrative 25% (current narratives), mixed 35% (organic, most realistic), broad 10%
+_KEYWORD_STRATEGIES = ("focused", "narrative", "mixed", "broad")
+_KEYWORD_STRATEGY_CUM_WEIGHTS = (0.3, 0.55, 0.9, 1.0)
+
+# Predefined narrative sets rotated by _update_trending_narratives; copied before mood terms are appended
+_NARRATIVE_SETS = (
+    {
+        "primary": ("v4 hooks", "autonomous agents", "mev protection"),
+        "secondary": ("restaking yields", "modular defi", "cross-chain"),
+        "emerging": ("intents", "account abstraction", "zk coprocessors")
+    },
+    {
+        "primary": ("ai trading bots", "on-chain ai", "predictive routing"),
+        "secondary": ("real yield", "ve tokenomics", "liquidity wars"),
+        "emerging": ("based rollups", "preconfirmations", "blob markets")
+    },
+    {
+        "primary": ("unichain launch", "hook marketplace", "concentrated liquidity"),
+        "secondary": ("stablecoin yields", "delta neutral", "perp dexes"),
+        "emerging": ("social trading", "copy trading", "prediction markets")
+    }
+)
+_MARKET_MOODS = ("bullish", "crabbing", "accumulating", "rotating")
+# (primary, secondary) narratives added for moods that have them
+_MOOD_NARRATIVES = {
+    "bullish": ("moonshot plays", "leverage farming"),
+    "accumulating": ("value plays", "stable farming"),
+}
+
+# Per-tweet user turn; the voice rules and schema travel separately in VOICE_GUIDELINES_STATIC
+_REPLY_PROMPT_TEMPLATE = """
+Generate a strategic reply for this AI x blockchain opportunity:
+Original Content: "{text}"
+Account: @{username} (Tier {tier})
+Opportunity Type: {opportunity_type}
+Suggested Approach: {approach}
+"""
+
+# Original-content prompts; static, so built once rather than per generation
+_TRENDING_CONTENT_PROMPT = """
+                Generate an authentic tweet as a SingleDivorcedDad sprotogremlin who works in crypto.
+                
+                Voice characteristics:
+                - Sprotogremlin energy: slightly chaotic, degen, but knowledgeable
+                - 42-year-old single dad wisdom mixed with crypto gremlin vibes
+                - Technical knowledge but expressed casually, not like a press release
+                - Slightly unhinged but endearing dad energy
+                - NO corporate speak, NO buzzwords, NO "alpha opportunities"
+                
+                Topics to choose from:
+                - Dad life meets crypto chaos
+                - Random crypto observations while doing dad stuff
+                - Slightly technical takes but in gremlin language
+                - Life lessons applied to defi/crypto
+                - Overemployed dad managing crypto and kids
+                
+                Style:
+                - Conversational and relatable
+                - No hashtags, no emojis
+                - Max 280 characters
+                - Sound like a real person, not a bot
+                
+                Return only the tweet text, no additional formatting.
+                """
+
+_UNHINGED_CONTENT_PROMPT = """
+                Generate a slightly unhinged sprotogremlin take as a SingleDivorcedDad who works in crypto.
+                
+                Voice: Chaotic gremlin energy with dad wisdom
+                Style: Slightly unhinged but endearing, no corporate speak
+                Length: Max 280 characters
+                
+                Examples of authentic gremlin energy:
+                - Random observations that are oddly insightful
+                - Dad analogies applied to crypto in weird ways
+                - Slightly chaotic takes that somehow make sense
+                - Overemployed dad managing too many things at once
+                
+                DO NOT use:
+                - "Hot take:" or "Unpopular opinion:"
+                - Technical jargon without context
+                - Buzzwords like "alpha" or "ecosystem"
+                - Anything that sounds like marketing
+                
+                Sound like a real person having a random thought, not a crypto influencer.
+                Return only the tweet text.
+                """
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Numeric status ID in a tweet URL; test and profile URLs don't match
+_TWEET_ID_RE = re.compile(r"/status/(\d+)(?:[/?#]|$)")
+
+# Generated replies are reused for tweets whose normalized text matches within the TTL
+_REPLY_CACHE_TTL_SECONDS = 3600
+_REPLY_CACHE_MAX_ENTRIES = 1000
+_GENERATED_REPLY_FIELDS = (
+    'generated_reply', 'reply_reasoning', 'alternative_responses',
+    'engagement_prediction', 'voice_alignment_score'
+)
+_RETWEET_NOISE_RE = re.compile(r"^rt\s+@\w+:|https?://\S+|@\w+")
+
+
+def _mentions_keyword(keyword: str, text: str) -> bool:
+    """Whether the searched keyword phrase appears in the text, ignoring case and punctuation"""
+    phrase = ' '.join(_WORD_RE.findall(keyword.lower()))
+    return bool(phrase) and phrase in ' '.join(_WORD_RE.findall(text.lower()))
+
+
+def _match_terms(text: str) -> Dict[str, set]:
+    """Scan the text once, bucketing vocabulary hits by category"""
+    hits = defaultdict(set)
+    for term in _TERM_RE.findall(text):
+        hits[_TERM_CATEGORIES[term]].add(term)
+    return hits
+
+
+@functools.lru_cache(maxsize=128)
+def _pretty_label(value: str) -> str:
+    """Display form of snake_case identifiers; the set of types and sensitivities is small and fixed"""
+    return value.replace('_', ' ').title()
+
+
+def _reply_cache_key(opportunity) -> str:
+    """Opportunity type plus tweet text stripped of RT prefixes, links, mentions and punctuation"""
+    text = _RETWEET_NOISE_RE.sub(' ', opportunity.content_text.lower())
+    return f"{opportunity.opportunity_type}:{' '.join(_WORD_RE.findall(text))}"
+
+
+def _parse_reply_data(content: str) -> Dict:
+    """Decode Claude's reply JSON and coerce each field to the type the alert expects"""
+    data = orjson.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("Reply JSON is not an object")
+    
+    alternatives = data.get('alternatives') or []
+    if not isinstance(alternatives, list):
+        raise ValueError("Reply alternatives is not a list")
+    
+    return {
+        'primary_reply': str(data.get('primary_reply', 'Generated response unavailable')),
+        'reasoning': str(data.get('reasoning', 'AI-generated strategic response')),
+        'alternatives': [str(alt) for alt in alternatives],
+        'engagement_prediction': float(data.get('engagement_prediction', 0.7)),
+        'voice_alignment': float(data.get('voice_alignment', 0.8)),
+    }
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} block in text, scanning once and skipping string contents"""
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+class _AsyncLimiter:
+    """Leaky-bucket limiter that spaces entries evenly across a time period"""
+    
+    def __init__(self, max_rate: int, time_period: float = 60):
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+    
+    async def __aenter__(self):
+        # Reserve the next free slot; callers only wait for what's left of the interval
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# HTML building blocks for _generate_alert_html, filled with str.format. Every
+# interpolated value that comes from a tweet or Claude is html-escaped first
+_ALERT_ALTERNATIVE_HTML = """
+                    <div style="background: #f0f0f0; padding: 8px; margin: 5px 0; border-radius: 4px; border-left: 3px solid #3498db;">
+                        <strong>Alternative {number}:</strong> {text}<br>
+                        <a href="{reply_url}" style="font-size: 12px; color: #3498db; text-decoration: none;">📝 Use This Reply</a>
+                    </div>
+"""
+
+_ALERT_REASONING_HTML = '<div style="font-size: 12px; color: #666; margin-top: 8px;"><strong>Reasoning:</strong> {reasoning}</div>'
+
+_ALERT_ALTERNATIVES_SECTION_HTML = '<div style="margin: 15px 0;"><strong style="color: #8e44ad;">🔄 Alternative Responses:</strong>{alternatives_html}</div>'
+
+_ALERT_LIKE_LINK_HTML = ' | <a href="https://twitter.com/intent/like?tweet_id={tweet_id}" style="color: #3498db; text-decoration: none; margin: 0 10px;">❤️ Like</a>'
+
+_ALERT_OPPORTUNITY_HTML = """
+            <div style="border: 1px solid #ddd; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fafafa;">
+                <h3 style="color: #2c3e50; margin-top: 0; border-bottom: 2px solid #3498db; padding-bottom: 8px;">
+                    {emoji} Opportunity {i}: @{account_username}
+                </h3>
+                
+                <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #3498db;">
+                    <strong style="color: #2c3e50;">Original Content:</strong><br>
+                    <em>"{content_excerpt}"</em>
+                </div>
+                
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin: 15px 0; background: #f8f9fa; padding: 12px; border-radius: 6px;">
+                    <div><strong>Overall Score:</strong> <span style="color: {engagement_color};">{overall_score:.2f}</span></div>
+                    <div><strong>AI x Blockchain:</strong> <span style="color: #8e44ad;">{ai_blockchain_relevance:.2f}</span></div>
+                    <div><strong>Technical Depth:</strong> <span style="color: #d35400;">{technical_depth:.2f}</span></div>
+                </div>
+                
+                <div style="margin: 15px 0; background: #fff; padding: 12px; border-radius: 6px;">
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
+                        <div><strong>Opportunity Type:</strong> {opportunity_type_label}</div>
+                        <div><strong>Time Sensitivity:</strong> {time_sensitivity_label}</div>
+                    </div>
+                </div>
+                
+                <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #27ae60;">
+                    <strong style="color: #27ae60;">🤖 AI-Generated Response:</strong><br>
+                    <div style="background: #fff; padding: 12px; margin: 8px 0; border-radius: 6px; font-style: italic; border: 1px solid #ddd;">
+                        "{generated_reply}"
+                    </div>
+                    
+                    {reasoning_html}
+                    
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 10px; font-size: 12px;">
+                        <div>📈 <strong>Engagement Prediction:</strong> <span style="color: {engagement_color};">{engagement_prediction:.0%}</span></div>
+                        <div>🎭 <strong>Voice Alignment:</strong> <span style="color: {voice_color};">{voice_alignment_score:.0%}</span></div>
+                    </div>
+                </div>
+                
+                {alternatives_section_html}
+                
+                <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #ffc107;">
+                    <strong style="color: #856404;">📋 Strategic Context:</strong><br>
+                    {strategic_context}<br>
+                    <strong style="color: #856404;">💡 Recommended Action:</strong> {suggested_response}
+                </div>
+                
+                <div style="margin: 20px 0; text-align: center;">
+                    <a href="{content_url}" 
+                       style="background: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        🔗 View Original Tweet
+                    </a>
+                    
+                    <a href="{reply_url}" 
+                       style="background: #27ae60; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        💬 Reply with Generated Content
+                    </a>
+                    
+                    <a href="{quote_url}" 
+                       style="background: #e67e22; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        🔄 Quote Tweet
+                    </a>
+                </div>
+                
+                {feedback_html}
+                
+                <div style="text-align: center; margin-top: 15px; padding: 10px; background: #ecf0f1; border-radius: 6px; font-size: 12px; color: #7f8c8d;">
+                    <strong>Quick Actions:</strong> 
+                    <a href="https://twitter.com/{account_username}" style="color: #3498db; text-decoration: none; margin: 0 10px;">👤 View Profile</a> | 
+                    <a href="https://twitter.com/intent/follow?screen_name={account_username}" style="color: #3498db; text-decoration: none; margin: 0 10px;">➕ Follow</a>
+                    {like_link_html}
+                </div>
+            </div>
+"""
+
+# Feedback buttons as (feedback key, background, text colour, label); the anchors are
+# expanded into {<key>_url} placeholders once at import, so rendering stays one format call
+_FEEDBACK_BUTTON_HTML = """
+                            <a href="{{{key}_url}}" 
+                               style="background: {background}; color: {color}; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
+                                {label}
+                            </a>"""
+_QUALITY_BUTTONS = (
+    ('excellent', '#28a745', 'white', '⭐⭐⭐⭐⭐ Excellent'),
+    ('good', '#20c997', 'white', '⭐⭐⭐⭐ Good'),
+    ('okay', '#ffc107', 'black', '⭐⭐⭐ Okay'),
+    ('poor', '#fd7e14', 'white', '⭐⭐ Poor'),
+    ('bad', '#dc3545', 'white', '⭐ Bad'),
+)
+_REPLY_USAGE_BUTTONS = (
+    ('used_primary', '#007bff', 'white', '🎯 Used Primary Reply'),
+    ('used_alt1', '#6f42c1', 'white', '🔄 Used Alternative 1'),
+    ('used_alt2', '#e83e8c', 'white', '🔄 Used Alternative 2'),
+    ('used_custom', '#17a2b8', 'white', '✏️ Used Custom Reply'),
+    ('not_used', '#6c757d', 'white', "❌ Didn't Use"),
+)
+_CONTENT_USAGE_BUTTONS = (
+    ('used', '#007bff', 'white', '✅ Posted This Content'),
+    ('not_used', '#6c757d', 'white', "❌ Didn't Post"),
+)
+
+
+def _feedback_buttons_html(buttons) -> str:
+    """Template fragment with one anchor per (key, background, color, label) button"""
+    return "".join(
+        _FEEDBACK_BUTTON_HTML.format(key=key, background=background, color=color, label=label)
+        for key, background, color, label in buttons
+    ) + "\n"
+
+
+# The quality-rating buttons are shared by the opportunity and original-content feedback sections
+_QUALITY_RATING_LINKS_HTML = _feedback_buttons_html(_QUALITY_BUTTONS)
+
+_ALERT_FEEDBACK_HTML = """
+                <!-- Feedback Section -->
+                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #6c757d;">
+                    <strong style="color: #495057;">📊 Feedback & Learning</strong><br>
+                    <div style="margin: 10px 0; font-size: 12px; color: #6c757d;">
+                        Help improve voice evolution by rating this opportunity and tracking reply usage:
+                    </div>
+                    
+                    <!-- Quality Rating Buttons -->
+                    <div style="margin: 8px 0;">
+                        <strong style="font-size: 12px; color: #495057;">Opportunity Quality:</strong><br>
+                        <div style="margin: 5px 0;">""" + _QUALITY_RATING_LINKS_HTML + """                        </div>
+                    </div>
+                    
+                    <!-- Reply Usage Tracking -->
+                    <div style="margin: 8px 0;">
+                        <strong style="font-size: 12px; color: #495057;">Reply Usage (click after posting):</strong><br>
+                        <div style="margin: 5px 0;">""" + _feedback_buttons_html(_REPLY_USAGE_BUTTONS) + """                        </div>
+                    </div>
+                    
+                    <div style="font-size: 10px; color: #868e96; margin-top: 8px;">
+                        Feedback ID: {feedback_id} | This data helps evolve voice and content quality over time
+                    </div>
+                </div>
+"""
+
+_ALERT_DOCUMENT_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>AI x Blockchain KOL Opportunities</title>
+        </head>
+        <body style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
+            <div style="background: #007bff; color: white; padding: 8px 15px; border-radius: 5px; margin-bottom: 20px; text-align: center; font-weight: bold;">
+                🤖 System Version: {system_version} (Feature Branch - Authentic Voice)
+            </div>
+            
+            <h1 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
+                {alert_type}
+            </h1>
+            
+            <p style="background: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107;">
+                <strong>Alert Generated:</strong> {generated_at}<br>
+                <strong>Description:</strong> {description}
+            </p>
+            
+            <h2 style="color: #2c3e50;">Opportunities Identified:</h2>
+            
+            {opportunities_html}
+            
+            <div style="margin-top: 30px; padding: 15px; background: #f8f9fa; border-radius: 5px;">
+                <h3 style="color: #2c3e50; margin-top: 0;">Next Steps:</h3>
+                <ol>
+                    <li>Review each opportunity for strategic alignment</li>
+                    <li>Prioritize based on account tier and overall score</li>
+                    <li>Craft responses that demonstrate technical expertise</li>
+                    <li>Engage within recommended timeframes</li>
+                    <li>Track engagement outcomes for optimization</li>
+                </ol>
+            </div>
+            
+            <div style="margin-top: 20px; padding: 15px; background: #e8f5e8; border-radius: 5px; text-align: center;">
+                <p style="margin: 0;"><strong>AI x Blockchain KOL Development Platform</strong><br>
+                Automated monitoring and opportunity detection system</p>
+            </div>
+        </body>
+        </html>
+"""
+
+# Building blocks for _generate_detailed_alert_with_original_html; opportunity cards
+# take the same fields as _ALERT_OPPORTUNITY_HTML
+_DETAILED_OPPORTUNITY_HTML = """
+            <div style="border: 1px solid #ddd; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fafafa;">
+                <h3 style="color: #2c3e50; margin-top: 0; border-bottom: 2px solid #3498db; padding-bottom: 8px;">
+                    {emoji} Opportunity {i}: @{account_username}
+                </h3>
+                
+                <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #3498db;">
+                    <strong style="color: #2c3e50;">Original Content:</strong><br>
+                    <em>"{content_excerpt}"</em>
+                </div>
+                
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin: 15px 0; background: #f8f9fa; padding: 12px; border-radius: 6px;">
+                    <div><strong>Overall Score:</strong> <span style="color: {engagement_color};">{overall_score:.2f}</span></div>
+                    <div><strong>AI x Blockchain:</strong> <span style="color: #8e44ad;">{ai_blockchain_relevance:.2f}</span></div>
+                    <div><strong>Technical Depth:</strong> <span style="color: #d35400;">{technical_depth:.2f}</span></div>
+                </div>
+                
+                <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #27ae60;">
+                    <strong style="color: #27ae60;">🤖 AI-Generated Response:</strong><br>
+                    <div style="background: #fff; padding: 12px; margin: 8px 0; border-radius: 6px; font-style: italic; border: 1px solid #ddd;">
+                        "{generated_reply}"
+                    </div>
+                    
+                    {reasoning_html}
+                    
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 10px; font-size: 12px;">
+                        <div>📈 <strong>Engagement Prediction:</strong> <span style="color: {engagement_color};">{engagement_prediction:.0%}</span></div>
+                        <div>🎭 <strong>Voice Alignment:</strong> <span style="color: {voice_color};">{voice_alignment_score:.0%}</span></div>
+                    </div>
+                </div>
+                
+                {alternatives_section_html}
+                
+                <div style="margin: 20px 0; text-align: center;">
+                    <a href="{content_url}" 
+                       style="background: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        🔗 View Original Tweet
+                    </a>
+                    
+                    <a href="{reply_url}" 
+                       style="background: #27ae60; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        💬 Reply with Generated Content
+                    </a>
+                    
+                    <a href="{quote_url}" 
+                       style="background: #e67e22; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                        🔄 Quote Tweet
+                    </a>
+                </div>
+                
+                {feedback_html}
+            </div>
+"""
+
+_ORIGINAL_ENGAGEMENT_BAIT_HTML = '<div style="font-size: 12px; color: #666;"><strong>Engagement Bait:</strong> {engagement_bait}</div>'
+
+_ORIGINAL_CONTENT_HTML = """
+        <div style="border: 2px solid #e74c3c; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fff5f5;">
+            <h3 style="color: #e74c3c; margin-top: 0; border-bottom: 2px solid #e74c3c; padding-bottom: 8px;">
+                🚀 Original Content ({content_type_label})
+            </h3>
+            
+            <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #e74c3c;">
+                <strong style="color: #2c3e50;">Generated Content:</strong><br>
+                <div style="font-weight: bold; font-size: 16px; font-style: italic; margin: 10px 0; padding: 12px; background: #f8f9fa; border-radius: 6px;">
+                    "{content}"
+                </div>
+                {engagement_bait_html}
+            </div>
+            
+            <div style="margin: 20px 0; text-align: center;">
+                <a href="{post_url}" 
+                   style="background: #e74c3c; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
+                    📤 Post This Content
+                </a>
+            </div>
+            
+            <!-- Original Content Feedback Section -->
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #6c757d;">
+                <strong style="color: #495057;">📊 Original Content Feedback</strong><br>
+                <div style="margin: 10px 0; font-size: 12px; color: #6c757d;">
+                    Rate the quality of this generated content:
+                </div>
+                
+                <!-- Quality Rating Buttons -->
+                <div style="margin: 8px 0;">
+                    <strong style="font-size: 12px; color: #495057;">Content Quality:</strong><br>
+                    <div style="margin: 5px 0;">""" + _QUALITY_RATING_LINKS_HTML + """                    </div>
+                </div>
+                
+                <!-- Usage Tracking -->
+                <div style="margin: 8px 0;">
+                    <strong style="font-size: 12px; color: #495057;">Usage (click after posting):</strong><br>
+                    <div style="margin: 5px 0;">""" + _feedback_buttons_html(_CONTENT_USAGE_BUTTONS) + """                    </div>
+                </div>
+                
+                <div style="font-size: 10px; color: #868e96; margin-top: 8px;">
+                    Content ID: {content_id} | This feedback helps improve original content generation
+                </div>
+            </div>
+        </div>
+"""
+
+_DETAILED_OPPORTUNITIES_SECTION_HTML = '<h2 style="color: #2c3e50;">High-Priority Opportunities:</h2>{opportunities_html}'
+
+_DETAILED_REVIEW_STEP_HTML = '<li>Review and engage with priority opportunities above</li>'
+
+_DETAILED_DOCUMENT_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>AI x Blockchain Opportunities + Original Content</title>
+        </head>
+        <body style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
+            <div style="background: #007bff; color: white; padding: 8px 15px; border-radius: 5px; margin-bottom: 20px; text-align: center; font-weight: bold;">
+                🤖 System Version: {system_version} (Feature Branch - Authentic Voice)
+            </div>
+            
+            <h1 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
+                🎯 AI x Blockchain Opportunities + Original Content
+            </h1>
+            
+            <p style="background: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107;">
+                <strong>Alert Generated:</strong> {generated_at}<br>
+                <strong>Content Mix:</strong> {opportunity_count} opportunities + 1 {content_type_text}
+            </p>
+            
+            {opportunities_section_html}
+            
+            <h2 style="color: #e74c3c;">Original Content for Engagement:</h2>
+            {original_html}
+            
+            <div style="margin-top: 30px; padding: 15px; background: #f8f9fa; border-radius: 5px;">
+                <h3 style="color: #2c3e50; margin-top: 0;">Next Steps:</h3>
+                <ol>
+                    {review_step_html}
+                    <li>Consider posting the original content for engagement</li>
+                    <li>Use feedback buttons to help improve AI content quality</li>
+                    <li>Track which content performs best for voice evolution</li>
+                </ol>
+            </div>
+            
+            <div style="margin-top: 20px; padding: 15px; background: #e8f5e8; border-radius: 5px; text-align: center;">
+                <p style="margin: 0;"><strong>AI x Blockchain KOL Development Platform</strong><br>
+                Detailed monitoring with feedback-driven voice evolution</p>
+            </div>
+        </body>
+        </html>
+"""
+
+# Red / amber / green for engagement and voice predictions, split at inclusive cut-offs
+_PREDICTION_COLORS = ('#e74c3c', '#f39c12', '#27ae60')
+_ENGAGEMENT_COLOR_BINS = (0.5, 0.7)
+_VOICE_COLOR_BINS = (0.6, 0.8)
+
+# Card heading emoji by overall score, same inclusive cut-offs as the colours
+_SCORE_EMOJIS = ('📊', '⚡', '🔥')
+_SCORE_EMOJI_BINS = (0.6, 0.8)
+
+# (feedback_urls key, template field) pairs, so rendering never rebuilds the field names
+_FEEDBACK_URL_FIELDS = tuple(
+    (key, f"{key}_url") for key, *_ in chain(_QUALITY_BUTTONS, _REPLY_USAGE_BUTTONS)
+)
+_ORIGINAL_FEEDBACK_URL_FIELDS = tuple(
+    (key, f"{key}_url") for key, *_ in chain(_QUALITY_BUTTONS, _CONTENT_USAGE_BUTTONS)
+)
+
+
+# Twitter web-intent URL patterns; every argument is passed in already quoted
+_REPLY_INTENT_URL = "https://twitter.com/intent/tweet?in_reply_to={tweet_id}&text={text}"
+_QUOTE_INTENT_URL = "https://twitter.com/intent/tweet?url={url}&text={text}"
+_COMPOSE_INTENT_URL = "https://twitter.com/intent/tweet?text={text}"
+
+
+def _reply_intent_url(tweet_id: Optional[str], mention_q: str, text_q: str) -> str:
+    """Compose URL replying to the tweet, or mentioning its author when there's no real tweet ID (quoted args)"""
+    if tweet_id:
+        return _REPLY_INTENT_URL.format(tweet_id=tweet_id, text=text_q)
+    return _COMPOSE_INTENT_URL.format(text=mention_q + text_q)
+
+
+def _quote_intent_url(tweet_id: Optional[str], content_url_q: str, text_q: str) -> str:
+    """Compose URL quoting the tweet, or a plain compose when there's no real tweet ID (quoted args)"""
+    if tweet_id:
+        return _QUOTE_INTENT_URL.format(url=content_url_q, text=text_q)
+    return _COMPOSE_INTENT_URL.format(text=text_q)
+
+
+def _opportunity_template_fields(i: int, opp) -> Dict:
+    """Escaped fields for _ALERT_OPPORTUNITY_HTML / _DETAILED_OPPORTUNITY_HTML; str.format ignores the extras"""
+    # Generate enhanced tweet URLs - handle both real and test URLs
+    match = _TWEET_ID_RE.search(opp.content_url)
+    tweet_id = match.group(1) if match else None
+    
+    # Quote each piece once and reuse it across every intent URL; the mention prefix is
+    # only used without a tweet ID and the quoted tweet URL only with one
+    reply_q = urllib.parse.quote(str(opp.generated_reply or ''))
+    mention_q = '' if tweet_id else urllib.parse.quote(f"@{opp.account_username} ")
+    content_url_q = urllib.parse.quote(opp.content_url, safe='') if tweet_id else ''
+    reply_url = _reply_intent_url(tweet_id, mention_q, reply_q)
+    quote_url = _quote_intent_url(tweet_id, content_url_q, reply_q)
+    
+    # Format alternative responses
+    alternatives_html = "".join(
+        _ALERT_ALTERNATIVE_HTML.format(
+            number=j,
+            text=html.escape(str(alt)),
+            reply_url=html.escape(_reply_intent_url(tweet_id, mention_q, urllib.parse.quote(str(alt))))
+        )
+        for j, alt in enumerate((opp.alternative_responses or [])[:2], 1)
+    )
+    
+    # Feedback URLs for this opportunity
+    feedback_urls = opp.feedback_urls or {}
+    get_url = feedback_urls.get
+    feedback_html = _ALERT_FEEDBACK_HTML.format(
+        feedback_id=html.escape(opp.feedback_id or 'N/A'),
+        **{field: html.escape(get_url(key, '#')) for key, field in _FEEDBACK_URL_FIELDS}
+    )
+    
+    # Only slice (and copy) tweets that actually exceed the excerpt length
+    excerpt = opp.content_text
+    if len(excerpt) > 300:
+        excerpt = excerpt[:300] + '...'
+    
+    return {
+        'emoji': _SCORE_EMOJIS[bisect_right(_SCORE_EMOJI_BINS, opp.overall_score)],
+        'i': i,
+        'account_username': html.escape(opp.account_username),
+        'content_excerpt': html.escape(excerpt),
+        # Performance prediction indicators
+        'engagement_color': _PREDICTION_COLORS[bisect_right(_ENGAGEMENT_COLOR_BINS, opp.engagement_prediction or 0.0)],
+        'voice_color': _PREDICTION_COLORS[bisect_right(_VOICE_COLOR_BINS, opp.voice_alignment_score or 0.0)],
+        'overall_score': opp.overall_score,
+        'ai_blockchain_relevance': opp.ai_blockchain_relevance,
+        'technical_depth': opp.technical_depth,
+        'opportunity_type_label': html.escape(_pretty_label(opp.opportunity_type)),
+        'time_sensitivity_label': html.escape(_pretty_label(opp.time_sensitivity)),
+        'generated_reply': html.escape(opp.generated_reply or 'Response generation in progress...'),
+        'reasoning_html': _ALERT_REASONING_HTML.format(reasoning=html.escape(opp.reply_reasoning)) if opp.reply_reasoning else '',
+        'engagement_prediction': opp.engagement_prediction or 0,
+        'voice_alignment_score': opp.voice_alignment_score or 0,
+        'alternatives_section_html': _ALERT_ALTERNATIVES_SECTION_HTML.format(alternatives_html=alternatives_html) if alternatives_html else '',
+        'strategic_context': html.escape(opp.strategic_context),
+        'suggested_response': html.escape(opp.suggested_response),
+        'content_url': html.escape(opp.content_url),
+        'reply_url': html.escape(reply_url),
+        'quote_url': html.escape(quote_url),
+        'feedback_html': feedback_html,
+        'like_link_html': _ALERT_LIKE_LINK_HTML.format(tweet_id=tweet_id) if tweet_id else '',
+    }
+
+
+# Everything _opportunity_template_fields reads; a card is a pure function of these
+_OPPORTUNITY_CARD_ATTRS = (
+    'account_username', 'content_text', 'content_url', 'overall_score',
+    'ai_blockchain_relevance', 'technical_depth', 'opportunity_type', 'time_sensitivity',
+    'strategic_context', 'suggested_response', 'generated_reply', 'reply_reasoning',
+    'engagement_prediction', 'voice_alignment_score', 'feedback_id',
+    'alternative_responses', 'feedback_urls'
+)
+
+
+def _render_opportunity_card(template: str, i: int, opp) -> str:
+    """Render one opportunity card, reusing the fragment when the same opportunity is rendered again"""
+    # The list and dict attributes go last, frozen so the key is hashable
+    key = tuple(getattr(opp, attr) for attr in _OPPORTUNITY_CARD_ATTRS[:-2]) + (
+        tuple(opp.alternative_responses or ()),
+        tuple(sorted((opp.feedback_urls or {}).items()))
+    )
+    return _render_opportunity_card_cached(template, i, key)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_opportunity_card_cached(template: str, i: int, key: tuple) -> str:
+    """Format a card from a frozen attribute tuple built by _render_opportunity_card"""
+    fields = dict(zip(_OPPORTUNITY_CARD_ATTRS, key))
+    fields['feedback_urls'] = dict(fields['feedback_urls'])
+    return template.format(**_opportunity_template_fields(i, SimpleNamespace(**fields)))
+
+
+@dataclass(slots=True)
 class AlertConfiguration:
     """Configuration for email alerts"""
     smtp_server: str
@@ -46,7 +856,7 @@ class AlertConfiguration:
     priority_threshold: float = 0.6
     digest_threshold: float = 0.4
 
-@dataclass
+@dataclass(slots=True)
 class AlertOpportunity:
     """Opportunity formatted for email alerts"""
     account_username: str
@@ -77,7 +887,13 @@ class AlertOpportunity:
     feedback_urls: Optional[Dict[str, str]] = None
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Shallow copy - asdict() deep-copies every field recursively
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if self.alternative_responses is not None:
+            data['alternative_responses'] = list(self.alternative_responses)
+        if self.feedback_urls is not None:
+            data['feedback_urls'] = dict(self.feedback_urls)
+        return data
 
 class CronMonitorSystem:
     """
@@ -95,14 +911,26 @@ class CronMonitorSystem:
         self.data_dir = Path("data/strategic_accounts")
         self.alerts_file = self.data_dir / "alert_history.json"
         self.processed_file = self.data_dir / "processed_opportunities.json"
+        self.user_ids_file = self.data_dir / "user_ids.json"
         
         # Alert tracking
         self.alert_history: List[Dict] = []
+        # Alerts sent over the history's lifetime; alert_history itself is trimmed to _MAX_ALERT_HISTORY
+        self._total_alerts_sent = 0
+        # Today's alert counts by type, kept up to date as alerts are recorded
+        self._alert_counts_date: Optional[str] = None
+        self._alert_counts_today: Dict[str, int] = defaultdict(int)
         self.last_digest_sent = None
+        self._last_digest_date = None  # last_digest_sent.date(), kept for the per-tick check
         self.daily_opportunities: List[AlertOpportunity] = []
         
         # Duplicate detection
-        self.processed_opportunities: set = set()
+        self.processed_opportunities: OrderedDict = OrderedDict()
+        
+        # username -> X user ID; IDs never change so lookups are cached for the process lifetime
+        self._user_id_cache: Dict[str, int] = {}
+        self._user_ids_dirty = False
+        self._user_ids_saved_at = datetime.now()
         
         # Email event logger and feedback tracker
         self.email_logger = get_email_logger()
@@ -112,8 +940,26 @@ class CronMonitorSystem:
         # Track when we last updated trending narratives
         self.last_narrative_update = datetime.now()
         
+        # Bounds parallel X API fetches so gather() doesn't burst the rate limits
+        self._fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        self._search_limiter = _AsyncLimiter(SEARCH_RATE_PER_MINUTE, 60)
+        
+        # In-flight alert deliveries (kept referenced so tasks aren't garbage collected)
+        self._background_tasks: set = set()
+        self._save_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._email_queue: asyncio.Queue = asyncio.Queue()
+        self._email_task: Optional[asyncio.Task] = None
+        # Authenticated SMTP connection reused across alerts; only touched from worker threads under the lock
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._claude_session_users = 0
+        self._claude_semaphore = asyncio.Semaphore(CLAUDE_CONCURRENCY)
+        self._reply_cache: OrderedDict = OrderedDict()
+        
         self._load_alert_history()
         self._load_processed_opportunities()
+        self._load_user_id_cache()
         
         logger.info(
             "cron_monitor_initialized",
@@ -126,10 +972,18 @@ class CronMonitorSystem:
         """Load alert history from persistent storage"""
         try:
             if self.alerts_file.exists():
-                with open(self.alerts_file, 'r') as f:
-                    self.alert_history = json.load(f)
+                with open(self.alerts_file, 'rb') as f:
+                    self.alert_history = orjson.loads(f.read())[-_MAX_ALERT_HISTORY:]
             else:
                 self.alert_history = []
+            self._total_alerts_sent = len(self.alert_history)
+            
+            # ISO timestamps start with the date, so today's alerts need no parsing
+            self._alert_counts_date = datetime.now().date().isoformat()
+            self._alert_counts_today = defaultdict(int)
+            for alert in self.alert_history:
+                if alert['timestamp'][:10] == self._alert_counts_date:
+                    self._alert_counts_today[alert['type']] += 1
             logger.info(f"Loaded {len(self.alert_history)} alert history records")
         except Exception as e:
             logger.error(f"Error loading alert history: {e}")
@@ -139,43 +993,73 @@ class CronMonitorSystem:
         """Load processed opportunities from persistent storage"""
         try:
             if self.processed_file.exists():
-                with open(self.processed_file, 'r') as f:
-                    data = json.load(f)
-                    self.processed_opportunities = set(data.get('processed_ids', []))
+                with open(self.processed_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                    processed_ids = data.get('processed_ids', [])[-_MAX_PROCESSED_IDS:]
+                    self.processed_opportunities = OrderedDict.fromkeys(processed_ids)
                     logger.info(f"Loaded {len(self.processed_opportunities)} processed opportunity IDs")
             else:
-                self.processed_opportunities = set()
+                self.processed_opportunities = OrderedDict()
                 logger.info("No processed opportunities file found, starting fresh")
         except Exception as e:
             logger.error(f"Error loading processed opportunities: {e}")
-            self.processed_opportunities = set()
+            self.processed_opportunities = OrderedDict()
+    
+    def _processed_opportunities_payload(self) -> bytes:
+        """Serialize processed opportunity IDs for persistence"""
+        data = {
+            'processed_ids': list(self.processed_opportunities),
+            'last_updated': datetime.now().isoformat()
+        }
+        return orjson.dumps(data)
+    
+    def _alert_history_payload(self) -> bytes:
+        """Serialize alert history for persistence"""
+        # _record_alert keeps the list capped, so no trimmed copy is needed here
+        return orjson.dumps(self.alert_history)
+    
+    def _write_payload(self, path: Path, payload: bytes):
+        """Write an encoded payload in a single call"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(payload)
     
     def _save_processed_opportunities(self):
         """Save processed opportunities to persistent storage"""
         try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Keep only last 10,000 entries to prevent unlimited growth
-            if len(self.processed_opportunities) > 10000:
-                self.processed_opportunities = set(list(self.processed_opportunities)[-5000:])
-            
-            data = {
-                'processed_ids': list(self.processed_opportunities),
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(self.processed_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_payload(self.processed_file, self._processed_opportunities_payload())
         except Exception as e:
             logger.error(f"Error saving processed opportunities: {e}")
     
-    def _get_opportunity_id(self, opportunity: AlertOpportunity) -> str:
+    def _load_user_id_cache(self):
+        """Load cached username -> user ID mappings from persistent storage"""
+        try:
+            if self.user_ids_file.exists():
+                with open(self.user_ids_file, 'rb') as f:
+                    self._user_id_cache = orjson.loads(f.read())
+                logger.info(f"Loaded {len(self._user_id_cache)} cached user IDs")
+        except Exception as e:
+            logger.error(f"Error loading user ID cache: {e}")
+            self._user_id_cache = {}
+    
+    def _save_user_id_cache(self):
+        """Persist the user ID cache if it changed since the last save"""
+        if not self._user_ids_dirty:
+            return
+        try:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.user_ids_file, 'wb') as f:
+                f.write(orjson.dumps(self._user_id_cache))
+            self._user_ids_dirty = False
+            self._user_ids_saved_at = datetime.now()
+        except Exception as e:
+            logger.error(f"Error saving user ID cache: {e}")
+    
+    def _get_opportunity_id(self, opportunity: AlertOpportunity, now: Optional[datetime] = None) -> str:
         """Generate unique ID for opportunity to prevent duplicates"""
-        import hashlib
-        
         # For test opportunities, use a daily key
         if opportunity.account_username == "TestAccount":
-            return f"test_opportunity_{datetime.now().strftime('%Y-%m-%d')}"
+            return f"test_opportunity_{(now or datetime.now()).strftime('%Y-%m-%d')}"
         
         # For real opportunities, try to extract tweet ID from URL
         if opportunity.content_url and "/status/" in opportunity.content_url:
@@ -187,63 +1071,178 @@ class CronMonitorSystem:
         
         # Fallback: hash content + account + hour bucket
         content_key = f"{opportunity.account_username}_{opportunity.content_text[:100]}"
-        content_hash = hashlib.md5(content_key.encode()).hexdigest()[:8]
-        hour_bucket = datetime.now().strftime('%Y%m%d_%H')
+        content_hash = hashlib.blake2b(content_key.encode(), digest_size=4).hexdigest()
+        hour_bucket = (now or datetime.now()).strftime('%Y%m%d_%H')
         return f"{content_hash}_{hour_bucket}"
     
-    def _is_opportunity_processed(self, opportunity: AlertOpportunity) -> bool:
+    def _is_opportunity_processed(self, opportunity: AlertOpportunity, now: Optional[datetime] = None) -> bool:
         """Check if opportunity has already been processed"""
-        opp_id = self._get_opportunity_id(opportunity)
+        opp_id = self._get_opportunity_id(opportunity, now)
         return opp_id in self.processed_opportunities
     
-    def _mark_opportunity_processed(self, opportunity: AlertOpportunity):
+    def _mark_opportunity_processed(self, opportunity: AlertOpportunity, now: Optional[datetime] = None):
         """Mark opportunity as processed to prevent duplicates"""
-        opp_id = self._get_opportunity_id(opportunity)
-        self.processed_opportunities.add(opp_id)
-        self._save_processed_opportunities()
+        opp_id = self._get_opportunity_id(opportunity, now)
+        self.processed_opportunities[opp_id] = None
+        self.processed_opportunities.move_to_end(opp_id)
+        
+        # Evict oldest IDs first to prevent unlimited growth
+        while len(self.processed_opportunities) > _MAX_PROCESSED_IDS:
+            self.processed_opportunities.popitem(last=False)
+        self._request_save('processed')
         logger.debug(f"Marked opportunity as processed: {opp_id}")
     
     def _save_alert_history(self):
         """Save alert history to persistent storage"""
         try:
-            # Keep only last 1000 alerts
-            recent_alerts = self.alert_history[-1000:]
-            with open(self.alerts_file, 'w') as f:
-                json.dump(recent_alerts, f, indent=2)
+            self._write_payload(self.alerts_file, self._alert_history_payload())
         except Exception as e:
             logger.error(f"Error saving alert history: {e}")
     
+    def _request_save(self, kind: str):
+        """Hand a save to the background writer, or save inline when it isn't running"""
+        if self._writer_task is not None and not self._writer_task.done():
+            self._save_queue.put_nowait(kind)
+        elif kind == 'processed':
+            self._save_processed_opportunities()
+        else:
+            self._save_alert_history()
+    
+    async def _writer_loop(self):
+        """Drain queued saves off the event loop, coalescing bursts into one write per file"""
+        while True:
+            kinds = {await self._save_queue.get()}
+            await asyncio.sleep(_SAVE_BATCH_SECONDS)
+            while not self._save_queue.empty():
+                kinds.add(self._save_queue.get_nowait())
+            
+            # None is the shutdown sentinel: write this batch, then stop
+            stopping = None in kinds
+            kinds.discard(None)
+            
+            for kind in kinds:
+                try:
+                    # Encode on the loop so the thread never sees a structure mid-mutation
+                    if kind == 'processed':
+                        path, payload = self.processed_file, self._processed_opportunities_payload()
+                    else:
+                        path, payload = self.alerts_file, self._alert_history_payload()
+                    await asyncio.to_thread(self._write_payload, path, payload)
+                except Exception as e:
+                    logger.error(f"Error writing {kind} data: {e}")
+            
+            if stopping:
+                return
+    
     async def start_continuous_monitoring(self):
         """Start continuous monitoring with cron-like scheduling"""
         logger.info("Starting continuous monitoring system")
         self.monitoring_active = True
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._email_task = asyncio.create_task(self._email_delivery_loop())
         
-        while self.monitoring_active:
-            try:
-                current_time = datetime.now()
-                
-                # Execute monitoring cycle (24/7 operation)
-                logger.info("Executing monitoring cycle")
-                await self._execute_monitoring_cycle()
-                
-                # Send daily digest if needed
-                await self._check_daily_digest()
-                
-                # Wait for next monitoring interval
-                await asyncio.sleep(self.config.monitoring_interval * 60)  # Convert to seconds
-                
-            except Exception as e:
-                logger.error(
-                    "monitoring_cycle_error",
-                    error_type=type(e).__name__,
-                    error_details=str(e)
-                )
-                # Continue monitoring even if one cycle fails
-                await asyncio.sleep(60)  # Wait 1 minute before retry
+        # One Claude HTTP session for the whole run instead of one per analysis
+        if self.claude_client:
+            await self._open_claude_session()
+        
+        try:
+            while self.monitoring_active:
+                try:
+                    cycle_start = datetime.now()
+                    # Schedule against wall-clock so cycle duration doesn't add drift
+                    next_deadline = cycle_start + timedelta(minutes=self.config.monitoring_interval)
+                    
+                    # Execute monitoring cycle (24/7 operation)
+                    logger.info("Executing monitoring cycle")
+                    await self._execute_monitoring_cycle()
+                    
+                    # Send daily digest if needed
+                    await self._check_daily_digest()
+                    
+                    # Wait until the next scheduled cycle start
+                    sleep_for = max(0.0, (next_deadline - datetime.now()).total_seconds())
+                    if sleep_for == 0:
+                        logger.warning(
+                            "monitoring_cycle_overrun",
+                            monitoring_interval=self.config.monitoring_interval,
+                            cycle_duration_seconds=(datetime.now() - cycle_start).total_seconds()
+                        )
+                    await asyncio.sleep(sleep_for)
+                    
+                    # Persist newly resolved user IDs at most hourly
+                    if self._user_ids_dirty and datetime.now() - self._user_ids_saved_at >= timedelta(hours=1):
+                        self._save_user_id_cache()
+                    
+                except Exception as e:
+                    logger.error(
+                        "monitoring_cycle_error",
+                        error_type=type(e).__name__,
+                        error_details=str(e)
+                    )
+                    # Continue monitoring even if one cycle fails
+                    await asyncio.sleep(60)  # Wait 1 minute before retry
+            
+            # Let any alert still being delivered finish before returning
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        finally:
+            # Stop the email sender and writer, then flush whatever wasn't written yet; this runs
+            # on cancellation too, so saves still queued for the writer are never lost
+            self._email_task.cancel()
+            self._save_queue.put_nowait(None)  # Writer finishes its current batch, then exits
+            await asyncio.gather(self._email_task, self._writer_task, return_exceptions=True)
+            # Alerts still queued for the stopped sender are released rather than left waiting forever
+            while not self._email_queue.empty():
+                _, _, future = self._email_queue.get_nowait()
+                future.cancel()
+            self._email_task = None
+            self._writer_task = None
+            await asyncio.to_thread(self._close_smtp)
+            self._save_processed_opportunities()
+            self._save_alert_history()
+            
+            if self.claude_client:
+                await self._close_claude_session()
+    
+    async def _open_claude_session(self):
+        """Register a Claude user, opening the HTTP session for the first one"""
+        # Count before awaiting so overlapping callers never open a second session
+        self._claude_session_users += 1
+        if self._claude_session_users == 1:
+            await self.claude_client.__aenter__()
+    
+    async def _close_claude_session(self):
+        """Release a Claude user, closing the HTTP session after the last one"""
+        self._claude_session_users -= 1
+        if self._claude_session_users == 0:
+            await self.claude_client.__aexit__(None, None, None)
+    
+    @asynccontextmanager
+    async def _claude_session(self):
+        """Yield the Claude client on a session shared by every overlapping caller"""
+        await self._open_claude_session()
+        try:
+            yield self.claude_client
+        finally:
+            await self._close_claude_session()
+    
+    def _run_in_background(self, coro):
+        """Schedule a coroutine so SMTP delivery overlaps with the next monitoring cycle"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(self._log_background_failure)
+        return task
     
-    def _is_work_hours(self, current_time: datetime) -> bool:
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task):
+        """Log an exception from a background task, which nothing else awaits until shutdown"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()!r}")
+    
+    def _is_work_hours(self, current_time: Optional[datetime] = None) -> bool:
         """Check if current time is within configured work hours"""
-        current_hour = current_time.hour
+        current_hour = current_time.hour if current_time else time.localtime().tm_hour
         return self.config.work_hours_start <= current_hour < self.config.work_hours_end
     
     async def _execute_monitoring_cycle(self):
@@ -257,14 +1256,13 @@ class CronMonitorSystem:
             
             # Create focused test alert for v4/Unichain/AI system
             logger.info("Creating focused v4/Unichain/AI test opportunity")
-            from bot.scheduling.cron_monitor import AlertOpportunity
             
             test_alert = AlertOpportunity(
                 account_username="saucepoint",
                 account_tier=1,
-                content_text=f"Testing v4 AI integration patterns with predictive MEV protection - {datetime.now().strftime('%Y-%m-%d')}",
+                content_text=f"Testing v4 AI integration patterns with predictive MEV protection - {cycle_start.strftime('%Y-%m-%d')}",
                 content_url=f"https://twitter.com/saucepoint/status/1234567890123456789",
-                timestamp=datetime.now().isoformat(),
+                timestamp=cycle_start.isoformat(),
                 
                 overall_score=0.91,
                 ai_blockchain_relevance=0.95,
@@ -288,15 +1286,15 @@ class CronMonitorSystem:
             
             # Filter out duplicates
             processed_opportunities = []
-            if not self._is_opportunity_processed(test_alert):
+            if not self._is_opportunity_processed(test_alert, cycle_start):
                 processed_opportunities.append(test_alert)
-                self._mark_opportunity_processed(test_alert)
+                self._mark_opportunity_processed(test_alert, cycle_start)
                 logger.info("New test opportunity created and marked as processed")
             else:
                 logger.info("Test opportunity already sent today, skipping duplicate")
             
-            # 4. Send alerts based on priority
-            await self._send_priority_alerts(processed_opportunities)
+            # 4. Send alerts based on priority (delivered in the background)
+            self._run_in_background(self._send_priority_alerts(processed_opportunities))
             
             # 5. Add to daily digest queue
             self.daily_opportunities.extend(processed_opportunities)
@@ -320,24 +1318,20 @@ class CronMonitorSystem:
         
         try:
             # Get all strategic accounts
-            accounts = self.strategic_tracker.accounts
+            usernames = list(self.strategic_tracker.accounts)
+            now_ts = time.time()
             
-            for username, account in accounts.items():
-                try:
-                    # Get recent tweets from this account
-                    user_tweets = await self._get_user_recent_tweets(username, max_results=10)
-                    
-                    for tweet in user_tweets:
-                        # Analyze for engagement opportunities
-                        opportunity = await self.strategic_tracker.analyze_account_content(username, tweet)
-                        if opportunity:
-                            opportunities.append(opportunity.to_dict())
-                    
-                    # Rate limiting between accounts
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    logger.warning(f"Error monitoring account @{username}: {e}")
+            # Fetch accounts concurrently, bounded by the fetch semaphore
+            results = await asyncio.gather(
+                *(self._monitor_single_account(username, now_ts) for username in usernames),
+                return_exceptions=True
+            )
+            
+            for username, result in zip(usernames, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error monitoring account @{username}: {result}")
+                else:
+                    opportunities.extend(result)
             
             logger.info(f"Strategic account monitoring found {len(opportunities)} opportunities")
             
@@ -346,18 +1340,45 @@ class CronMonitorSystem:
         
         return opportunities
     
-    async def _get_user_recent_tweets(self, username: str, max_results: int = 10) -> List[Dict]:
+    async def _monitor_single_account(self, username: str, now_ts: Optional[float] = None) -> List[Dict]:
+        """Fetch and analyze recent tweets for one strategic account"""
+        async with self._fetch_semaphore:
+            # Get recent tweets from this account
+            user_tweets = await self._get_user_recent_tweets(username, max_results=10, now_ts=now_ts)
+            
+            # Rate limiting before this slot is handed to the next account
+            await asyncio.sleep(1)
+        
+        opportunities = []
+        for tweet in user_tweets:
+            # Analyze for engagement opportunities
+            opportunity = await self.strategic_tracker.analyze_account_content(username, tweet)
+            if opportunity:
+                opportunities.append(opportunity.to_dict())
+        
+        return opportunities
+    
+    async def _resolve_user_id(self, username: str) -> Optional[int]:
+        """Look up a user ID via the X API and remember it"""
+        # tweepy is synchronous - keep it off the event loop
+        user = await asyncio.to_thread(self.x_client.client.get_user, username=username)
+        if not user.data:
+            return None
+        
+        self._user_id_cache[username] = user.data.id
+        self._user_ids_dirty = True
+        return user.data.id
+    
+    async def _get_user_recent_tweets(self, username: str, max_results: int = 10, now_ts: Optional[float] = None) -> List[Dict]:
         """Get recent tweets from a specific user"""
         try:
-            # Get user ID
-            user = self.x_client.client.get_user(username=username)
-            if not user.data:
+            user_id = self._user_id_cache.get(username) or await self._resolve_user_id(username)
+            if not user_id:
                 return []
             
-            user_id = user.data.id
-            
             # Get recent tweets
-            tweets = self.x_client.client.get_users_tweets(
+            tweets = await asyncio.to_thread(
+                self.x_client.client.get_users_tweets,
                 id=user_id,
                 max_results=max_results,
                 tweet_fields=['created_at', 'public_metrics', 'context_annotations'],
@@ -366,9 +1387,10 @@ class CronMonitorSystem:
             
             results = []
             if tweets and tweets.data:
+                # Only process tweets from last 4 hours
+                cutoff_ts = (now_ts or time.time()) - 14400
                 for tweet in tweets.data:
-                    # Only process tweets from last 4 hours
-                    if tweet.created_at and (datetime.now() - tweet.created_at.replace(tzinfo=None)).total_seconds() < 14400:
+                    if tweet.created_at and tweet.created_at.timestamp() > cutoff_ts:
                         tweet_dict = {
                             'id': tweet.id,
                             'text': tweet.text,
@@ -390,37 +1412,27 @@ class CronMonitorSystem:
         opportunities = []
         
         try:
+            now = datetime.now()
+            
             # Occasionally update trending narratives (every 4-6 hours)
-            if datetime.now() - self.last_narrative_update > timedelta(hours=random.uniform(4, 6)):
+            if now - self.last_narrative_update > timedelta(hours=random.uniform(4, 6)):
                 await self._update_trending_narratives()
-                self.last_narrative_update = datetime.now()
+                self.last_narrative_update = now
             
             # Get focused keywords for v4/Unichain/AI intersection
             ai_blockchain_keywords = self._get_focused_keywords()
             
-            for keyword in ai_blockchain_keywords:
-                try:
-                    # Search for recent tweets
-                    search_results = await self._search_keyword_tweets(keyword, max_results=10)
-                    
-                    for tweet in search_results:
-                        # Enhanced AI x blockchain analysis
-                        analysis = await self._analyze_ai_blockchain_content(keyword, tweet)
-                        
-                        if analysis['overall_ai_blockchain_score'] >= 0.6:
-                            opportunity = {
-                                'keyword': keyword,
-                                'tweet_data': tweet,
-                                'analysis': analysis,
-                                'discovered_at': datetime.now().isoformat()
-                            }
-                            opportunities.append(opportunity)
-                    
-                    # Rate limiting between searches
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    logger.warning(f"Error searching keyword '{keyword}': {e}")
+            # Search keywords concurrently, bounded by the fetch semaphore
+            results = await asyncio.gather(
+                *(self._monitor_single_keyword(keyword, now) for keyword in ai_blockchain_keywords),
+                return_exceptions=True
+            )
+            
+            for keyword, result in zip(ai_blockchain_keywords, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error searching keyword '{keyword}': {result}")
+                else:
+                    opportunities.extend(result)
             
             logger.info(f"AI x blockchain keyword monitoring found {len(opportunities)} opportunities")
             
@@ -429,24 +1441,50 @@ class CronMonitorSystem:
         
         return opportunities
     
-    async def _search_keyword_tweets(self, keyword: str, max_results: int = 10) -> List[Dict]:
+    async def _monitor_single_keyword(self, keyword: str, now: Optional[datetime] = None) -> List[Dict]:
+        """Search one keyword and keep tweets that pass the AI x blockchain threshold"""
+        now = now or datetime.now()
+        async with self._fetch_semaphore:
+            # Search for recent tweets
+            search_results = await self._search_keyword_tweets(keyword, max_results=10, now_ts=now.timestamp())
+        
+        discovered_at = now.isoformat()
+        opportunities = []
+        for tweet in search_results:
+            # Enhanced AI x blockchain analysis
+            analysis = await self._analyze_ai_blockchain_content(keyword, tweet)
+            
+            if analysis['overall_ai_blockchain_score'] >= 0.6:
+                opportunities.append({
+                    'keyword': keyword,
+                    'tweet_data': tweet,
+                    'analysis': analysis,
+                    'discovered_at': discovered_at
+                })
+        
+        return opportunities
+    
+    async def _search_keyword_tweets(self, keyword: str, max_results: int = 10, now_ts: Optional[float] = None) -> List[Dict]:
         """Search for recent tweets containing a specific keyword"""
         try:
             query = f'"{keyword}" -is:retweet lang:en'
             
-            search_results = self.x_client.read_client.search_recent_tweets(
-                query=query,
-                max_results=max_results,
-                tweet_fields=['created_at', 'public_metrics', 'context_annotations'],
-                expansions=['author_id'],
-                user_fields=['username', 'public_metrics']
-            )
+            async with self._search_limiter:
+                search_results = await asyncio.to_thread(
+                    self.x_client.read_client.search_recent_tweets,
+                    query=query,
+                    max_results=max_results,
+                    tweet_fields=['created_at', 'public_metrics', 'context_annotations'],
+                    expansions=['author_id'],
+                    user_fields=['username', 'public_metrics']
+                )
             
             results = []
             if search_results and search_results.data:
+                # Only process recent tweets (last 2 hours)
+                cutoff_ts = (now_ts or time.time()) - 7200
                 for tweet in search_results.data:
-                    # Only process recent tweets (last 2 hours)
-                    if tweet.created_at and (datetime.now() - tweet.created_at.replace(tzinfo=None)).total_seconds() < 7200:
+                    if tweet.created_at and tweet.created_at.timestamp() > cutoff_ts:
                         tweet_dict = {
                             'id': tweet.id,
                             'text': tweet.text,
@@ -466,36 +1504,19 @@ class CronMonitorSystem:
     async def _analyze_ai_blockchain_content(self, keyword: str, tweet: Dict) -> Dict:
         """Analyze content for AI x blockchain convergence opportunities"""
         try:
+            # Cheap lexical pass first. The vocabulary doesn't cover the narrative keywords
+            # being searched, so a tweet that carries its keyword always goes to Claude
+            basic = self._basic_ai_blockchain_analysis(keyword, tweet)
+            if (basic['overall_ai_blockchain_score'] < _CLAUDE_PREFILTER_SCORE
+                    and not _mentions_keyword(keyword, tweet.get('text', ''))):
+                return basic
+            
             if self.claude_client:
                 # Use Claude for enhanced analysis
-                analysis_prompt = f"""
-                Analyze this tweet found via keyword search for '{keyword}' for AI x blockchain engagement opportunities:
-                
-                Tweet: "{tweet.get('text', '')}"
-                
-                Provide analysis focusing on:
-                1. AI x blockchain convergence relevance (0-1)
-                2. Technical depth and complexity (0-1)
-                3. Innovation and forward-thinking content (0-1)
-                4. Engagement opportunity potential (0-1)
-                5. Time sensitivity for response (0-1)
-                
-                Return JSON:
-                {{
-                    "ai_blockchain_relevance": 0.0-1.0,
-                    "technical_depth": 0.0-1.0,
-                    "innovation_score": 0.0-1.0,
-                    "engagement_opportunity": 0.0-1.0,
-                    "time_sensitivity": 0.0-1.0,
-                    "content_themes": ["theme1", "theme2"],
-                    "opportunity_type": "technical_discussion|breakthrough_announcement|collaboration|educational",
-                    "strategic_value": "high|medium|low",
-                    "suggested_approach": "technical_insight|question|collaboration|educational_support"
-                }}
-                """
+                analysis_prompt = _ANALYSIS_PROMPT_TEMPLATE.format(keyword=keyword, text=tweet.get('text', ''))
                 
                 # Make direct API call for analysis using async context
-                async with self.claude_client as client:
+                async with self._claude_session() as client:
                     response_data = await client._make_api_call("messages", {
                         "model": "claude-3-haiku-20240307",
                         "max_tokens": 500,
@@ -506,10 +1527,9 @@ class CronMonitorSystem:
                 response_text = response_data['content'][0]['text']
                 
                 # Find JSON block in response
-                import re
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    analysis = json.loads(json_match.group(0))
+                json_block = _extract_json_object(response_text)
+                if json_block:
+                    analysis = orjson.loads(json_block)
                 else:
                     # Fallback to basic scoring if JSON extraction fails
                     analysis = {
@@ -536,7 +1556,7 @@ class CronMonitorSystem:
                 
             else:
                 # Fallback to basic analysis
-                return self._basic_ai_blockchain_analysis(keyword, tweet)
+                return basic
                 
         except Exception as e:
             logger.warning(f"AI analysis failed for keyword '{keyword}': {e}")
@@ -545,15 +1565,12 @@ class CronMonitorSystem:
     def _basic_ai_blockchain_analysis(self, keyword: str, tweet: Dict) -> Dict:
         """Basic analysis when Claude API is not available"""
         text = tweet.get('text', '').lower()
+        hits = _match_terms(text)
         
         # Basic scoring based on keyword density and content indicators
-        ai_terms = ['ai', 'machine learning', 'ml', 'neural', 'algorithm', 'intelligent', 'autonomous', 'predictive']
-        blockchain_terms = ['blockchain', 'crypto', 'defi', 'uniswap', 'ethereum', 'protocol', 'smart contract']
-        technical_terms = ['implementation', 'architecture', 'optimization', 'performance', 'framework']
-        
-        ai_score = sum(1 for term in ai_terms if term in text) / len(ai_terms)
-        blockchain_score = sum(1 for term in blockchain_terms if term in text) / len(blockchain_terms)
-        technical_score = sum(1 for term in technical_terms if term in text) / len(technical_terms)
+        ai_score = len(hits['ai']) / len(_AI_TERMS)
+        blockchain_score = len(hits['blockchain']) / len(_BLOCKCHAIN_TERMS)
+        technical_score = len(hits['technical']) / len(_TECHNICAL_TERMS)
         
         has_question = '?' in text
         engagement_opportunity = 0.8 if has_question else 0.5
@@ -561,9 +1578,9 @@ class CronMonitorSystem:
         return {
             'ai_blockchain_relevance': min(1.0, (ai_score + blockchain_score) / 2),
             'technical_depth': min(1.0, technical_score * 2),
-            'innovation_score': 0.6 if any(term in text for term in ['new', 'breakthrough', 'revolutionary']) else 0.4,
+            'innovation_score': 0.6 if hits['innovation'] else 0.4,
             'engagement_opportunity': engagement_opportunity,
-            'time_sensitivity': 0.7 if any(term in text for term in ['breaking', 'just', 'announced']) else 0.4,
+            'time_sensitivity': 0.7 if hits['time_sensitive'] else 0.4,
             'content_themes': ['ai_blockchain'],
             'opportunity_type': 'technical_discussion',
             'strategic_value': 'medium',
@@ -574,7 +1591,10 @@ class CronMonitorSystem:
     async def _process_opportunities(self, raw_opportunities: List[Dict]) -> List[AlertOpportunity]:
         """Process raw opportunities into formatted alerts with generated content"""
         processed = []
+        now = datetime.now()
         
+        pending = []
+        pending_ids = set()
         for opp in raw_opportunities:
             try:
                 # Determine if this is a strategic account or keyword opportunity
@@ -598,22 +1618,7 @@ class CronMonitorSystem:
                         suggested_response=f"Respond with {opp['suggested_response_type']} within {self._get_response_timeframe(opp['time_sensitivity'])}"
                     )
                     
-                    # Check for duplicates before processing
-                    if not self._is_opportunity_processed(alert_opp):
-                        # Generate content for this opportunity
-                        await self._generate_opportunity_content(alert_opp)
-                        
-                        # Create feedback tracking for this opportunity
-                        feedback_id = self.feedback_tracker.create_opportunity_tracking(alert_opp.to_dict())
-                        alert_opp.feedback_id = feedback_id
-                        alert_opp.feedback_urls = self.feedback_tracker.generate_feedback_urls(feedback_id)
-                        
-                        # Mark as processed to prevent future duplicates
-                        self._mark_opportunity_processed(alert_opp)
-                        processed.append(alert_opp)
-                        logger.debug(f"New strategic opportunity: {alert_opp.content_url}")
-                    else:
-                        logger.debug(f"Skipping duplicate strategic opportunity: {alert_opp.content_url}")
+                    opportunity_kind = "strategic"
                     
                 elif 'keyword' in opp:
                     # Keyword opportunity
@@ -638,23 +1643,48 @@ class CronMonitorSystem:
                         suggested_response=f"Engage with {analysis['suggested_approach']} approach focusing on technical expertise"
                     )
                     
-                    # Check for duplicates before processing
-                    if not self._is_opportunity_processed(alert_opp):
-                        # Generate content for this opportunity
-                        await self._generate_opportunity_content(alert_opp)
-                        
-                        # Create feedback tracking for this opportunity
-                        feedback_id = self.feedback_tracker.create_opportunity_tracking(alert_opp.to_dict())
-                        alert_opp.feedback_id = feedback_id
-                        alert_opp.feedback_urls = self.feedback_tracker.generate_feedback_urls(feedback_id)
-                        
-                        # Mark as processed to prevent future duplicates
-                        self._mark_opportunity_processed(alert_opp)
-                        processed.append(alert_opp)
-                        logger.debug(f"New keyword opportunity: {alert_opp.content_url}")
-                    else:
-                        logger.debug(f"Skipping duplicate keyword opportunity: {alert_opp.content_url}")
+                    opportunity_kind = "keyword"
                     
+                else:
+                    continue
+                
+                # Check for duplicates, including repeats within this batch
+                opp_id = self._get_opportunity_id(alert_opp, now)
+                if opp_id in self.processed_opportunities or opp_id in pending_ids:
+                    logger.debug(f"Skipping duplicate {opportunity_kind} opportunity: {alert_opp.content_url}")
+                    continue
+                pending_ids.add(opp_id)
+                pending.append((opportunity_kind, alert_opp))
+                    
+            except Exception as e:
+                logger.error(f"Error processing opportunity: {e}")
+        
+        # Generate content for all new opportunities concurrently
+        await asyncio.gather(
+            *(self._generate_opportunity_content_limited(alert_opp) for _, alert_opp in pending),
+            return_exceptions=True
+        )
+        
+        # Register the whole batch with the feedback tracker in one pending-file write
+        try:
+            feedback_ids = self.feedback_tracker.create_opportunity_tracking_batch(
+                [alert_opp.to_dict() for _, alert_opp in pending]
+            )
+        except Exception as e:
+            logger.error(f"Error creating feedback tracking: {e}")
+            # The opportunities still go out; alerting registers any left without a feedback ID
+            feedback_ids = [None] * len(pending)
+        
+        for (opportunity_kind, alert_opp), feedback_id in zip(pending, feedback_ids):
+            try:
+                if feedback_id is not None:
+                    alert_opp.feedback_id = feedback_id
+                    alert_opp.feedback_urls = self.feedback_tracker.generate_feedback_urls(feedback_id)
+                
+                # Mark as processed to prevent future duplicates
+                self._mark_opportunity_processed(alert_opp, now)
+                processed.append(alert_opp)
+                logger.debug(f"New {opportunity_kind} opportunity: {alert_opp.content_url}")
             except Exception as e:
                 logger.error(f"Error processing opportunity: {e}")
         
@@ -663,6 +1693,11 @@ class CronMonitorSystem:
         
         return processed
     
+    async def _generate_opportunity_content_limited(self, opportunity: AlertOpportunity):
+        """Generate opportunity content while respecting the Claude concurrency cap"""
+        async with self._claude_semaphore:
+            await self._generate_opportunity_content(opportunity)
+    
     async def _generate_opportunity_content(self, opportunity: AlertOpportunity):
         """Generate AI-powered response content for an opportunity"""
         try:
@@ -675,76 +1710,56 @@ class CronMonitorSystem:
                 opportunity.voice_alignment_score = 0.7
                 return
             
+            # Near-duplicate tweets (retweets, quoted copies) reuse an earlier generation
+            cache_key = _reply_cache_key(opportunity)
+            cached = self._reply_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _REPLY_CACHE_TTL_SECONDS:
+                for field, value in cached[1].items():
+                    setattr(opportunity, field, value)
+                # Each opportunity gets its own copy of the alternatives list
+                opportunity.alternative_responses = list(opportunity.alternative_responses)
+                logger.debug(f"Reusing cached reply for opportunity: {opportunity.content_url}")
+                return
+            
             # Generate content using Claude API
-            # Build prompt without JSON template to avoid f-string formatting issues
-            content_prompt = f"""
-            Generate a strategic reply for this AI x blockchain opportunity:
-            
-            Original Content: "{opportunity.content_text}"
-            Account: @{opportunity.account_username} (Tier {opportunity.account_tier})
-            Opportunity Type: {opportunity.opportunity_type}
-            Suggested Approach: {opportunity.suggested_response_type}
-            
-            Voice Guidelines - SingleDivorcedDad Sprotogremlin:
-            - 42-year-old single dad with sprotogremlin energy
-            - Chaotic but knowledgeable - crypto expertise expressed casually
-            - Dad wisdom mixed with degen gremlin vibes
-            - Technical knowledge but not corporate or formal
-            - Slightly unhinged but endearing energy
-            - NO buzzwords, NO "alpha", NO press release language
-            - NEVER use hashtags or emojis
-            
-            Generate a reply that:
-            1. Sounds like a real person, not a crypto influencer
-            2. Adds genuine insight but in gremlin language
-            3. Shows technical knowledge casually, not formally
-            4. Stays under 280 characters
-            5. Has authentic dad/gremlin personality
-            6. NO corporate speak or marketing language
-            
-            Provide your response as JSON with these exact keys:
-            - primary_reply: Your main response (string, max 280 chars)
-            - reasoning: Why this approach works (string)
-            - alternatives: Array of 2 alternative responses
-            - engagement_prediction: Number from 0.0 to 1.0
-            - voice_alignment: Number from 0.0 to 1.0
-            
-            Example format: JSON object with primary_reply, reasoning, alternatives array, engagement_prediction number, voice_alignment number
-            """
+            content_prompt = _REPLY_PROMPT_TEMPLATE.format(
+                text=opportunity.content_text,
+                username=opportunity.account_username,
+                tier=opportunity.account_tier,
+                opportunity_type=opportunity.opportunity_type,
+                approach=opportunity.suggested_response_type
+            )
             
             # Use Claude to generate content
-            async with self.claude_client:
-                voice_only = """
-                AI x blockchain technical authority voice:
-                - Conversational and approachable - use "chat" for addressing readers
-                - Forward-thinking innovation expert - relaxed crypto-native language
-                - Educational but confident - no corporate fluff or rigid tone
-                - NEVER use hashtags - clean text only
-                - Always use lowercase "v4" for Uniswap v4
-                - Use "Uniswap community/ecosystem/foundation/labs" not just "Uniswap"
-                - Relaxed, authentic voice - less formal, more natural
-                """
-                
+            async with self._claude_session():
                 response = await self.claude_client.generate_content(
                     opportunity_type="reply",
-                    context={'text': opportunity.content_text, 'prompt': content_prompt},
-                    target_topics=["ai blockchain", "autonomous trading", "uniswap v4"],
-                    voice_guidelines=voice_only
+                    context={'text': opportunity.content_text, 'author_id': opportunity.account_username, 'prompt': content_prompt},
+                    target_topics=_REPLY_TARGET_TOPICS,
+                    system_prompt=VOICE_GUIDELINES_STATIC
                 )
             
             # Parse Claude response
             try:
-                import json
-                content_data = json.loads(response.content)
+                # Tolerate prose or code fences around the JSON object
+                content_data = _parse_reply_data(_extract_json_object(response.content) or response.content)
                 
-                opportunity.generated_reply = content_data.get('primary_reply', 'Generated response unavailable')
-                opportunity.reply_reasoning = content_data.get('reasoning', 'AI-generated strategic response')
-                opportunity.alternative_responses = content_data.get('alternatives', [])
-                opportunity.engagement_prediction = content_data.get('engagement_prediction', 0.7)
-                opportunity.voice_alignment_score = content_data.get('voice_alignment', 0.8)
+                opportunity.generated_reply = content_data['primary_reply']
+                opportunity.reply_reasoning = content_data['reasoning']
+                opportunity.alternative_responses = content_data['alternatives']
+                opportunity.engagement_prediction = content_data['engagement_prediction']
+                opportunity.voice_alignment_score = content_data['voice_alignment']
                 
-            except (json.JSONDecodeError, KeyError):
-                # Fallback if JSON parsing fails
+                cached_fields = {field: getattr(opportunity, field) for field in _GENERATED_REPLY_FIELDS}
+                # Copy the list so later edits to this opportunity can't reach the cache
+                cached_fields['alternative_responses'] = list(opportunity.alternative_responses)
+                self._reply_cache[cache_key] = (time.monotonic(), cached_fields)
+                self._reply_cache.move_to_end(cache_key)
+                while len(self._reply_cache) > _REPLY_CACHE_MAX_ENTRIES:
+                    self._reply_cache.popitem(last=False)
+                
+            except (ValueError, TypeError):
+                # Fallback if JSON parsing or validation fails
                 opportunity.generated_reply = response.content[:280] if hasattr(response, 'content') else "AI-generated response"
                 opportunity.reply_reasoning = "AI-generated strategic response with technical expertise"
                 opportunity.alternative_responses = ["Great insight on AI x blockchain convergence!", "The technical implications here are fascinating."]
@@ -763,43 +1778,35 @@ class CronMonitorSystem:
             opportunity.engagement_prediction = 0.6
             opportunity.voice_alignment_score = 0.7
     
-    def _get_response_timeframe(self, time_sensitivity: str) -> str:
+    @staticmethod
+    def _get_response_timeframe(time_sensitivity: str) -> str:
         """Convert time sensitivity to response timeframe"""
-        timeframes = {
-            'immediate': '30 minutes',
-            'within_hour': '1 hour',
-            'within_day': '4 hours',
-            'digest': '24 hours'
-        }
-        return timeframes.get(time_sensitivity, '2 hours')
+        return _RESPONSE_TIMEFRAMES.get(time_sensitivity, '2 hours')
     
-    def _convert_time_sensitivity(self, score: float) -> str:
+    @staticmethod
+    def _convert_time_sensitivity(score: float) -> str:
         """Convert numerical time sensitivity to category"""
-        if score >= 0.8:
-            return 'immediate'
-        elif score >= 0.6:
-            return 'within_hour'
-        elif score >= 0.4:
-            return 'within_day'
-        else:
-            return 'digest'
+        return _SENSITIVITY_CATEGORIES[bisect_right(_SENSITIVITY_THRESHOLDS, score)]
     
     async def _send_priority_alerts(self, opportunities: List[AlertOpportunity]):
         """Send detailed email alerts with feedback tracking, opportunities + original content"""
         logger.info(f"Processing {len(opportunities)} opportunities for detailed email with feedback + original content")
         
         # Filter for highest priority opportunities (limit to 2 for email readability with original content)
-        high_priority_opportunities = sorted(
-            opportunities, 
-            key=lambda x: x.overall_score, 
-            reverse=True
-        )[:2] if opportunities else []
+        high_priority_opportunities = heapq.nlargest(
+            2,
+            opportunities,
+            key=lambda x: x.overall_score
+        ) if opportunities else []
         
-        # Generate feedback URLs for each opportunity and register with feedback tracker
-        feedback_tracker = get_feedback_tracker()
-        for opp in high_priority_opportunities:
-            # Register opportunity with feedback tracker
-            opp_data = {
+        # Generate original content (trending topic or unhinged take)
+        content_type = "trending_topic" if len(high_priority_opportunities) >= 2 else "unhinged_take"
+        original_content = await self._generate_original_content(content_type)
+        
+        # _process_opportunities already registered most of these - keep their links
+        unregistered = [opp for opp in high_priority_opportunities if not opp.feedback_id]
+        tracking_data = [
+            {
                 'account_username': opp.account_username,
                 'opportunity_type': opp.opportunity_type,
                 'overall_score': opp.overall_score,
@@ -808,15 +1815,11 @@ class CronMonitorSystem:
                 'voice_alignment_score': opp.voice_alignment_score,
                 'content_url': opp.content_url
             }
-            opp.feedback_id = feedback_tracker.create_opportunity_tracking(opp_data)
-            opp.feedback_urls = self._generate_feedback_urls(opp)
-        
-        # Generate original content (trending topic or unhinged take)
-        content_type = "trending_topic" if len(high_priority_opportunities) >= 2 else "unhinged_take"
-        original_content = await self._generate_original_content(content_type)
+            for opp in unregistered
+        ]
         
-        # Register original content with feedback tracker
-        original_content_data = {
+        # Register original content alongside the opportunities
+        tracking_data.append({
             'account_username': 'AI_Generated',
             'opportunity_type': f'original_{content_type}',
             'overall_score': 0.8,  # Default score for original content
@@ -824,16 +1827,29 @@ class CronMonitorSystem:
             'alternative_responses': [],
             'voice_alignment_score': 0.85,  # Default voice alignment
             'content_url': 'https://twitter.com/intent/tweet'
-        }
-        original_content_id = feedback_tracker.create_opportunity_tracking(original_content_data)
-        original_content['feedback_id'] = original_content_id
+        })
+        
+        try:
+            feedback_ids = get_feedback_tracker().create_opportunity_tracking_batch(tracking_data)
+        except Exception as e:
+            # Still send the alert; links fall back to IDs derived from each item
+            logger.error(f"Error creating feedback tracking: {e}")
+        else:
+            for opp, feedback_id in zip(unregistered, feedback_ids):
+                opp.feedback_id = feedback_id
+            original_content['feedback_id'] = feedback_ids[-1]
+        
+        for opp in high_priority_opportunities:
+            if not opp.feedback_urls:
+                opp.feedback_urls = self._generate_feedback_urls(opp)
         
         # Send detailed alert with both opportunities and original content
         await self._send_detailed_alert_with_original_content(high_priority_opportunities, original_content)
     
     def _generate_feedback_urls(self, opportunity: AlertOpportunity) -> Dict[str, str]:
         """Generate feedback URLs for opportunity quality rating and reply usage tracking"""
-        opp_id = opportunity.feedback_id or f"opp_{hash(opportunity.content_url) % 10000}"
+        # Stable across restarts (unlike hash()) so stored feedback links keep resolving
+        opp_id = opportunity.feedback_id or f"opp_{hashlib.blake2b(opportunity.content_url.encode(), digest_size=6).hexdigest()}"
         
         # Use feedback tracker to generate URLs with proper base URL
         return self.feedback_tracker.generate_feedback_urls(opp_id)
@@ -846,13 +1862,14 @@ class CronMonitorSystem:
             
             # Generate subject based on content with version
             if opp_count == 0:
-                subject = f"🚀 Original {content_type.replace('_', ' ').title()} + AI x Blockchain Focus [{SYSTEM_VERSION}]"
+                subject = f"🚀 Original {_pretty_label(content_type)} + AI x Blockchain Focus [{SYSTEM_VERSION}]"
             elif any(opp.account_username == "SYSTEM_STARTUP" for opp in opportunities):
                 subject = f"🤖 SYSTEM STARTUP - SingleDivorcedDad Bot Online [{SYSTEM_VERSION}]"
             else:
-                subject = f"🎯 {opp_count} AI x Blockchain Opportunities + {content_type.replace('_', ' ').title()} [{SYSTEM_VERSION}]"
+                subject = f"🎯 {opp_count} AI x Blockchain Opportunities + {_pretty_label(content_type)} [{SYSTEM_VERSION}]"
             
-            html_content = self._generate_detailed_alert_with_original_html(opportunities, original_content)
+            # Render in a worker thread so Claude and SMTP work keeps moving on the loop
+            html_content = await asyncio.to_thread(self._generate_detailed_alert_with_original_html, opportunities, original_content)
             
             alert_type = f"detailed_with_{content_type}"
             await self._send_email(subject, html_content, alert_type, opp_count)
@@ -870,7 +1887,8 @@ class CronMonitorSystem:
         try:
             subject = f"🎯 {len(opportunities)} AI x Blockchain Opportunities with Feedback Tracking [{SYSTEM_VERSION}]"
             
-            html_content = self._generate_alert_html(
+            html_content = await asyncio.to_thread(
+                self._generate_alert_html,
                 "PRIORITY OPPORTUNITIES WITH FEEDBACK",
                 opportunities,
                 "High-quality AI x blockchain engagement opportunities with voice evolution tracking."
@@ -891,7 +1909,8 @@ class CronMonitorSystem:
         try:
             subject = f"⚡ PRIORITY: {len(opportunities)} AI x Blockchain Engagement Opportunities [{SYSTEM_VERSION}]"
             
-            html_content = self._generate_alert_html(
+            html_content = await asyncio.to_thread(
+                self._generate_alert_html,
                 "PRIORITY OPPORTUNITIES",
                 opportunities,
                 "These opportunities are time-sensitive and should be addressed within 1-2 hours."
@@ -899,429 +1918,39 @@ class CronMonitorSystem:
             
             await self._send_email(subject, html_content, "priority", len(opportunities))
             
-            # Record alert
-            self._record_alert('priority', len(opportunities), opportunities)
-            
-            logger.info(f"Sent priority alert for {len(opportunities)} opportunities")
-            
-        except Exception as e:
-            logger.error(f"Error sending priority alert: {e}")
-    
-    def _generate_alert_html(self, alert_type: str, opportunities: List[AlertOpportunity], description: str) -> str:
-        """Generate enhanced HTML email content with generated replies and links"""
-        opportunities_html = ""
-        
-        for i, opp in enumerate(opportunities[:5], 1):  # Limit to top 5
-            emoji = "🔥" if opp.overall_score >= 0.8 else "⚡" if opp.overall_score >= 0.6 else "📊"
-            
-            # Generate enhanced tweet URLs - handle both real and test URLs
-            tweet_id = opp.content_url.split('/')[-1] if '/status/' in opp.content_url else None
-            
-            if tweet_id and tweet_id.isdigit():
-                # Real tweet ID - use reply intent
-                reply_url = f"https://twitter.com/intent/tweet?in_reply_to={tweet_id}&text={opp.generated_reply or ''}"
-                quote_url = f"https://twitter.com/intent/tweet?url={opp.content_url}&text={opp.generated_reply or ''}"
-            else:
-                # Test data or invalid URL - use general compose intent
-                reply_text = f"@{opp.account_username} {opp.generated_reply or ''}"
-                reply_url = f"https://twitter.com/intent/tweet?text={reply_text}"
-                quote_url = f"https://twitter.com/intent/tweet?text={opp.generated_reply or ''}"
-            
-            # Format alternative responses
-            alternatives_html = ""
-            if opp.alternative_responses:
-                for j, alt in enumerate(opp.alternative_responses[:2], 1):
-                    if tweet_id and tweet_id.isdigit():
-                        alt_reply_url = f"https://twitter.com/intent/tweet?in_reply_to={tweet_id}&text={alt}"
-                    else:
-                        alt_reply_text = f"@{opp.account_username} {alt}"
-                        alt_reply_url = f"https://twitter.com/intent/tweet?text={alt_reply_text}"
-                    alternatives_html += f"""
-                    <div style="background: #f0f0f0; padding: 8px; margin: 5px 0; border-radius: 4px; border-left: 3px solid #3498db;">
-                        <strong>Alternative {j}:</strong> {alt}<br>
-                        <a href="{alt_reply_url}" style="font-size: 12px; color: #3498db; text-decoration: none;">📝 Use This Reply</a>
-                    </div>
-                    """
-            
-            # Performance prediction indicators
-            engagement_color = "#27ae60" if opp.engagement_prediction and opp.engagement_prediction >= 0.7 else "#f39c12" if opp.engagement_prediction and opp.engagement_prediction >= 0.5 else "#e74c3c"
-            voice_color = "#27ae60" if opp.voice_alignment_score and opp.voice_alignment_score >= 0.8 else "#f39c12" if opp.voice_alignment_score and opp.voice_alignment_score >= 0.6 else "#e74c3c"
-            
-            # Feedback URLs for this opportunity
-            feedback_urls = opp.feedback_urls if opp.feedback_urls else {}
-            excellent_url = feedback_urls.get('excellent', '#')
-            good_url = feedback_urls.get('good', '#')
-            okay_url = feedback_urls.get('okay', '#')
-            poor_url = feedback_urls.get('poor', '#')
-            bad_url = feedback_urls.get('bad', '#')
-            used_primary_url = feedback_urls.get('used_primary', '#')
-            used_alt1_url = feedback_urls.get('used_alt1', '#')
-            used_alt2_url = feedback_urls.get('used_alt2', '#')
-            used_custom_url = feedback_urls.get('used_custom', '#')
-            not_used_url = feedback_urls.get('not_used', '#')
-            feedback_id = opp.feedback_id or 'N/A'
-            
-            opportunities_html += f"""
-            <div style="border: 1px solid #ddd; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fafafa;">
-                <h3 style="color: #2c3e50; margin-top: 0; border-bottom: 2px solid #3498db; padding-bottom: 8px;">
-                    {emoji} Opportunity {i}: @{opp.account_username}
-                </h3>
-                
-                <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #3498db;">
-                    <strong style="color: #2c3e50;">Original Content:</strong><br>
-                    <em>"{opp.content_text[:300]}{'...' if len(opp.content_text) > 300 else ''}"</em>
-                </div>
-                
-                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin: 15px 0; background: #f8f9fa; padding: 12px; border-radius: 6px;">
-                    <div><strong>Overall Score:</strong> <span style="color: {engagement_color};">{opp.overall_score:.2f}</span></div>
-                    <div><strong>AI x Blockchain:</strong> <span style="color: #8e44ad;">{opp.ai_blockchain_relevance:.2f}</span></div>
-                    <div><strong>Technical Depth:</strong> <span style="color: #d35400;">{opp.technical_depth:.2f}</span></div>
-                </div>
-                
-                <div style="margin: 15px 0; background: #fff; padding: 12px; border-radius: 6px;">
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
-                        <div><strong>Opportunity Type:</strong> {opp.opportunity_type.replace('_', ' ').title()}</div>
-                        <div><strong>Time Sensitivity:</strong> {opp.time_sensitivity.replace('_', ' ').title()}</div>
-                    </div>
-                </div>
-                
-                <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #27ae60;">
-                    <strong style="color: #27ae60;">🤖 AI-Generated Response:</strong><br>
-                    <div style="background: #fff; padding: 12px; margin: 8px 0; border-radius: 6px; font-style: italic; border: 1px solid #ddd;">
-                        "{opp.generated_reply or 'Response generation in progress...'}"
-                    </div>
-                    
-                    {f'<div style="font-size: 12px; color: #666; margin-top: 8px;"><strong>Reasoning:</strong> {opp.reply_reasoning}</div>' if opp.reply_reasoning else ''}
-                    
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 10px; font-size: 12px;">
-                        <div>📈 <strong>Engagement Prediction:</strong> <span style="color: {engagement_color};">{(opp.engagement_prediction or 0):.0%}</span></div>
-                        <div>🎭 <strong>Voice Alignment:</strong> <span style="color: {voice_color};">{(opp.voice_alignment_score or 0):.0%}</span></div>
-                    </div>
-                </div>
-                
-                {f'<div style="margin: 15px 0;"><strong style="color: #8e44ad;">🔄 Alternative Responses:</strong>{alternatives_html}</div>' if alternatives_html else ''}
-                
-                <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #ffc107;">
-                    <strong style="color: #856404;">📋 Strategic Context:</strong><br>
-                    {opp.strategic_context}<br>
-                    <strong style="color: #856404;">💡 Recommended Action:</strong> {opp.suggested_response}
-                </div>
-                
-                <div style="margin: 20px 0; text-align: center;">
-                    <a href="{opp.content_url}" 
-                       style="background: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        🔗 View Original Tweet
-                    </a>
-                    
-                    <a href="{reply_url}" 
-                       style="background: #27ae60; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        💬 Reply with Generated Content
-                    </a>
-                    
-                    <a href="{quote_url}" 
-                       style="background: #e67e22; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        🔄 Quote Tweet
-                    </a>
-                </div>
-                
-                <!-- Feedback Section -->
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #6c757d;">
-                    <strong style="color: #495057;">📊 Feedback & Learning</strong><br>
-                    <div style="margin: 10px 0; font-size: 12px; color: #6c757d;">
-                        Help improve voice evolution by rating this opportunity and tracking reply usage:
-                    </div>
-                    
-                    <!-- Quality Rating Buttons -->
-                    <div style="margin: 8px 0;">
-                        <strong style="font-size: 12px; color: #495057;">Opportunity Quality:</strong><br>
-                        <div style="margin: 5px 0;">
-                            <a href="{excellent_url}" 
-                               style="background: #28a745; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐⭐⭐ Excellent
-                            </a>
-                            <a href="{good_url}" 
-                               style="background: #20c997; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐⭐ Good
-                            </a>
-                            <a href="{okay_url}" 
-                               style="background: #ffc107; color: black; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐ Okay
-                            </a>
-                            <a href="{poor_url}" 
-                               style="background: #fd7e14; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐ Poor
-                            </a>
-                            <a href="{bad_url}" 
-                               style="background: #dc3545; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐ Bad
-                            </a>
-                        </div>
-                    </div>
-                    
-                    <!-- Reply Usage Tracking -->
-                    <div style="margin: 8px 0;">
-                        <strong style="font-size: 12px; color: #495057;">Reply Usage (click after posting):</strong><br>
-                        <div style="margin: 5px 0;">
-                            <a href="{used_primary_url}" 
-                               style="background: #007bff; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🎯 Used Primary Reply
-                            </a>
-                            <a href="{used_alt1_url}" 
-                               style="background: #6f42c1; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🔄 Used Alternative 1
-                            </a>
-                            <a href="{used_alt2_url}" 
-                               style="background: #e83e8c; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🔄 Used Alternative 2
-                            </a>
-                            <a href="{used_custom_url}" 
-                               style="background: #17a2b8; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ✏️ Used Custom Reply
-                            </a>
-                            <a href="{not_used_url}" 
-                               style="background: #6c757d; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ❌ Didn't Use
-                            </a>
-                        </div>
-                    </div>
-                    
-                    <div style="font-size: 10px; color: #868e96; margin-top: 8px;">
-                        Feedback ID: {feedback_id} | This data helps evolve voice and content quality over time
-                    </div>
-                </div>
-                
-                <div style="text-align: center; margin-top: 15px; padding: 10px; background: #ecf0f1; border-radius: 6px; font-size: 12px; color: #7f8c8d;">
-                    <strong>Quick Actions:</strong> 
-                    <a href="https://twitter.com/{opp.account_username}" style="color: #3498db; text-decoration: none; margin: 0 10px;">👤 View Profile</a> | 
-                    <a href="https://twitter.com/intent/follow?screen_name={opp.account_username}" style="color: #3498db; text-decoration: none; margin: 0 10px;">➕ Follow</a>
-                    {f' | <a href="https://twitter.com/intent/like?tweet_id={tweet_id}" style="color: #3498db; text-decoration: none; margin: 0 10px;">❤️ Like</a>' if tweet_id and tweet_id.isdigit() else ''}
-                </div>
-            </div>
-            """
-        
-        html_template = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>AI x Blockchain KOL Opportunities</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
-            <div style="background: #007bff; color: white; padding: 8px 15px; border-radius: 5px; margin-bottom: 20px; text-align: center; font-weight: bold;">
-                🤖 System Version: {SYSTEM_VERSION} (Feature Branch - Authentic Voice)
-            </div>
-            
-            <h1 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
-                {alert_type}
-            </h1>
-            
-            <p style="background: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107;">
-                <strong>Alert Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-                <strong>Description:</strong> {description}
-            </p>
-            
-            <h2 style="color: #2c3e50;">Opportunities Identified:</h2>
-            
-            {opportunities_html}
+            # Record alert
+            self._record_alert('priority', len(opportunities), opportunities)
             
-            <div style="margin-top: 30px; padding: 15px; background: #f8f9fa; border-radius: 5px;">
-                <h3 style="color: #2c3e50; margin-top: 0;">Next Steps:</h3>
-                <ol>
-                    <li>Review each opportunity for strategic alignment</li>
-                    <li>Prioritize based on account tier and overall score</li>
-                    <li>Craft responses that demonstrate technical expertise</li>
-                    <li>Engage within recommended timeframes</li>
-                    <li>Track engagement outcomes for optimization</li>
-                </ol>
-            </div>
+            logger.info(f"Sent priority alert for {len(opportunities)} opportunities")
             
-            <div style="margin-top: 20px; padding: 15px; background: #e8f5e8; border-radius: 5px; text-align: center;">
-                <p style="margin: 0;"><strong>AI x Blockchain KOL Development Platform</strong><br>
-                Automated monitoring and opportunity detection system</p>
-            </div>
-        </body>
-        </html>
-        """
+        except Exception as e:
+            logger.error(f"Error sending priority alert: {e}")
+    
+    def _generate_alert_html(self, alert_type: str, opportunities: List[AlertOpportunity], description: str) -> str:
+        """Generate enhanced HTML email content with generated replies and links"""
+        top_opportunities = heapq.nlargest(5, opportunities, key=lambda x: x.overall_score)
+        opportunities_html = [
+            _render_opportunity_card(_ALERT_OPPORTUNITY_HTML, i, opp)
+            for i, opp in enumerate(top_opportunities, 1)  # Limit to top 5
+        ]
         
-        return html_template
+        return _ALERT_DOCUMENT_HTML.format(
+            system_version=SYSTEM_VERSION,
+            alert_type=html.escape(alert_type),
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            description=html.escape(description),
+            opportunities_html="".join(opportunities_html)
+        )
     
     def _generate_detailed_alert_with_original_html(self, opportunities: List[AlertOpportunity], original_content: Dict) -> str:
         """Generate detailed HTML email with opportunities + original content + feedback tracking"""
-        import urllib.parse
-        
-        opportunities_html = ""
-        
-        # Generate opportunities section (same as detailed format)
-        for i, opp in enumerate(opportunities[:2], 1):  # Limit to 2 for readability with original content
-            emoji = "🔥" if opp.overall_score >= 0.8 else "⚡" if opp.overall_score >= 0.6 else "📊"
-            
-            # Generate enhanced tweet URLs - handle both real and test URLs
-            tweet_id = opp.content_url.split('/')[-1] if '/status/' in opp.content_url else None
-            
-            if tweet_id and tweet_id.isdigit():
-                # Real tweet ID - use reply intent
-                reply_url = f"https://twitter.com/intent/tweet?in_reply_to={tweet_id}&text={urllib.parse.quote(str(opp.generated_reply or ''))}"
-                quote_url = f"https://twitter.com/intent/tweet?url={opp.content_url}&text={urllib.parse.quote(str(opp.generated_reply or ''))}"
-            else:
-                # Test data or invalid URL - use general compose intent
-                reply_text = f"@{opp.account_username} {opp.generated_reply or ''}"
-                reply_url = f"https://twitter.com/intent/tweet?text={urllib.parse.quote(reply_text)}"
-                quote_url = f"https://twitter.com/intent/tweet?text={urllib.parse.quote(str(opp.generated_reply or ''))}"
-            
-            # Format alternative responses
-            alternatives_html = ""
-            if opp.alternative_responses:
-                for j, alt in enumerate(opp.alternative_responses[:2], 1):
-                    if tweet_id and tweet_id.isdigit():
-                        alt_reply_url = f"https://twitter.com/intent/tweet?in_reply_to={tweet_id}&text={urllib.parse.quote(str(alt))}"
-                    else:
-                        alt_reply_text = f"@{opp.account_username} {alt}"
-                        alt_reply_url = f"https://twitter.com/intent/tweet?text={urllib.parse.quote(alt_reply_text)}"
-                    alternatives_html += f"""
-                    <div style="background: #f0f0f0; padding: 8px; margin: 5px 0; border-radius: 4px; border-left: 3px solid #3498db;">
-                        <strong>Alternative {j}:</strong> {alt}<br>
-                        <a href="{alt_reply_url}" style="font-size: 12px; color: #3498db; text-decoration: none;">📝 Use This Reply</a>
-                    </div>
-                    """
-            
-            # Performance prediction indicators
-            engagement_color = "#27ae60" if opp.engagement_prediction and opp.engagement_prediction >= 0.7 else "#f39c12" if opp.engagement_prediction and opp.engagement_prediction >= 0.5 else "#e74c3c"
-            voice_color = "#27ae60" if opp.voice_alignment_score and opp.voice_alignment_score >= 0.8 else "#f39c12" if opp.voice_alignment_score and opp.voice_alignment_score >= 0.6 else "#e74c3c"
-            
-            # Feedback URLs for this opportunity
-            feedback_urls = opp.feedback_urls if opp.feedback_urls else {}
-            excellent_url = feedback_urls.get('excellent', '#')
-            good_url = feedback_urls.get('good', '#')
-            okay_url = feedback_urls.get('okay', '#')
-            poor_url = feedback_urls.get('poor', '#')
-            bad_url = feedback_urls.get('bad', '#')
-            used_primary_url = feedback_urls.get('used_primary', '#')
-            used_alt1_url = feedback_urls.get('used_alt1', '#')
-            used_alt2_url = feedback_urls.get('used_alt2', '#')
-            used_custom_url = feedback_urls.get('used_custom', '#')
-            not_used_url = feedback_urls.get('not_used', '#')
-            feedback_id = opp.feedback_id or 'N/A'
-            
-            opportunities_html += f"""
-            <div style="border: 1px solid #ddd; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fafafa;">
-                <h3 style="color: #2c3e50; margin-top: 0; border-bottom: 2px solid #3498db; padding-bottom: 8px;">
-                    {emoji} Opportunity {i}: @{opp.account_username}
-                </h3>
-                
-                <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #3498db;">
-                    <strong style="color: #2c3e50;">Original Content:</strong><br>
-                    <em>"{opp.content_text[:300]}{'...' if len(opp.content_text) > 300 else ''}"</em>
-                </div>
-                
-                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin: 15px 0; background: #f8f9fa; padding: 12px; border-radius: 6px;">
-                    <div><strong>Overall Score:</strong> <span style="color: {engagement_color};">{opp.overall_score:.2f}</span></div>
-                    <div><strong>AI x Blockchain:</strong> <span style="color: #8e44ad;">{opp.ai_blockchain_relevance:.2f}</span></div>
-                    <div><strong>Technical Depth:</strong> <span style="color: #d35400;">{opp.technical_depth:.2f}</span></div>
-                </div>
-                
-                <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #27ae60;">
-                    <strong style="color: #27ae60;">🤖 AI-Generated Response:</strong><br>
-                    <div style="background: #fff; padding: 12px; margin: 8px 0; border-radius: 6px; font-style: italic; border: 1px solid #ddd;">
-                        "{opp.generated_reply or 'Response generation in progress...'}"
-                    </div>
-                    
-                    {f'<div style="font-size: 12px; color: #666; margin-top: 8px;"><strong>Reasoning:</strong> {opp.reply_reasoning}</div>' if opp.reply_reasoning else ''}
-                    
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 10px; font-size: 12px;">
-                        <div>📈 <strong>Engagement Prediction:</strong> <span style="color: {engagement_color};">{(opp.engagement_prediction or 0):.0%}</span></div>
-                        <div>🎭 <strong>Voice Alignment:</strong> <span style="color: {voice_color};">{(opp.voice_alignment_score or 0):.0%}</span></div>
-                    </div>
-                </div>
-                
-                {f'<div style="margin: 15px 0;"><strong style="color: #8e44ad;">🔄 Alternative Responses:</strong>{alternatives_html}</div>' if alternatives_html else ''}
-                
-                <div style="margin: 20px 0; text-align: center;">
-                    <a href="{opp.content_url}" 
-                       style="background: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        🔗 View Original Tweet
-                    </a>
-                    
-                    <a href="{reply_url}" 
-                       style="background: #27ae60; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        💬 Reply with Generated Content
-                    </a>
-                    
-                    <a href="{quote_url}" 
-                       style="background: #e67e22; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                        🔄 Quote Tweet
-                    </a>
-                </div>
-                
-                <!-- Feedback Section -->
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #6c757d;">
-                    <strong style="color: #495057;">📊 Feedback & Learning</strong><br>
-                    <div style="margin: 10px 0; font-size: 12px; color: #6c757d;">
-                        Help improve voice evolution by rating this opportunity and tracking reply usage:
-                    </div>
-                    
-                    <!-- Quality Rating Buttons -->
-                    <div style="margin: 8px 0;">
-                        <strong style="font-size: 12px; color: #495057;">Opportunity Quality:</strong><br>
-                        <div style="margin: 5px 0;">
-                            <a href="{excellent_url}" 
-                               style="background: #28a745; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐⭐⭐ Excellent
-                            </a>
-                            <a href="{good_url}" 
-                               style="background: #20c997; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐⭐ Good
-                            </a>
-                            <a href="{okay_url}" 
-                               style="background: #ffc107; color: black; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐⭐ Okay
-                            </a>
-                            <a href="{poor_url}" 
-                               style="background: #fd7e14; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐⭐ Poor
-                            </a>
-                            <a href="{bad_url}" 
-                               style="background: #dc3545; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ⭐ Bad
-                            </a>
-                        </div>
-                    </div>
-                    
-                    <!-- Reply Usage Tracking -->
-                    <div style="margin: 8px 0;">
-                        <strong style="font-size: 12px; color: #495057;">Reply Usage (click after posting):</strong><br>
-                        <div style="margin: 5px 0;">
-                            <a href="{used_primary_url}" 
-                               style="background: #007bff; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🎯 Used Primary Reply
-                            </a>
-                            <a href="{used_alt1_url}" 
-                               style="background: #6f42c1; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🔄 Used Alternative 1
-                            </a>
-                            <a href="{used_alt2_url}" 
-                               style="background: #e83e8c; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                🔄 Used Alternative 2
-                            </a>
-                            <a href="{used_custom_url}" 
-                               style="background: #17a2b8; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ✏️ Used Custom Reply
-                            </a>
-                            <a href="{not_used_url}" 
-                               style="background: #6c757d; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                                ❌ Didn't Use
-                            </a>
-                        </div>
-                    </div>
-                    
-                    <div style="font-size: 10px; color: #868e96; margin-top: 8px;">
-                        Feedback ID: {feedback_id} | This data helps evolve voice and content quality over time
-                    </div>
-                </div>
-            </div>
-            """
+        # Limit to 2 for readability with original content
+        opportunities_html = "".join(
+            _render_opportunity_card(_DETAILED_OPPORTUNITY_HTML, i, opp)
+            for i, opp in enumerate(opportunities[:2], 1)
+        )
         
         # Generate original content section with feedback
-        original_text = urllib.parse.quote(str(original_content['content']))
         content_type = original_content.get('content_type', 'unknown')
         content_id = original_content.get('feedback_id', f"orig_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         
@@ -1329,148 +1958,166 @@ class CronMonitorSystem:
         original_feedback_urls = self.feedback_tracker.generate_feedback_urls(content_id)
         # Add special URLs for original content
         original_feedback_urls['used'] = original_feedback_urls.get('used_primary', '#')
-        original_feedback_urls['not_used'] = original_feedback_urls.get('not_used', '#')
         
-        original_html = f"""
-        <div style="border: 2px solid #e74c3c; margin: 20px 0; padding: 20px; border-radius: 10px; background: #fff5f5;">
-            <h3 style="color: #e74c3c; margin-top: 0; border-bottom: 2px solid #e74c3c; padding-bottom: 8px;">
-                🚀 Original Content ({content_type.replace('_', ' ').title()})
-            </h3>
-            
-            <div style="background: #fff; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #e74c3c;">
-                <strong style="color: #2c3e50;">Generated Content:</strong><br>
-                <div style="font-weight: bold; font-size: 16px; font-style: italic; margin: 10px 0; padding: 12px; background: #f8f9fa; border-radius: 6px;">
-                    "{original_content['content']}"
-                </div>
-                {f'<div style="font-size: 12px; color: #666;"><strong>Engagement Bait:</strong> {"Yes" if original_content.get("engagement_bait") else "No"}</div>' if 'engagement_bait' in original_content else ''}
-            </div>
-            
-            <div style="margin: 20px 0; text-align: center;">
-                <a href="https://twitter.com/intent/tweet?text={original_text}" 
-                   style="background: #e74c3c; color: white; padding: 12px 20px; text-decoration: none; border-radius: 6px; margin: 5px; display: inline-block; font-weight: bold;">
-                    📤 Post This Content
-                </a>
-            </div>
-            
-            <!-- Original Content Feedback Section -->
-            <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #6c757d;">
-                <strong style="color: #495057;">📊 Original Content Feedback</strong><br>
-                <div style="margin: 10px 0; font-size: 12px; color: #6c757d;">
-                    Rate the quality of this generated content:
-                </div>
-                
-                <!-- Quality Rating Buttons -->
-                <div style="margin: 8px 0;">
-                    <strong style="font-size: 12px; color: #495057;">Content Quality:</strong><br>
-                    <div style="margin: 5px 0;">
-                        <a href="{original_feedback_urls['excellent']}" 
-                           style="background: #28a745; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ⭐⭐⭐⭐⭐ Excellent
-                        </a>
-                        <a href="{original_feedback_urls['good']}" 
-                           style="background: #20c997; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ⭐⭐⭐⭐ Good
-                        </a>
-                        <a href="{original_feedback_urls['okay']}" 
-                           style="background: #ffc107; color: black; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ⭐⭐⭐ Okay
-                        </a>
-                        <a href="{original_feedback_urls['poor']}" 
-                           style="background: #fd7e14; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ⭐⭐ Poor
-                        </a>
-                        <a href="{original_feedback_urls['bad']}" 
-                           style="background: #dc3545; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ⭐ Bad
-                        </a>
-                    </div>
-                </div>
-                
-                <!-- Usage Tracking -->
-                <div style="margin: 8px 0;">
-                    <strong style="font-size: 12px; color: #495057;">Usage (click after posting):</strong><br>
-                    <div style="margin: 5px 0;">
-                        <a href="{original_feedback_urls['used']}" 
-                           style="background: #007bff; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ✅ Posted This Content
-                        </a>
-                        <a href="{original_feedback_urls['not_used']}" 
-                           style="background: #6c757d; color: white; padding: 4px 8px; text-decoration: none; border-radius: 3px; margin: 2px; font-size: 11px; display: inline-block;">
-                            ❌ Didn't Post
-                        </a>
-                    </div>
-                </div>
-                
-                <div style="font-size: 10px; color: #868e96; margin-top: 8px;">
-                    Content ID: {content_id} | This feedback helps improve original content generation
-                </div>
-            </div>
-        </div>
-        """
+        original_html = _ORIGINAL_CONTENT_HTML.format(
+            content_type_label=html.escape(_pretty_label(content_type)),
+            content=html.escape(str(original_content['content'])),
+            engagement_bait_html=_ORIGINAL_ENGAGEMENT_BAIT_HTML.format(
+                engagement_bait="Yes" if original_content.get('engagement_bait') else "No"
+            ) if 'engagement_bait' in original_content else '',
+            post_url=html.escape(_COMPOSE_INTENT_URL.format(text=urllib.parse.quote(str(original_content['content'])))),
+            content_id=html.escape(str(content_id)),
+            **{field: html.escape(original_feedback_urls.get(key, '#'))
+               for key, field in _ORIGINAL_FEEDBACK_URL_FIELDS}
+        )
         
-        html_template = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>AI x Blockchain Opportunities + Original Content</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
-            <div style="background: #007bff; color: white; padding: 8px 15px; border-radius: 5px; margin-bottom: 20px; text-align: center; font-weight: bold;">
-                🤖 System Version: {SYSTEM_VERSION} (Feature Branch - Authentic Voice)
-            </div>
-            
-            <h1 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
-                🎯 AI x Blockchain Opportunities + Original Content
-            </h1>
-            
-            <p style="background: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107;">
-                <strong>Alert Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-                <strong>Content Mix:</strong> {len(opportunities)} opportunities + 1 {content_type.replace('_', ' ')}
-            </p>
-            
-            {f'<h2 style="color: #2c3e50;">High-Priority Opportunities:</h2>{opportunities_html}' if opportunities else ''}
-            
-            <h2 style="color: #e74c3c;">Original Content for Engagement:</h2>
-            {original_html}
-            
-            <div style="margin-top: 30px; padding: 15px; background: #f8f9fa; border-radius: 5px;">
-                <h3 style="color: #2c3e50; margin-top: 0;">Next Steps:</h3>
-                <ol>
-                    {f'<li>Review and engage with priority opportunities above</li>' if opportunities else ''}
-                    <li>Consider posting the original content for engagement</li>
-                    <li>Use feedback buttons to help improve AI content quality</li>
-                    <li>Track which content performs best for voice evolution</li>
-                </ol>
-            </div>
-            
-            <div style="margin-top: 20px; padding: 15px; background: #e8f5e8; border-radius: 5px; text-align: center;">
-                <p style="margin: 0;"><strong>AI x Blockchain KOL Development Platform</strong><br>
-                Detailed monitoring with feedback-driven voice evolution</p>
-            </div>
-        </body>
-        </html>
-        """
+        return _DETAILED_DOCUMENT_HTML.format(
+            system_version=SYSTEM_VERSION,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            opportunity_count=len(opportunities),
+            content_type_text=html.escape(content_type.replace('_', ' ')),
+            opportunities_section_html=_DETAILED_OPPORTUNITIES_SECTION_HTML.format(
+                opportunities_html=opportunities_html
+            ) if opportunities else '',
+            original_html=original_html,
+            review_step_html=_DETAILED_REVIEW_STEP_HTML if opportunities else ''
+        )
+    
+    def _get_recipients(self) -> List[str]:
+        """Split the configured to_email into individual recipient addresses"""
+        return [addr.strip() for addr in self.config.to_email.split(',') if addr.strip()]
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the live SMTP connection, reconnecting when it was never opened or the server dropped it"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_smtp()
         
-        return html_template
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.config.email_username, self.config.email_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def _drop_smtp(self):
+        """Forget the current SMTP connection without talking to the server"""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+    
+    def _close_smtp(self):
+        """Politely end the persistent SMTP connection on shutdown"""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_smtp()
+    
+    def _deliver_batch(self, batch: List[tuple]) -> List:
+        """Blocking SMTP delivery of several messages over the persistent authenticated session"""
+        results = []
+        with self._smtp_lock:
+            server = None
+            for msg, recipients in batch:
+                # One MAIL FROM / DATA transaction covers every recipient
+                try:
+                    if server is None:
+                        server = self._get_smtp()
+                    try:
+                        response = server.send_message(msg, to_addrs=recipients)
+                    except smtplib.SMTPServerDisconnected:
+                        # Dropped between the NOOP check and this message - reconnect once
+                        self._drop_smtp()
+                        server = self._get_smtp()
+                        response = server.send_message(msg, to_addrs=recipients)
+                    results.append(str(response) if response else "250 OK")
+                except (smtplib.SMTPException, OSError) as e:
+                    # The session may be mid-transaction; the next message starts on a fresh one
+                    self._drop_smtp()
+                    server = None
+                    results.append(e)
+        return results
+    
+    def _deliver_message(self, msg: MIMEMultipart, recipients: List[str]) -> str:
+        """Blocking SMTP delivery - runs in a worker thread via asyncio.to_thread"""
+        result = self._deliver_batch([(msg, recipients)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    async def _submit_email(self, msg: MIMEMultipart, recipients: List[str]) -> str:
+        """Queue a message for the batching sender, or deliver inline when it isn't running"""
+        if self._email_task is not None and not self._email_task.done():
+            future = asyncio.get_running_loop().create_future()
+            self._email_queue.put_nowait((msg, recipients, future))
+            return await future
+        return await asyncio.to_thread(self._deliver_message, msg, recipients)
+    
+    async def _email_delivery_loop(self):
+        """Group alerts queued close together into one SMTP session"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._email_queue.get()]
+            try:
+                deadline = loop.time() + _EMAIL_BATCH_WAIT_SECONDS
+                while len(batch) < _EMAIL_BATCH_MAX:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._email_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                try:
+                    results = await asyncio.to_thread(
+                        self._deliver_batch, [(msg, recipients) for msg, recipients, _ in batch]
+                    )
+                except Exception as e:
+                    # Connection or login failed - every message in the batch failed with it
+                    results = [e] * len(batch)
+            except asyncio.CancelledError:
+                # Shutting down - release the senders waiting on this batch
+                for _, _, future in batch:
+                    future.cancel()
+                raise
+            
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
     
     async def _send_email(self, subject: str, html_content: str, alert_type: str = "unknown", opportunity_count: int = 0):
         """Send email alert with enhanced logging"""
         smtp_response = None
         try:
+            recipients = self._get_recipients()
+            
             msg = MIMEMultipart('alternative')
             msg['Subject'] = subject
             msg['From'] = self.config.from_email
-            msg['To'] = self.config.to_email
+            msg['To'] = ', '.join(recipients)
             
-            html_part = MIMEText(html_content, 'html')
+            # Explicit charset skips MIMEText's trial us-ascii encode of the whole document
+            html_part = MIMEText(html_content, 'html', 'utf-8')
             msg.attach(html_part)
             
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                server.starttls()
-                server.login(self.config.email_username, self.config.email_password)
-                response = server.send_message(msg)
-                smtp_response = str(response) if response else "250 OK"
+            # Keep the event loop free while the SMTP round trips are in flight
+            smtp_response = await self._submit_email(msg, recipients)
             
             # Log successful email
             self.email_logger.log_email_attempt(
@@ -1530,11 +2177,12 @@ class CronMonitorSystem:
     
     def _record_alert(self, alert_type: str, opportunity_count: int, opportunities: List[AlertOpportunity] = None):
         """Record alert in history with opportunity details"""
+        now = datetime.now()
         alert_record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'type': alert_type,
             'opportunity_count': opportunity_count,
-            'work_hours': self._is_work_hours(datetime.now())
+            'work_hours': self._is_work_hours(now)
         }
         
         # Add opportunity IDs and summary details for deduplication tracking
@@ -1549,21 +2197,30 @@ class CronMonitorSystem:
             ]
         
         self.alert_history.append(alert_record)
-        self._save_alert_history()
+        self._total_alerts_sent += 1
+        date_key = now.date().isoformat()
+        if date_key != self._alert_counts_date:
+            self._alert_counts_date = date_key
+            self._alert_counts_today = defaultdict(int)
+        self._alert_counts_today[alert_type] += 1
+        # Keep only the last _MAX_ALERT_HISTORY alerts so each save stays bounded
+        if len(self.alert_history) > _MAX_ALERT_HISTORY:
+            del self.alert_history[:-_MAX_ALERT_HISTORY]
+        self._request_save('alerts')
     
     async def _check_daily_digest(self):
         """Check if daily digest should be sent"""
         current_time = datetime.now()
         
-        # Send digest at 6 PM if we haven't sent one today
-        if (current_time.hour == 18 and 
-            (not self.last_digest_sent or 
-             self.last_digest_sent.date() < current_time.date())):
-            
-            await self._send_daily_digest()
+        # Send digest at 6 PM if we haven't sent one today; every other hour is a single int compare
+        if current_time.hour != 18:
+            return
+        
+        if self._last_digest_date != current_time.date():
+            await self._send_daily_digest(current_time)
     
-    async def _send_daily_digest(self):
-        """Send daily digest of all opportunities"""
+    async def _send_daily_digest(self, now: Optional[datetime] = None):
+        """Send daily digest of all opportunities, stamped with the time the digest was due"""
         try:
             if not self.daily_opportunities:
                 logger.info("No opportunities for daily digest")
@@ -1581,7 +2238,8 @@ class CronMonitorSystem:
             
             subject = f"📊 Daily AI x Blockchain Opportunities Digest - {len(digest_opportunities)} Opportunities"
             
-            html_content = self._generate_alert_html(
+            html_content = await asyncio.to_thread(
+                self._generate_alert_html,
                 "DAILY OPPORTUNITIES DIGEST",
                 digest_opportunities,
                 f"Summary of all AI x blockchain opportunities discovered today. {len(digest_opportunities)} opportunities above quality threshold."
@@ -1594,7 +2252,8 @@ class CronMonitorSystem:
             
             # Reset daily opportunities
             self.daily_opportunities = []
-            self.last_digest_sent = datetime.now()
+            self.last_digest_sent = now or datetime.now()
+            self._last_digest_date = self.last_digest_sent.date()
             
             logger.info(f"Sent daily digest with {len(digest_opportunities)} opportunities")
             
@@ -1605,21 +2264,12 @@ class CronMonitorSystem:
         """Stop continuous monitoring"""
         logger.info("Stopping continuous monitoring")
         self.monitoring_active = False
+        self._save_user_id_cache()
     
     def _get_focused_keywords(self) -> List[str]:
         """Get dynamic keywords using rotation strategy for organic search behavior"""
         # Randomly choose strategy to feel more organic
-        strategies = [
-            ("focused", 0.3),     # Core AI x blockchain focus
-            ("narrative", 0.25),  # Follow current narratives  
-            ("mixed", 0.35),      # Organic mix - most realistic
-            ("broad", 0.1)        # Occasionally go broad
-        ]
-        
-        strategy = random.choices(
-            [s[0] for s in strategies],
-            weights=[s[1] for s in strategies]
-        )[0]
+        strategy = _KEYWORD_STRATEGIES[bisect_right(_KEYWORD_STRATEGY_CUM_WEIGHTS, random.random())]
         
         # Get 3-6 keywords to feel natural (not always the same number)
         keyword_count = random.randint(3, 6)
@@ -1640,37 +2290,15 @@ class CronMonitorSystem:
         
         # This would ideally analyze recent high-engagement tweets
         # For now, we'll rotate through predefined narrative sets
-        narrative_sets = [
-            {
-                "primary": ["v4 hooks", "autonomous agents", "mev protection"],
-                "secondary": ["restaking yields", "modular defi", "cross-chain"],
-                "emerging": ["intents", "account abstraction", "zk coprocessors"]
-            },
-            {
-                "primary": ["ai trading bots", "on-chain ai", "predictive routing"],
-                "secondary": ["real yield", "ve tokenomics", "liquidity wars"],
-                "emerging": ["based rollups", "preconfirmations", "blob markets"]
-            },
-            {
-                "primary": ["unichain launch", "hook marketplace", "concentrated liquidity"],
-                "secondary": ["stablecoin yields", "delta neutral", "perp dexes"],
-                "emerging": ["social trading", "copy trading", "prediction markets"]
-            }
-        ]
-        
-        # Pick a narrative set with some randomness
-        narrative_set = random.choice(narrative_sets)
+        base = random.choice(_NARRATIVE_SETS)
+        narrative_set = {tier: list(terms) for tier, terms in base.items()}
         
         # Add some trending topics based on "market mood"
-        market_moods = ["bullish", "crabbing", "accumulating", "rotating"]
-        current_mood = random.choice(market_moods)
-        
-        if current_mood == "bullish":
-            narrative_set["primary"].append("moonshot plays")
-            narrative_set["secondary"].append("leverage farming")
-        elif current_mood == "accumulating":
-            narrative_set["primary"].append("value plays")
-            narrative_set["secondary"].append("stable farming")
+        current_mood = random.choice(_MARKET_MOODS)
+        mood_terms = _MOOD_NARRATIVES.get(current_mood)
+        if mood_terms:
+            narrative_set["primary"].append(mood_terms[0])
+            narrative_set["secondary"].append(mood_terms[1])
             
         self.keyword_rotator.update_trending_narratives(narrative_set)
         logger.info(f"Updated narratives with {current_mood} market mood")
@@ -1686,34 +2314,10 @@ class CronMonitorSystem:
                 current_vibe = self.keyword_rotator.get_current_vibe()
                 current_narratives = self.keyword_rotator.current_narratives["primary"][:3]
                 
-                prompt = """
-                Generate an authentic tweet as a SingleDivorcedDad sprotogremlin who works in crypto.
-                
-                Voice characteristics:
-                - Sprotogremlin energy: slightly chaotic, degen, but knowledgeable
-                - 42-year-old single dad wisdom mixed with crypto gremlin vibes
-                - Technical knowledge but expressed casually, not like a press release
-                - Slightly unhinged but endearing dad energy
-                - NO corporate speak, NO buzzwords, NO "alpha opportunities"
-                
-                Topics to choose from:
-                - Dad life meets crypto chaos
-                - Random crypto observations while doing dad stuff
-                - Slightly technical takes but in gremlin language
-                - Life lessons applied to defi/crypto
-                - Overemployed dad managing crypto and kids
-                
-                Style:
-                - Conversational and relatable
-                - No hashtags, no emojis
-                - Max 280 characters
-                - Sound like a real person, not a bot
-                
-                Return only the tweet text, no additional formatting.
-                """
+                prompt = _TRENDING_CONTENT_PROMPT
                 
                 if self.claude_client:
-                    async with self.claude_client:
+                    async with self._claude_session():
                         response = await self.claude_client._make_api_call("messages", {
                             "model": "claude-3-haiku-20240307",
                             "max_tokens": 150,
@@ -1733,31 +2337,10 @@ class CronMonitorSystem:
             
             elif content_type == "unhinged_take":
                 # Generate sprotogremlin unhinged take
-                prompt = """
-                Generate a slightly unhinged sprotogremlin take as a SingleDivorcedDad who works in crypto.
-                
-                Voice: Chaotic gremlin energy with dad wisdom
-                Style: Slightly unhinged but endearing, no corporate speak
-                Length: Max 280 characters
-                
-                Examples of authentic gremlin energy:
-                - Random observations that are oddly insightful
-                - Dad analogies applied to crypto in weird ways
-                - Slightly chaotic takes that somehow make sense
-                - Overemployed dad managing too many things at once
-                
-                DO NOT use:
-                - "Hot take:" or "Unpopular opinion:"
-                - Technical jargon without context
-                - Buzzwords like "alpha" or "ecosystem"
-                - Anything that sounds like marketing
-                
-                Sound like a real person having a random thought, not a crypto influencer.
-                Return only the tweet text.
-                """
+                prompt = _UNHINGED_CONTENT_PROMPT
                 
                 if self.claude_client:
-                    async with self.claude_client:
+                    async with self._claude_session():
                         response = await self.claude_client._make_api_call("messages", {
                             "model": "claude-3-haiku-20240307",
                             "max_tokens": 150,
@@ -1791,15 +2374,10 @@ class CronMonitorSystem:
         current_time = datetime.now()
         
         # Count alerts by type today
-        today_alerts = [
-            alert for alert in self.alert_history
-            if datetime.fromisoformat(alert['timestamp']).date() == current_time.date()
-        ]
-        
-        alert_counts = {}
-        for alert in today_alerts:
-            alert_type = alert['type']
-            alert_counts[alert_type] = alert_counts.get(alert_type, 0) + 1
+        if self._alert_counts_date == current_time.date().isoformat():
+            alert_counts = dict(self._alert_counts_today)
+        else:
+            alert_counts = {}
         
         stats = {
             'monitoring_active': self.monitoring_active,
@@ -1807,7 +2385,7 @@ class CronMonitorSystem:
             'monitoring_interval': self.config.monitoring_interval,
             'daily_opportunities': len(self.daily_opportunities),
             'alerts_today': alert_counts,
-            'total_alerts_sent': len(self.alert_history),
+            'total_alerts_sent': self._total_alerts_sent,
             'last_digest_sent': self.last_digest_sent.isoformat() if self.last_digest_sent else None,
             'email_configured': bool(self.config.smtp_server and self.config.to_email)
         }
@@ -3,20 +3,58 @@ Enhanced Rate Limiting System for X API Optimization
 Ultra-smart rate limiting with caching, priority queuing, and follower growth optimization
 """
 
+import os
 import time
-import json
 import asyncio
+import heapq
+import itertools
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 import hashlib
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
 
-@dataclass
+# Cache inserts within this window are written to disk together
+_CACHE_FLUSH_SECONDS = 5
+# Least recently used responses are evicted past either bound
+_CACHE_MAX_ENTRIES = 10000
+_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Single-ID lookups queued within the window are sent as one request of up to 100 IDs
+_BATCHED_ENDPOINTS = frozenset({'user_lookup', 'tweet_lookup'})
+_BATCH_WINDOW_SECONDS = 0.1
+_BATCH_MAX_IDS = 100
+
+# Write endpoints that share the daily posting budget and pacing rules
+_POST_ENDPOINTS = frozenset({'create_tweet', 'create_reply', 'retweet'})
+
+# Free-text search params; X search ignores case and spacing apart from the OR operator
+_QUERY_PARAM_KEYS = frozenset({'q', 'query'})
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase and single-space a search query, keeping OR uppercase"""
+    return " ".join(term if term == "OR" else term.lower() for term in query.split())
+
+
+def _normalize_params(params: Dict) -> Dict:
+    """Cache-key form of request params, so trivially different searches share an entry"""
+    normalized = {}
+    for key, value in params.items():
+        if key in _QUERY_PARAM_KEYS and isinstance(value, str):
+            value = _normalize_query(value)
+        elif isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+            # Field lists like tweet_fields are order-insensitive
+            value = sorted(value)
+        normalized[key] = value
+    return normalized
+
+@dataclass(slots=True)
 class CachedRequest:
     """Cached API request to avoid duplicates"""
     endpoint: str
@@ -24,8 +62,9 @@ class CachedRequest:
     response_data: Any
     cached_at: float
     expires_at: float
+    size_bytes: int = 0  # Encoded response size, measured once at insert
 
-@dataclass
+@dataclass(slots=True)
 class PriorityRequest:
     """Priority-queued API request"""
     endpoint: str
@@ -33,8 +72,12 @@ class PriorityRequest:
     priority: int  # 1=highest, 5=lowest
     scheduled_at: float
     retry_count: int = 0
+    cache_key: Optional[str] = None  # Key computed at lookup, reused when caching the response
+    cache_ttl: int = 300
+    # Resolved by the queue dispatcher with the response (or the final error)
+    done: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitMetrics:
     """Rate limit usage analytics"""
     endpoint: str
@@ -74,59 +117,174 @@ class EnhancedRateLimiter:
         }
         
         # Request tracking
-        self.request_history = defaultdict(list)
+        self.request_history = defaultdict(deque)  # Call times per endpoint, oldest first
         self.backoff_until = {}
+        # Heap of (priority, scheduled_at, seq, request); requests whose waiter has gone
+        # away are skipped lazily when they reach the head
         self.priority_queue = []
+        self._queue_seq = itertools.count()
+        self._queue_changed = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        
+        # Pending single-ID lookups per batched endpoint, flushed by a timer or when full
+        self._pending_batches: Dict[str, List[Tuple[Dict, str, int, int, asyncio.Future]]] = defaultdict(list)
+        self._batch_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._batch_tasks: set = set()
         
         # Caching system
-        self.request_cache = {}
+        self.request_cache: OrderedDict = OrderedDict()  # LRU order, most recent last
+        self._cache_bytes = 0
         self.cache_file = self.cache_dir / "request_cache.json"
-        self._load_cache()
-        
-        # Analytics
+        # The cache file is read in a worker thread on first lookup rather than here
+        self._cache_load: Optional[asyncio.Task] = None
+        self._cache_dirty = asyncio.Event()
+        self._cache_flusher: Optional[asyncio.Task] = None
+        
+        # Analytics; each endpoint's count is the last value drawn from its day counter.
+        # Like the rest of the limiter, this is only updated from the event loop thread
+        self._day_counters = defaultdict(self._new_day_counter)
         self.daily_usage = defaultdict(int)
         self.usage_analytics = {}
         
         # Follower growth optimization
-        self.peak_engagement_hours = [12, 18, 21]  # 12pm, 6pm, 9pm EST
+        self.peak_engagement_hours = frozenset({12, 18, 21})  # 12pm, 6pm, 9pm EST
+        # Hours from each hour of the day to the start of the next (strictly later) peak hour
+        self._hours_to_next_peak = tuple(
+            min((peak - hour - 1) % 24 + 1 for peak in self.peak_engagement_hours)
+            for hour in range(24)
+        )
         self.min_interval_between_posts = 1800  # 30 minutes minimum
-        self.last_post_time = 0
+        # Interval bookkeeping (call history, backoffs, queue schedule, last post) uses
+        # time.monotonic() so wall-clock adjustments can't stall or burst requests
+        self.last_post_time = float('-inf')
+        
+        # Local hour and the wall-clock time it stays valid until
+        self._hour_cache = (-1, 0.0)
         
         logger.info("Enhanced rate limiter initialized with follower growth optimization")
     
-    def _load_cache(self):
-        """Load request cache from disk"""
+    def _read_cache_file(self) -> List[Tuple[str, CachedRequest]]:
+        """Read unexpired cache entries from disk; expired ones are skipped before any object is built"""
+        if not self.cache_file.exists():
+            return []
+        with open(self.cache_file, 'rb') as f:
+            cache_data = orjson.loads(f.read())
+        
+        now = time.time()
+        return [
+            (key, CachedRequest(**data))
+            for key, data in cache_data.items()
+            if data['expires_at'] > now
+        ]
+    
+    async def _load_cache(self):
+        """Load request cache from disk without blocking the event loop"""
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    
-                now = time.time()
-                for key, data in cache_data.items():
-                    if data['expires_at'] > now:
-                        self.request_cache[key] = CachedRequest(**data)
-                        
-                logger.info(f"Loaded {len(self.request_cache)} cached requests")
+            entries = await asyncio.to_thread(self._read_cache_file)
         except Exception as e:
             logger.error(f"Error loading cache: {e}")
+            return
+        
+        for key, cached_req in entries:
+            self._store_cached_request(key, cached_req)
+        logger.info(f"Loaded {len(self.request_cache)} cached requests")
+    
+    async def _ensure_cache_loaded(self):
+        """Wait for the one-time cache load, starting it on the first call"""
+        if self._cache_load is None:
+            self._cache_load = asyncio.create_task(self._load_cache())
+        if not self._cache_load.done():
+            await asyncio.shield(self._cache_load)
+    
+    def _store_cached_request(self, key: str, cached_req: CachedRequest):
+        """Insert as most recently used, evicting the least recently used past the size caps"""
+        self._drop_cached_request(key)
+        self.request_cache[key] = cached_req
+        self._cache_bytes += cached_req.size_bytes
+        
+        while self.request_cache and (
+            len(self.request_cache) > _CACHE_MAX_ENTRIES or self._cache_bytes > _CACHE_MAX_BYTES
+        ):
+            _, evicted = self.request_cache.popitem(last=False)
+            self._cache_bytes -= evicted.size_bytes
+    
+    def _drop_cached_request(self, key: str):
+        """Remove a cache entry if present"""
+        cached_req = self.request_cache.pop(key, None)
+        if cached_req is not None:
+            self._cache_bytes -= cached_req.size_bytes
+    
+    def _sweep_expired_cache(self):
+        """Drop expired entries so they aren't kept in memory or written back to disk"""
+        now = time.time()
+        for key in [k for k, cached_req in self.request_cache.items() if cached_req.expires_at <= now]:
+            self._drop_cached_request(key)
+    
+    def _cache_payload(self) -> bytes:
+        """Encode the request cache for disk"""
+        # orjson serializes the dataclasses natively, skipping asdict()'s deep copy of every response
+        return orjson.dumps(self.request_cache, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _write_cache(self, payload: bytes):
+        """Atomically replace the cache file with an encoded payload"""
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.cache_file)
     
     def _save_cache(self):
         """Save request cache to disk"""
         try:
-            cache_data = {
-                key: asdict(cached_req) 
-                for key, cached_req in self.request_cache.items()
-            }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            self._write_cache(self._cache_payload())
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
     
+    def _request_cache_save(self):
+        """Mark the cache dirty for the background flusher, or save inline outside an event loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_cache()
+            return
+        
+        self._cache_dirty.set()
+        if self._cache_flusher is None or self._cache_flusher.done():
+            self._cache_flusher = asyncio.create_task(self._cache_flush_loop())
+    
+    async def _cache_flush_loop(self):
+        """Coalesce cache inserts into at most one write per flush window, off the event loop"""
+        while True:
+            await self._cache_dirty.wait()
+            await asyncio.sleep(_CACHE_FLUSH_SECONDS)
+            self._cache_dirty.clear()
+            try:
+                # Encode on the loop so the thread never sees the dict mid-mutation
+                self._sweep_expired_cache()
+                payload = self._cache_payload()
+                await asyncio.to_thread(self._write_cache, payload)
+            except Exception as e:
+                logger.error(f"Error saving cache: {e}")
+    
+    async def close(self):
+        """Stop the background cache flusher and write any pending entries"""
+        if self._cache_flusher is not None:
+            self._cache_flusher.cancel()
+            await asyncio.gather(self._cache_flusher, return_exceptions=True)
+            self._cache_flusher = None
+        if self._cache_dirty.is_set():
+            self._cache_dirty.clear()
+            await asyncio.to_thread(self._save_cache)
+    
     def _generate_cache_key(self, endpoint: str, params: Dict) -> str:
         """Generate cache key for request"""
-        # Create deterministic hash of endpoint + params
-        content = f"{endpoint}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # Deterministic hash of endpoint + params; orjson sorts nested keys too, and the key
+        # only needs to be stable, not cryptographic
+        key_hash = hashlib.blake2b(endpoint.encode(), digest_size=16)
+        key_hash.update(b":")
+        key_hash.update(orjson.dumps(
+            _normalize_params(params), option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ))
+        return key_hash.hexdigest()
     
     async def get_cached_or_request(self, endpoint: str, params: Dict, 
                                   cache_ttl: int = 300, priority: int = 3) -> Tuple[Any, bool]:
@@ -134,72 +292,147 @@ class EnhancedRateLimiter:
         Get cached result or queue new request with priority
         Returns: (result, from_cache)
         """
+        await self._ensure_cache_loaded()
         cache_key = self._generate_cache_key(endpoint, params)
         
         # Check cache first
         if cache_key in self.request_cache:
             cached_req = self.request_cache[cache_key]
             if cached_req.expires_at > time.time():
-                logger.debug(f"Cache hit for {endpoint}")
+                self.request_cache.move_to_end(cache_key)
+                logger.debug("Cache hit for %s", endpoint)
                 return cached_req.response_data, True
             else:
-                del self.request_cache[cache_key]
+                self._drop_cached_request(cache_key)
+        
+        # Coalesce single-ID lookups into one multi-ID request
+        if endpoint in _BATCHED_ENDPOINTS and params.keys() == {'id'}:
+            return await self._queue_batched_lookup(endpoint, params, cache_key, cache_ttl, priority), False
         
         # Queue new request
-        return await self._queue_priority_request(endpoint, params, priority, cache_ttl)
+        return await self._queue_priority_request(endpoint, params, priority, cache_ttl, cache_key)
+    
+    async def _queue_batched_lookup(self, endpoint: str, params: Dict, cache_key: str,
+                                    cache_ttl: int, priority: int) -> Any:
+        """Add a single-ID lookup to the endpoint's pending batch and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending_batches[endpoint]
+        pending.append((params, cache_key, cache_ttl, priority, future))
+        
+        if len(pending) >= _BATCH_MAX_IDS:
+            self._flush_batch(endpoint)
+        elif endpoint not in self._batch_timers:
+            self._batch_timers[endpoint] = loop.call_later(_BATCH_WINDOW_SECONDS, self._flush_batch, endpoint)
+        
+        return await future
+    
+    def _flush_batch(self, endpoint: str):
+        """Send the endpoint's pending lookups as one request"""
+        timer = self._batch_timers.pop(endpoint, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending_batches.pop(endpoint, None)
+        if not batch:
+            return
+        
+        # Keep a reference so the task isn't garbage collected mid-request
+        task = asyncio.create_task(self._execute_batch(endpoint, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
     
-    async def _queue_priority_request(self, endpoint: str, params: Dict, 
-                                    priority: int, cache_ttl: int) -> Tuple[Any, bool]:
+    async def _execute_batch(self, endpoint: str, batch: List[Tuple[Dict, str, int, int, asyncio.Future]]):
+        """Run one multi-ID lookup and hand each waiter (and the cache) its own result"""
+        ids = list(dict.fromkeys(str(params['id']) for params, *_ in batch))
+        priority = min(item_priority for *_, item_priority, _ in batch)
+        try:
+            response, _ = await self._queue_priority_request(endpoint, {'ids': ",".join(ids)}, priority, 0)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # X returns matched objects under 'data'; a response without it is shared as-is
+        data = response.get('data') if isinstance(response, dict) else None
+        by_id = {str(item.get('id')): item for item in data} if data is not None else None
+        
+        for params, cache_key, cache_ttl, _, future in batch:
+            result = response if by_id is None else by_id.get(str(params['id']))
+            if cache_ttl > 0:
+                self._cache_response(cache_key, endpoint, result, cache_ttl)
+            if not future.done():
+                future.set_result(result)
+    
+    async def _queue_priority_request(self, endpoint: str, params: Dict, priority: int,
+                                    cache_ttl: int, cache_key: Optional[str] = None) -> Tuple[Any, bool]:
         """Queue a priority request and wait for execution"""
         
         # Check if we can make request immediately
         if self.can_make_request(endpoint):
-            return await self._execute_request(endpoint, params, cache_ttl), False
+            return await self._execute_request(endpoint, params, cache_ttl, cache_key), False
         
         # Add to priority queue
         request = PriorityRequest(
             endpoint=endpoint,
             params=params,
             priority=priority,
-            scheduled_at=self._calculate_optimal_time(endpoint, priority)
+            scheduled_at=self._calculate_optimal_time(endpoint, priority),
+            cache_key=cache_key,
+            cache_ttl=cache_ttl,
+            done=asyncio.get_running_loop().create_future()
         )
         
-        self.priority_queue.append(request)
-        self.priority_queue.sort(key=lambda x: (x.priority, x.scheduled_at))
+        self._push_request(request)
         
         # Wait for execution
-        return await self._wait_for_request_execution(request)
+        return await self._wait_for_request_execution(request), False
+    
+    def _push_request(self, request: PriorityRequest):
+        """Add a request to the priority heap and make sure the dispatcher is running"""
+        heapq.heappush(
+            self.priority_queue,
+            (request.priority, request.scheduled_at, next(self._queue_seq), request)
+        )
+        self._queue_changed.set()
+        
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_queue())
     
     def can_make_request(self, endpoint: str) -> bool:
         """Check if we can make a request to endpoint"""
         
+        now = time.monotonic()
+        
         # Check backoff
         if endpoint in self.backoff_until:
-            if time.time() < self.backoff_until[endpoint]:
+            if now < self.backoff_until[endpoint]:
                 return False
             else:
                 del self.backoff_until[endpoint]
         
         # Check rate limits
-        now = time.time()
         limit_info = self.rate_limits.get(endpoint, {'limit': 300, 'window': 900})
         
-        # Clean old requests
-        window_start = now - limit_info['window']
-        self.request_history[endpoint] = [
-            req_time for req_time in self.request_history[endpoint]
-            if req_time > window_start
-        ]
-        
-        current_count = len(self.request_history[endpoint])
-        
         # Special handling for posting endpoints (follower growth optimization)
-        if endpoint in ['create_tweet', 'create_reply', 'retweet']:
-            return self._can_make_post_request(endpoint, current_count, limit_info['limit'])
-        
-        return current_count < limit_info['limit']
+        if endpoint in _POST_ENDPOINTS:
+            current_count = self._prune_history(endpoint, now - limit_info['window'])
+            return self._can_make_post_request(endpoint, current_count, limit_info['limit'], now)
+        
+        # Reads only need the exact in-window count near the limit; below it the raw history
+        # length (an overcount) already allows the call, and history stays bounded by the limit
+        if len(self.request_history[endpoint]) < limit_info['limit']:
+            return True
+        return self._prune_history(endpoint, now - limit_info['window']) < limit_info['limit']
     
-    def _can_make_post_request(self, endpoint: str, current_count: int, limit: int) -> bool:
+    def _prune_history(self, endpoint: str, window_start: float) -> int:
+        """Drop calls that left the rate window and return how many remain"""
+        history = self.request_history[endpoint]
+        while history and history[0] <= window_start:
+            history.popleft()
+        return len(history)
+    
+    def _can_make_post_request(self, endpoint: str, current_count: int, limit: int, now: float) -> bool:
         """Smart posting limits for follower growth"""
         
         # Respect daily limits
@@ -207,11 +440,11 @@ class EnhancedRateLimiter:
             return False
         
         # Minimum interval between posts (avoid spam appearance)
-        if time.time() - self.last_post_time < self.min_interval_between_posts:
+        if now - self.last_post_time < self.min_interval_between_posts:
             return False
         
         # Prefer peak engagement hours
-        current_hour = datetime.now().hour
+        current_hour = self._current_hour()
         if current_hour not in self.peak_engagement_hours:
             # Allow but with reduced frequency outside peak hours
             if current_count >= limit * 0.7:  # Use 70% of daily limit outside peak
@@ -219,29 +452,47 @@ class EnhancedRateLimiter:
         
         return True
     
+    def _seconds_until_available(self, endpoint: str) -> float:
+        """Time until a blocked endpoint can next be called (after can_make_request has pruned its history)"""
+        now = time.monotonic()
+        limit_info = self.rate_limits.get(endpoint, {'limit': 300, 'window': 900})
+        history = self.request_history[endpoint]
+        wait = self.backoff_until.get(endpoint, now) - now
+        
+        # Window is full until its oldest call ages out
+        if history and len(history) >= limit_info['limit']:
+            wait = max(wait, history[0] + limit_info['window'] - now)
+        
+        if endpoint in _POST_ENDPOINTS:
+            wait = max(wait, self.last_post_time + self.min_interval_between_posts - now)
+        
+        if wait <= 0:
+            # Only the off-peak posting cap is left, which can change on the hour
+            self._current_hour()
+            wait = self._hour_cache[1] - time.time()
+        return wait
+    
     def _calculate_optimal_time(self, endpoint: str, priority: int) -> float:
-        """Calculate optimal time to execute request"""
-        now = time.time()
+        """Calculate optimal (monotonic) time to execute request"""
+        now = time.monotonic()
         
-        if endpoint in ['create_tweet', 'create_reply', 'retweet']:
+        if endpoint in _POST_ENDPOINTS:
             # For posts, schedule during peak engagement hours
-            current_hour = datetime.now().hour
+            current_hour = self._current_hour()
             
             if current_hour in self.peak_engagement_hours:
                 # During peak hours, schedule ASAP but respect intervals
                 return max(now, self.last_post_time + self.min_interval_between_posts)
             else:
                 # Outside peak hours, schedule for next peak hour
-                next_peak = min([h for h in self.peak_engagement_hours if h > current_hour] + 
-                              [h + 24 for h in self.peak_engagement_hours])
-                next_peak_time = now + (next_peak - current_hour) * 3600
-                return next_peak_time
+                return now + self._hours_to_next_peak[current_hour] * 3600
         else:
             # For read operations, distribute evenly with priority consideration
             base_delay = (6 - priority) * 60  # Higher priority = less delay
             return now + base_delay
     
-    async def _execute_request(self, endpoint: str, params: Dict, cache_ttl: int) -> Any:
+    async def _execute_request(self, endpoint: str, params: Dict, cache_ttl: int,
+                               cache_key: Optional[str] = None) -> Any:
         """Execute the actual API request"""
         
         # Record the call
@@ -258,55 +509,96 @@ class EnhancedRateLimiter:
         
         # Cache the response
         if cache_ttl > 0:
-            cache_key = self._generate_cache_key(endpoint, params)
-            self.request_cache[cache_key] = CachedRequest(
-                endpoint=endpoint,
-                params_hash=cache_key,
-                response_data=mock_response,
-                cached_at=time.time(),
-                expires_at=time.time() + cache_ttl
-            )
-            self._save_cache()
+            self._cache_response(cache_key or self._generate_cache_key(endpoint, params),
+                                 endpoint, mock_response, cache_ttl)
         
         return mock_response
     
+    def _cache_response(self, cache_key: str, endpoint: str, response_data: Any, cache_ttl: int):
+        """Cache a response under the request's key and schedule a cache save"""
+        now = time.time()
+        self._store_cached_request(cache_key, CachedRequest(
+            endpoint=endpoint,
+            params_hash=cache_key,
+            response_data=response_data,
+            cached_at=now,
+            expires_at=now + cache_ttl,
+            size_bytes=len(orjson.dumps(response_data, option=orjson.OPT_NON_STR_KEYS))
+        ))
+        self._request_cache_save()
+    
     async def _wait_for_request_execution(self, request: PriorityRequest) -> Any:
         """Wait for queued request to be executed"""
-        
-        while True:
+        # Cancelling the waiter cancels the future, which the dispatcher then skips
+        return await request.done
+    
+    async def _wait_for_queue_change(self, timeout: float):
+        """Sleep until the timeout or until a new request is queued"""
+        self._queue_changed.clear()
+        try:
+            await asyncio.wait_for(self._queue_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _dispatch_queue(self):
+        """Execute queued requests in priority order; exits once the queue is empty"""
+        while self.priority_queue:
+            request = self.priority_queue[0][3]
+            if request.done.done():
+                heapq.heappop(self.priority_queue)
+                continue
+            
             # Check if it's time to execute
-            if time.time() >= request.scheduled_at and self.can_make_request(request.endpoint):
-                try:
-                    result = await self._execute_request(request.endpoint, request.params, 300)
-                    self.priority_queue.remove(request)
-                    return result
-                except Exception as e:
-                    request.retry_count += 1
-                    if request.retry_count >= 3:
-                        logger.error(f"Request failed after 3 retries: {e}")
-                        self.priority_queue.remove(request)
-                        raise
-                    
-                    # Exponential backoff
-                    request.scheduled_at = time.time() + (2 ** request.retry_count * 60)
+            delay = request.scheduled_at - time.monotonic()
+            if delay > 0:
+                await self._wait_for_queue_change(delay)
+                continue
+            if not self.can_make_request(request.endpoint):
+                await self._wait_for_queue_change(self._seconds_until_available(request.endpoint))
+                continue
+            
+            heapq.heappop(self.priority_queue)
+            try:
+                result = await self._execute_request(
+                    request.endpoint, request.params, request.cache_ttl, request.cache_key
+                )
+            except Exception as e:
+                request.retry_count += 1
+                if request.retry_count >= 3:
+                    logger.error(f"Request failed after 3 retries: {e}")
+                    if not request.done.done():
+                        request.done.set_exception(e)
+                    continue
+                
+                # Exponential backoff
+                request.scheduled_at = time.monotonic() + (2 ** request.retry_count * 60)
+                self._push_request(request)
+                continue
             
-            await asyncio.sleep(30)  # Check every 30 seconds
+            if not request.done.done():
+                request.done.set_result(result)
+    
+    @staticmethod
+    def _new_day_counter() -> itertools.count:
+        """Per-endpoint call counter for the current day; the first call draws 1"""
+        return itertools.count(1)
     
     def record_call(self, endpoint: str):
         """Record an API call"""
-        now = time.time()
+        now = time.monotonic()
         self.request_history[endpoint].append(now)
-        self.daily_usage[endpoint] += 1
+        self.daily_usage[endpoint] = calls_today = next(self._day_counters[endpoint])
         
-        if endpoint in ['create_tweet', 'create_reply', 'retweet']:
+        if endpoint in _POST_ENDPOINTS:
             self.last_post_time = now
         
-        logger.debug(f"Recorded call to {endpoint}, daily usage: {self.daily_usage[endpoint]}")
+        # Positional args are only formatted if the debug level isn't filtered out
+        logger.debug("Recorded call to %s, daily usage: %s", endpoint, calls_today)
     
     def handle_rate_limit_error(self, endpoint: str, retry_after: int = None):
         """Handle rate limit error with smart backoff"""
         backoff_time = retry_after or self._calculate_smart_backoff(endpoint)
-        self.backoff_until[endpoint] = time.time() + backoff_time
+        self.backoff_until[endpoint] = time.monotonic() + backoff_time
         
         logger.warning(f"Rate limit hit for {endpoint}, backing off for {backoff_time}s")
     
@@ -315,7 +607,7 @@ class EnhancedRateLimiter:
         base_backoff = self.rate_limits.get(endpoint, {}).get('window', 900)
         
         # Adjust based on endpoint type
-        if endpoint in ['create_tweet', 'create_reply', 'retweet']:
+        if endpoint in _POST_ENDPOINTS:
             # For posting, longer backoff to avoid daily limit exhaustion
             return base_backoff * 2
         else:
@@ -325,17 +617,13 @@ class EnhancedRateLimiter:
     def get_usage_analytics(self) -> Dict[str, RateLimitMetrics]:
         """Get detailed usage analytics"""
         analytics = {}
-        now = time.time()
+        now = time.monotonic()
+        wall_now = time.time()
         
         for endpoint, limit_info in self.rate_limits.items():
             # Clean old requests
             window_start = now - limit_info['window']
-            recent_calls = [
-                req_time for req_time in self.request_history[endpoint]
-                if req_time > window_start
-            ]
-            
-            calls_made = len(recent_calls)
+            calls_made = self._prune_history(endpoint, window_start)
             calls_remaining = limit_info['limit'] - calls_made
             efficiency_score = calls_made / limit_info['limit'] if limit_info['limit'] > 0 else 0
             
@@ -343,7 +631,7 @@ class EnhancedRateLimiter:
                 endpoint=endpoint,
                 calls_made=calls_made,
                 calls_remaining=calls_remaining,
-                window_reset=window_start + limit_info['window'],
+                window_reset=wall_now,
                 efficiency_score=efficiency_score,
                 backoff_time=max(0, self.backoff_until.get(endpoint, 0) - now)
             )
@@ -360,28 +648,35 @@ class EnhancedRateLimiter:
             'engagement_window_status': self._get_engagement_window_status(),
             'cache_hit_rate': self._calculate_cache_hit_rate(),
             'queue_size': len(self.priority_queue),
-            'backoff_endpoints': [ep for ep, time_left in self.backoff_until.items() if time_left > time.time()]
+            'backoff_endpoints': [ep for ep, time_left in self.backoff_until.items() if time_left > time.monotonic()]
         }
         
         return recommendations
     
+    def _current_hour(self) -> int:
+        """Local hour of day, re-read from the clock only once the hour has rolled over"""
+        hour, valid_until = self._hour_cache
+        now = time.time()
+        if now < valid_until:
+            return hour
+        
+        local = time.localtime(now)
+        self._hour_cache = (local.tm_hour, now - now % 1 - local.tm_min * 60 - local.tm_sec + 3600)
+        return local.tm_hour
+    
     def _get_next_optimal_post_time(self) -> float:
         """Get next optimal time to post for maximum engagement"""
         now = time.time()
-        current_dt = datetime.now()
+        current_dt = datetime.fromtimestamp(now)
         current_hour = current_dt.hour
         
         # If we can post now and it's peak hour, do it
         if (current_hour in self.peak_engagement_hours and 
-            time.time() - self.last_post_time >= self.min_interval_between_posts):
+            time.monotonic() - self.last_post_time >= self.min_interval_between_posts):
             return now
         
         # Otherwise, find next peak hour
-        next_peak_hours = [h for h in self.peak_engagement_hours if h > current_hour]
-        if not next_peak_hours:
-            next_peak_hours = [h + 24 for h in self.peak_engagement_hours]
-        
-        next_peak = min(next_peak_hours)
+        next_peak = current_hour + self._hours_to_next_peak[current_hour]
         next_peak_dt = current_dt.replace(hour=next_peak % 24, minute=0, second=0, microsecond=0)
         if next_peak >= 24:
             next_peak_dt += timedelta(days=1)
@@ -390,8 +685,7 @@ class EnhancedRateLimiter:
     
     def _get_engagement_window_status(self) -> str:
         """Get current engagement window status"""
-        current_hour = datetime.now().hour
-        if current_hour in self.peak_engagement_hours:
+        if self._current_hour() in self.peak_engagement_hours:
             return "PEAK_HOURS"
         else:
             return "OFF_PEAK"
@@ -403,5 +697,7 @@ class EnhancedRateLimiter:
     
     def reset_daily_usage(self):
         """Reset daily usage counters (call at midnight)"""
-        self.daily_usage.clear()
+        # Fresh counters, so each endpoint's next call draws 1 again
+        self._day_counters = defaultdict(self._new_day_counter)
+        self.daily_usage = defaultdict(int)
         logger.info("Daily usage counters reset")
\ No newline at end of file
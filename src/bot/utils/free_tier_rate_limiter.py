@@ -3,18 +3,49 @@ Free Tier Rate Limiter - Extreme Conservative Strategy
 Designed for X API Free Tier with very limited search quotas
 """
 
+import atexit
+import os
 import time
-import json
 import asyncio
+import weakref
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
 
-@dataclass
+# State mutations within this window are written to disk together
+_SAVE_INTERVAL_SECONDS = 5.0
+
+# Backoff delays indexed by consecutive failures; the last entry is where each schedule saturates
+_CHECK_BACKOFFS = tuple(min(3600, 300 * (1 << n)) for n in range(5))  # Max 1 hour
+_HIT_BACKOFFS = tuple(min(14400, 3600 * (1 << n)) for n in range(3))  # Max 4 hours
+
+# Shortest sleep between wait_until_available rechecks, so a stale estimate can't spin the loop
+_MIN_WAIT_SECONDS = 1.0
+
+# Limiters whose pending state is written on interpreter exit
+_LIVE_LIMITERS = weakref.WeakSet()
+
+def _flush_live_limiters():
+    """Write any state still waiting on a limiter's flusher"""
+    for limiter in list(_LIVE_LIMITERS):
+        limiter._flush_state()
+
+atexit.register(_flush_live_limiters)
+
+def _check_backoff(consecutive_failures: int) -> int:
+    """Backoff before the next request after this many consecutive failures"""
+    return _CHECK_BACKOFFS[min(consecutive_failures, len(_CHECK_BACKOFFS) - 1)]
+
+def _copy_status_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a status summary down to the per-endpoint dicts, so callers can't alter the memoized one"""
+    return {**summary, 'endpoints': {ep: dict(status) for ep, status in summary['endpoints'].items()}}
+
+@dataclass(slots=True)
 class RateLimitState:
     """Track rate limit state for an endpoint"""
     endpoint: str
@@ -60,6 +91,20 @@ class FreeTierRateLimiter:
         
         # Load persistent state
         self.limits_state: Dict[str, RateLimitState] = {}
+        self._last_reset_check_day = ''  # Day the quotas were last checked for rollover
+        # Next local midnight, recomputed once per day alongside the rollover check
+        self._midnight_ts = 0.0
+        self._midnight_iso = ''
+        # Created on the first save request inside an event loop, so they bind to that loop
+        self._state_dirty: Optional[asyncio.Event] = None
+        self._flush_now: Optional[asyncio.Event] = None  # Set by changes that shouldn't wait out the save interval
+        self._flusher: Optional[asyncio.Task] = None
+        # Bumped on every state change (see _request_save) to validate the memoized status summary
+        self._mutation_counter = 0
+        self._status_summary_key: Optional[tuple] = None
+        self._status_summary_cache: Optional[Dict[str, Any]] = None
+        # Shared per-endpoint wakeups for wait_until_available
+        self._endpoint_events: Dict[str, asyncio.Event] = {}
         self._load_state()
         
         # Initialize default states
@@ -72,14 +117,17 @@ class FreeTierRateLimiter:
                     last_reset=datetime.now().strftime('%Y-%m-%d')
                 )
         
+        # Anything still waiting on the flusher is written on interpreter exit
+        _LIVE_LIMITERS.add(self)
+        
         logger.info("Free Tier Rate Limiter initialized with ultra-conservative quotas")
     
     def _load_state(self):
         """Load persistent rate limit state"""
         try:
             if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    state_data = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state_data = orjson.loads(f.read())
                     
                 for endpoint, data in state_data.items():
                     self.limits_state[endpoint] = RateLimitState(**data)
@@ -88,32 +136,92 @@ class FreeTierRateLimiter:
         except Exception as e:
             logger.error(f"Error loading rate limit state: {e}")
     
+    def _state_payload(self) -> bytes:
+        """Encode rate limit state for disk as compact JSON"""
+        # orjson serializes the dataclasses natively, no asdict() copies needed
+        return orjson.dumps(self.limits_state)
+    
+    def _write_state(self, payload: bytes):
+        """Atomically replace the state file, so a crash mid-write can't leave half a file"""
+        tmp_file = self.state_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.state_file)
+    
     def _save_state(self):
         """Save persistent rate limit state"""
         try:
-            state_data = {
-                endpoint: asdict(state) 
-                for endpoint, state in self.limits_state.items()
-            }
-            with open(self.state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
+            self._write_state(self._state_payload())
         except Exception as e:
             logger.error(f"Error saving rate limit state: {e}")
     
+    def _flush_state(self):
+        """Save now if a write is still pending"""
+        if self._state_dirty is not None and self._state_dirty.is_set():
+            self._state_dirty.clear()
+            self._save_state()
+    
+    def _request_save(self, critical: bool = False):
+        """Mark state dirty for the background flusher, or save inline outside an event loop"""
+        self._mutation_counter += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_state()
+            return
+        
+        if self._state_dirty is None:
+            self._state_dirty = asyncio.Event()
+            self._flush_now = asyncio.Event()
+        self._state_dirty.set()
+        if critical:
+            self._flush_now.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Coalesce state mutations into at most one write per interval, off the event loop"""
+        while True:
+            await self._state_dirty.wait()
+            try:
+                # A critical change cuts the coalescing window short
+                await asyncio.wait_for(self._flush_now.wait(), _SAVE_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            self._state_dirty.clear()
+            try:
+                # Encode on the loop so the thread never sees state mid-update
+                payload = self._state_payload()
+                await asyncio.to_thread(self._write_state, payload)
+            except Exception as e:
+                logger.error(f"Error saving rate limit state: {e}")
+    
     def _reset_daily_quotas_if_needed(self):
         """Reset daily quotas if it's a new day"""
-        today = datetime.now().strftime('%Y-%m-%d')
+        current_dt = datetime.now()
+        today = current_dt.strftime('%Y-%m-%d')
+        if today == self._last_reset_check_day:
+            return
+        
+        midnight = datetime.combine(current_dt.date() + timedelta(days=1), datetime.min.time())
+        self._midnight_ts = midnight.timestamp()
+        self._midnight_iso = midnight.isoformat()
         
+        changed = False
         for endpoint, state in self.limits_state.items():
             if state.last_reset != today:
                 old_used = state.daily_used
                 state.daily_used = 0
                 state.last_reset = today
                 state.consecutive_failures = 0
+                changed = True
                 
                 logger.info(f"Reset daily quota for {endpoint}: {old_used} → 0")
         
-        self._save_state()
+        self._last_reset_check_day = today
+        if changed:
+            self._request_save()
     
     def can_make_request(self, endpoint: str) -> tuple[bool, str]:
         """
@@ -125,9 +233,10 @@ class FreeTierRateLimiter:
         if endpoint not in self.limits_state:
             return False, f"Unknown endpoint: {endpoint}"
         
-        state = self.limits_state[endpoint]
-        now = time.time()
-        
+        return self._can_make_request(endpoint, self.limits_state[endpoint], time.time())
+    
+    def _can_make_request(self, endpoint: str, state: RateLimitState, now: float) -> tuple[bool, str]:
+        """can_make_request against a known state at a given time; quotas must already be rolled over"""
         # Check if blocked due to rate limit
         if state.blocked_until and now < state.blocked_until:
             remaining = int(state.blocked_until - now)
@@ -148,7 +257,7 @@ class FreeTierRateLimiter:
         
         # Check exponential backoff for consecutive failures
         if state.consecutive_failures > 0:
-            backoff_delay = min(3600, 300 * (2 ** state.consecutive_failures))  # Max 1 hour
+            backoff_delay = _check_backoff(state.consecutive_failures)
             if state.last_success and (now - state.last_success) < backoff_delay:
                 remaining = int(backoff_delay - (now - state.last_success))
                 return False, f"Exponential backoff: {remaining}s remaining"
@@ -162,7 +271,7 @@ class FreeTierRateLimiter:
         
         state = self.limits_state[endpoint]
         state.daily_used += 1
-        self._save_state()
+        self._request_save()
         
         logger.info(f"Request attempt recorded for {endpoint}: {state.daily_used}/{state.daily_quota}")
     
@@ -176,7 +285,8 @@ class FreeTierRateLimiter:
         state.consecutive_failures = 0
         state.blocked_until = None  # Clear any blocks
         
-        self._save_state()
+        self._request_save()
+        self._wake_waiters(endpoint)
         
         logger.info(f"Successful request recorded for {endpoint}")
     
@@ -193,27 +303,34 @@ class FreeTierRateLimiter:
             backoff_time = retry_after
         else:
             # Smart backoff: start with 1 hour, double for each failure, max 4 hours
-            backoff_time = min(14400, 3600 * (2 ** (state.consecutive_failures - 1)))
+            backoff_time = _HIT_BACKOFFS[min(state.consecutive_failures - 1, len(_HIT_BACKOFFS) - 1)]
         
         state.blocked_until = time.time() + backoff_time
         
-        self._save_state()
+        # Losing a block window on a crash would walk straight back into the limit
+        self._request_save(critical=True)
+        self._wake_waiters(endpoint)
         
         logger.warning(f"Rate limit hit for {endpoint}: blocked for {backoff_time}s, failure #{state.consecutive_failures}")
     
     def get_next_available_time(self, endpoint: str) -> Optional[float]:
         """Get next time when request will be available"""
-        can_request, reason = self.can_make_request(endpoint)
-        
-        if can_request:
-            return time.time()  # Available now
+        self._reset_daily_quotas_if_needed()
         
         if endpoint not in self.limits_state:
             return None
         
         state = self.limits_state[endpoint]
         now = time.time()
+        can_request, _ = self._can_make_request(endpoint, state, now)
+        
+        if can_request:
+            return now  # Available now
         
+        return self._get_next_available_time(endpoint, state, now)
+    
+    def _get_next_available_time(self, endpoint: str, state: RateLimitState, now: float) -> float:
+        """Next available time for an endpoint that can't make a request at `now`"""
         # Calculate next available time based on various constraints
         next_times = []
         
@@ -223,20 +340,28 @@ class FreeTierRateLimiter:
         
         # If we have daily quota issues, wait until tomorrow
         if state.daily_used >= state.daily_quota:
-            tomorrow = datetime.now() + timedelta(days=1)
-            midnight = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-            next_times.append(midnight.timestamp())
+            next_times.append(self._midnight_ts)
         
         # If minimum delay not met
         if state.last_success:
             min_delay = self.min_delays.get(endpoint, 600)
             next_times.append(state.last_success + min_delay)
+            
+            # If exponential backoff for consecutive failures not met
+            if state.consecutive_failures > 0:
+                next_times.append(state.last_success + _check_backoff(state.consecutive_failures))
         
         return max(next_times) if next_times else now + 3600  # Default 1 hour
     
     def get_status_summary(self) -> Dict[str, Any]:
         """Get status summary of all endpoints"""
         self._reset_daily_quotas_if_needed()
+        now = time.time()
+        
+        # Countdowns are whole seconds, so a summary holds until state changes or the second ticks over
+        key = (self._last_reset_check_day, self._mutation_counter, int(now))
+        if key == self._status_summary_key:
+            return _copy_status_summary(self._status_summary_cache)
         
         summary = {
             'endpoints': {},
@@ -245,11 +370,10 @@ class FreeTierRateLimiter:
             'next_reset': self._get_next_reset_time()
         }
         
-        now = time.time()
-        
+        # Quotas were rolled over above, so each endpoint is checked against the same snapshot
         for endpoint, state in self.limits_state.items():
-            can_request, reason = self.can_make_request(endpoint)
-            next_available = self.get_next_available_time(endpoint)
+            can_request, reason = self._can_make_request(endpoint, state, now)
+            next_available = now if can_request else self._get_next_available_time(endpoint, state, now)
             
             endpoint_status = {
                 'daily_used': state.daily_used,
@@ -265,13 +389,14 @@ class FreeTierRateLimiter:
             summary['total_daily_requests'] += state.daily_used
             summary['total_daily_quota'] += state.daily_quota
         
-        return summary
+        self._status_summary_key = key
+        self._status_summary_cache = summary
+        return _copy_status_summary(summary)
     
     def _get_next_reset_time(self) -> str:
         """Get next quota reset time"""
-        tomorrow = datetime.now() + timedelta(days=1)
-        midnight = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-        return midnight.isoformat()
+        self._reset_daily_quotas_if_needed()
+        return self._midnight_iso
     
     def force_reset_endpoint(self, endpoint: str):
         """Force reset an endpoint (emergency use)"""
@@ -282,7 +407,8 @@ class FreeTierRateLimiter:
             state.blocked_until = None
             state.last_success = None
             
-            self._save_state()
+            self._request_save()
+            self._wake_waiters(endpoint)
             
             logger.warning(f"Force reset endpoint: {endpoint}")
     
@@ -319,6 +445,9 @@ class FreeTierRateLimiter:
         Returns True if available, False if max_wait exceeded
         """
         start_time = time.time()
+        event = self._endpoint_events.get(endpoint)
+        if event is None:
+            event = self._endpoint_events[endpoint] = asyncio.Event()
         
         while True:
             can_request, reason = self.can_make_request(endpoint)
@@ -327,9 +456,24 @@ class FreeTierRateLimiter:
                 return True
             
             # Check if we've exceeded max wait time
-            if time.time() - start_time > max_wait:
+            now = time.time()
+            remaining = max_wait - (now - start_time)
+            if remaining <= 0:
                 logger.warning(f"Max wait time {max_wait}s exceeded for {endpoint}")
                 return False
             
-            # Wait a bit before checking again
-            await asyncio.sleep(60)  # Check every minute
\ No newline at end of file
+            # Sleep until the endpoint should open up, or until its state changes
+            next_ts = self.get_next_available_time(endpoint)
+            sleep_for = remaining if next_ts is None else min(remaining, max(_MIN_WAIT_SECONDS, next_ts - now + 0.05))
+            try:
+                await asyncio.wait_for(event.wait(), sleep_for)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _wake_waiters(self, endpoint: str):
+        """Wake every wait_until_available call on the endpoint to recheck it"""
+        event = self._endpoint_events.get(endpoint)
+        if event is not None:
+            # set() releases the current waiters; clear() re-arms the event for the next round
+            event.set()
+            event.clear()
\ No newline at end of file
@@ -4,16 +4,30 @@ Advanced Logging Configuration for X Engagement Bot
 Provides structured logging with component separation, rotation, and email tracking.
 """
 
+import atexit
+import heapq
 import logging
 import logging.handlers
-import json
 import os
+import queue
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 import structlog
 
 
+def _attach_queue_listener(logger: logging.Logger, *handlers: logging.Handler) -> logging.handlers.QueueListener:
+    """Route a logger's records through a queue to handlers run on a listener thread"""
+    log_queue = queue.Queue(-1)  # Unbounded; a full queue would drop records
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 class EmailEventLogger:
     """Dedicated logger for email events and delivery tracking"""
     
@@ -22,13 +36,14 @@ class EmailEventLogger:
         self.log_file = log_dir / "email_events.log"
         self.logger = self._setup_email_logger()
     
-    def _setup_email_logger(self) -> logging.Logger:
+    def _setup_email_logger(self) -> structlog.stdlib.BoundLogger:
         """Configure dedicated email event logger"""
-        logger = logging.getLogger("email_events")
-        logger.setLevel(logging.INFO)
+        # Standard library logger for file output
+        stdlib_logger = logging.getLogger("email_events")
+        stdlib_logger.setLevel(logging.INFO)
         
         # Clear existing handlers
-        logger.handlers.clear()
+        stdlib_logger.handlers.clear()
         
         # File handler with rotation
         handler = logging.handlers.RotatingFileHandler(
@@ -42,40 +57,30 @@ class EmailEventLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        self._queue_listener = _attach_queue_listener(stdlib_logger, handler)
         
-        return logger
+        # Events are rendered once by structlog's JSON renderer
+        return structlog.get_logger("email_events").bind(channel="email")
     
     def log_email_attempt(self, to_email: str, subject: str, alert_type: str, 
                          opportunity_count: int, success: bool = True, 
                          error: str = None, smtp_response: str = None):
         """Log email sending attempt with key details"""
-        event_data = {
-            "event": "email_send",
-            "timestamp": datetime.now().isoformat(),
-            "to_email": to_email,
-            "subject": subject[:100],  # Truncate long subjects
-            "alert_type": alert_type,
-            "opportunity_count": opportunity_count,
-            "success": success,
-            "error": error,
-            "smtp_response": smtp_response
-        }
-        
-        if success:
-            self.logger.info(f"EMAIL_SENT: {json.dumps(event_data)}")
-        else:
-            self.logger.error(f"EMAIL_FAILED: {json.dumps(event_data)}")
+        log = self.logger.info if success else self.logger.error
+        log(
+            "email_sent" if success else "email_failed",
+            to_email=to_email,
+            subject=subject[:100],  # Truncate long subjects
+            alert_type=alert_type,
+            opportunity_count=opportunity_count,
+            success=success,
+            error=error,
+            smtp_response=smtp_response
+        )
     
     def log_email_bounce(self, to_email: str, bounce_reason: str):
         """Log email bounce events"""
-        event_data = {
-            "event": "email_bounce",
-            "timestamp": datetime.now().isoformat(),
-            "to_email": to_email,
-            "bounce_reason": bounce_reason
-        }
-        self.logger.warning(f"EMAIL_BOUNCED: {json.dumps(event_data)}")
+        self.logger.warning("email_bounced", to_email=to_email, bounce_reason=bounce_reason)
 
 
 class ComponentLogger:
@@ -108,7 +113,7 @@ class ComponentLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        stdlib_logger.addHandler(handler)
+        self._queue_listener = _attach_queue_listener(stdlib_logger, handler)
         
         # Return structured logger bound to component
         return structlog.get_logger(self.component_name)
@@ -142,13 +147,16 @@ class LoggingManager:
                 log_file.rename(archive_path)
                 print(f"Archived log: {log_file.name} -> {archive_path}")
         
-        # Clean up old archives (keep last 30 startup sessions)
-        archive_dirs = sorted(
-            [d for d in (self.base_log_dir / "archive").glob("*") if d.is_dir()]
-        )
-        if len(archive_dirs) > 30:
-            for old_dir in archive_dirs[:-30]:
-                import shutil
+        # Old archives are pruned in the background so startup doesn't wait on rmtree
+        threading.Thread(target=self._cleanup_old_archives, daemon=True).start()
+    
+    def _cleanup_old_archives(self, keep: int = 30):
+        """Clean up old archives (keep last 30 startup sessions)"""
+        archive_dirs = [d for d in (self.base_log_dir / "archive").glob("*") if d.is_dir()]
+        excess = len(archive_dirs) - keep
+        if excess > 0:
+            # Timestamped names sort oldest first; only the excess needs ordering
+            for old_dir in heapq.nsmallest(excess, archive_dirs):
                 shutil.rmtree(old_dir)
                 print(f"Cleaned up old archive: {old_dir}")
     
@@ -183,6 +191,10 @@ class LoggingManager:
         # Clear existing handlers
         root_logger.handlers.clear()
         
+        # Console and file output are written by a listener thread, so a slow disk or
+        # terminal never blocks the thread (usually the event loop) that logged; the
+        # email and component file handlers get their own listeners the same way
+        
         # Console handler for immediate feedback
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
@@ -191,7 +203,6 @@ class LoggingManager:
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
         
         # File handler for persistence
         file_handler = logging.handlers.RotatingFileHandler(
@@ -205,7 +216,8 @@ class LoggingManager:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        
+        self._queue_listener = _attach_queue_listener(root_logger, console_handler, file_handler)
     
     def get_component_logger(self, component_name: str) -> structlog.stdlib.BoundLogger:
         """Get or create component-specific logger"""
@@ -3,6 +3,7 @@ Feedback Web Server for Voice Evolution Tracking
 Handles HTTP endpoints for opportunity quality ratings and reply selection tracking
 """
 
+import html
 import json
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import urlparse, parse_qs
@@ -22,6 +23,55 @@ except ImportError:
 
 logger = get_component_logger("feedback_server")
 
+# Response pages are built once at import; only the message is filled per request
+_PAGE_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>{title}</title>
+            <meta charset="utf-8">
+            <style>
+                body {{{{ font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px; }}}}
+                .{box_class} {{{{ background: {box_background}; color: {box_color}; padding: 20px; border-radius: 8px; border: 1px solid {box_border}; }}}}
+                .header {{{{ color: #2c3e50; margin-bottom: 20px; }}}}
+                .button {{{{ background: {button_background}; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 15px; }}}}
+            </style>
+        </head>
+        <body>
+            <h1 class="header">🎯 X Engagement Bot Feedback</h1>
+            <div class="{box_class}">
+                {body}
+            </div>
+            <a href="#" onclick="window.close()" class="button">Close Window</a>
+        </body>
+        </html>
+"""
+
+_SUCCESS_PAGE_HTML = _PAGE_HTML.format(
+    title="Feedback Recorded",
+    box_class="success",
+    box_background="#d4edda",
+    box_color="#155724",
+    box_border="#c3e6cb",
+    button_background="#007bff",
+    body="""<h3>✅ Feedback Recorded Successfully</h3>
+                <p>{message}</p>
+                <p>This feedback helps improve AI x blockchain voice evolution and content quality over time.</p>
+                <p><strong>Thank you for contributing to the learning system!</strong></p>"""
+)
+
+_ERROR_PAGE_HTML = _PAGE_HTML.format(
+    title="Feedback Error",
+    box_class="error",
+    box_background="#f8d7da",
+    box_color="#721c24",
+    box_border="#f5c6cb",
+    button_background="#6c757d",
+    body="""<h3>❌ Feedback Error</h3>
+                <p>{message}</p>
+                <p>Please try again or contact support if the issue persists.</p>"""
+)
+
 class FeedbackHandler(BaseHTTPRequestHandler):
     """Handle feedback HTTP requests"""
     
@@ -128,70 +178,18 @@ class FeedbackHandler(BaseHTTPRequestHandler):
     
     def _send_success_response(self, message: str):
         """Send success response with user-friendly HTML"""
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        
-        html_response = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Feedback Recorded</title>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px; }}
-                .success {{ background: #d4edda; color: #155724; padding: 20px; border-radius: 8px; border: 1px solid #c3e6cb; }}
-                .header {{ color: #2c3e50; margin-bottom: 20px; }}
-                .button {{ background: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 15px; }}
-            </style>
-        </head>
-        <body>
-            <h1 class="header">🎯 X Engagement Bot Feedback</h1>
-            <div class="success">
-                <h3>✅ Feedback Recorded Successfully</h3>
-                <p>{message}</p>
-                <p>This feedback helps improve AI x blockchain voice evolution and content quality over time.</p>
-                <p><strong>Thank you for contributing to the learning system!</strong></p>
-            </div>
-            <a href="#" onclick="window.close()" class="button">Close Window</a>
-        </body>
-        </html>
-        """
-        
-        self.wfile.write(html_response.encode())
+        self._send_html_response(200, _SUCCESS_PAGE_HTML.format(message=html.escape(message)))
     
     def _send_error_response(self, status_code: int, message: str):
         """Send error response with user-friendly HTML"""
+        self._send_html_response(status_code, _ERROR_PAGE_HTML.format(message=html.escape(message)))
+    
+    def _send_html_response(self, status_code: int, page: str):
+        """Write a rendered HTML page with the given status"""
         self.send_response(status_code)
         self.send_header('Content-type', 'text/html')
         self.end_headers()
-        
-        html_response = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Feedback Error</title>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px; }}
-                .error {{ background: #f8d7da; color: #721c24; padding: 20px; border-radius: 8px; border: 1px solid #f5c6cb; }}
-                .header {{ color: #2c3e50; margin-bottom: 20px; }}
-                .button {{ background: #6c757d; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 15px; }}
-            </style>
-        </head>
-        <body>
-            <h1 class="header">🎯 X Engagement Bot Feedback</h1>
-            <div class="error">
-                <h3>❌ Feedback Error</h3>
-                <p>{message}</p>
-                <p>Please try again or contact support if the issue persists.</p>
-            </div>
-            <a href="#" onclick="window.close()" class="button">Close Window</a>
-        </body>
-        </html>
-        """
-        
-        self.wfile.write(html_response.encode())
+        self.wfile.write(page.encode())
     
     def log_message(self, format, *args):
         """Override to use structured logging"""
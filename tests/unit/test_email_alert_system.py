@@ -5,13 +5,14 @@ Tests for the enhanced email alert system with AI-generated content,
 action links, and opportunity formatting.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 import smtplib
 from email.mime.multipart import MIMEMultipart
 
-from src.bot.scheduling.cron_monitor import CronMonitorSystem, AlertConfiguration, AlertOpportunity
+from src.bot.scheduling.cron_monitor import CronMonitorSystem, AlertConfiguration, AlertOpportunity, _extract_json_object
 
 
 class TestEmailAlertSystem:
@@ -345,6 +346,178 @@ class TestEmailAlertSystem:
         assert str(summary_stats['total_opportunities']) in html_content
         assert f"{summary_stats['avg_score']:.2f}" in html_content
 
+    @pytest.mark.unit
+    def test_basic_analysis_matches_terms_as_substrings(self, monitor_system):
+        """Test basic lexical scoring matches multi-word terms, plurals and inflections as substrings."""
+        tweet = {'text': 'Breaking: new machine learning framework for smart contract optimization on Ethereum'}
+        analysis = monitor_system._basic_ai_blockchain_analysis("ai", tweet)
+        
+        assert analysis['ai_blockchain_relevance'] > 0
+        assert analysis['technical_depth'] > 0
+        assert analysis['innovation_score'] == 0.6
+        assert analysis['time_sensitivity'] == 0.7
+        
+        # Plurals and inflections still hit their vocabulary terms
+        plural = monitor_system._basic_ai_blockchain_analysis("ai", {'text': 'blockchains + algorithms = the future of cryptocurrency'})
+        assert round(plural['overall_ai_blockchain_score'], 3) == 0.268
+        contracts = monitor_system._basic_ai_blockchain_analysis("ai", {'text': 'Smart contracts on Ethereum'})
+        singular = monitor_system._basic_ai_blockchain_analysis("ai", {'text': 'Smart contract on Ethereum'})
+        assert contracts['overall_ai_blockchain_score'] == singular['overall_ai_blockchain_score'] > 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_keyword_matched_tweet_reaches_claude_without_vocabulary_hits(self, monitor_system):
+        """Test the lexical prefilter never drops a tweet that contains its search keyword."""
+        monitor_system.claude_client._make_api_call.return_value = {
+            'content': [{'text': '{"ai_blockchain_relevance": 0.9, "technical_depth": 0.8, "innovation_score": 0.8, "engagement_opportunity": 0.9}'}]
+        }
+        tweet = {'text': 'Wrote up how intents and Account Abstraction change wallets'}
+        
+        analysis = await monitor_system._analyze_ai_blockchain_content("account abstraction", tweet)
+        
+        assert monitor_system._basic_ai_blockchain_analysis("account abstraction", tweet)['overall_ai_blockchain_score'] == 0
+        assert monitor_system.claude_client._make_api_call.await_count == 1
+        assert analysis['overall_ai_blockchain_score'] > 0.6
+        
+        # Without the keyword, a tweet with no vocabulary hits still skips Claude
+        await monitor_system._analyze_ai_blockchain_content("account abstraction", {'text': 'gm frens'})
+        assert monitor_system.claude_client._make_api_call.await_count == 1
+
+    @pytest.mark.unit
+    def test_extract_json_object_from_claude_reply(self):
+        """Test JSON extraction handles surrounding prose, nesting and braces inside strings."""
+        reply = 'Here is the analysis: {"a": "x}y", "b": {"c": 1}} Let me know if} you need more.'
+        assert _extract_json_object(reply) == '{"a": "x}y", "b": {"c": 1}}'
+        assert _extract_json_object('{"quote": "say \\"hi\\" {"}') == '{"quote": "say \\"hi\\" {"}'
+        assert _extract_json_object("no json here") is None
+        assert _extract_json_object('{"unterminated": 1') is None
+
+    @pytest.mark.unit
+    def test_processed_ids_evict_oldest_first(self, monitor_system):
+        """Test the processed ID store drops the oldest IDs once it is full."""
+        monitor_system.processed_opportunities.clear()
+        opportunities = [
+            AlertOpportunity(
+                account_username="user", account_tier=1, content_text=f"tweet {i}",
+                content_url=f"https://twitter.com/user/status/{i}", timestamp="",
+                overall_score=0.5, ai_blockchain_relevance=0.5, technical_depth=0.5,
+                opportunity_type="", suggested_response_type="", time_sensitivity="",
+                strategic_context="", suggested_response=""
+            )
+            for i in range(3)
+        ]
+        
+        with patch('src.bot.scheduling.cron_monitor._MAX_PROCESSED_IDS', 2), \
+             patch.object(monitor_system, '_request_save'):
+            for opp in opportunities:
+                monitor_system._mark_opportunity_processed(opp)
+        
+        assert not monitor_system._is_opportunity_processed(opportunities[0])
+        assert monitor_system._is_opportunity_processed(opportunities[1])
+        assert monitor_system._is_opportunity_processed(opportunities[2])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_near_duplicate_tweets_reuse_generated_reply(self, monitor_system, sample_opportunities):
+        """Test a retweet of an already-answered tweet reuses the cached reply instead of calling Claude."""
+        monitor_system.claude_client.generate_content.return_value = MagicMock(
+            content='{"primary_reply": "hooks go brrr", "reasoning": "r", "alternatives": [], "engagement_prediction": 0.9, "voice_alignment": 0.9}'
+        )
+        original = sample_opportunities[0]
+        retweet = AlertOpportunity(**{**original.to_dict(), 'content_text': f"RT @saucepoint: {original.content_text} https://t.co/abc"})
+        
+        await monitor_system._generate_opportunity_content(original)
+        await monitor_system._generate_opportunity_content(retweet)
+        
+        assert monitor_system.claude_client.generate_content.await_count == 1
+        assert retweet.generated_reply == "hooks go brrr"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_reply_voice_and_schema_sent_as_system_prompt(self, monitor_system, sample_opportunities):
+        """Test reply generation sends the full voice guidelines and schema as the system prompt."""
+        monitor_system.claude_client.generate_content.return_value = MagicMock(content='{"primary_reply": "gm"}')
+        opportunity = sample_opportunities[0]
+        
+        await monitor_system._generate_opportunity_content(opportunity)
+        
+        kwargs = monitor_system.claude_client.generate_content.await_args.kwargs
+        system_prompt = kwargs['system_prompt']
+        assert "SingleDivorcedDad Sprotogremlin" in system_prompt
+        assert 'use "chat" for addressing readers' in system_prompt
+        assert 'Always use lowercase "v4" for Uniswap v4' in system_prompt
+        assert 'Use "Uniswap community/ecosystem/foundation/labs" not just "Uniswap"' in system_prompt
+        assert '"primary_reply"' in system_prompt
+        assert opportunity.content_text not in system_prompt
+        
+        # The user turn carries only the tweet and account fields
+        user_prompt = kwargs['context']['prompt']
+        assert opportunity.content_text in user_prompt
+        assert f"@{opportunity.account_username}" in user_prompt
+        assert "Voice Guidelines" not in user_prompt
+        assert opportunity.generated_reply == "gm"
+    
+    @pytest.mark.unit
+    def test_alert_html_escapes_tweet_content(self, monitor_system, sample_opportunities):
+        """Test tweet and Claude text is escaped when rendered into the alert template."""
+        opportunity = AlertOpportunity(**{
+            **sample_opportunities[0].to_dict(),
+            'content_text': "gm <script>alert('xss')</script>",
+            'generated_reply': "hooks & <b>routing</b>"
+        })
+        
+        html_content = monitor_system._generate_alert_html("IMMEDIATE", [opportunity], "Escaping check")
+        
+        assert "<script>" not in html_content
+        assert "&lt;script&gt;" in html_content
+        assert "hooks &amp; &lt;b&gt;routing&lt;/b&gt;" in html_content
+        assert "Opportunity 1: @saucepoint" in html_content
+    
+    @pytest.mark.unit
+    def test_opportunity_card_cache_tracks_reply_changes(self, monitor_system, sample_opportunities):
+        """Test re-rendered cards come from cache but never show a stale reply."""
+        opportunity = sample_opportunities[0]
+        
+        first = monitor_system._generate_alert_html("IMMEDIATE", [opportunity], "Cache check")
+        assert monitor_system._generate_alert_html("IMMEDIATE", [opportunity], "Cache check") == first
+        
+        opportunity.generated_reply = "v4 hooks are a whole new design space chat"
+        updated = monitor_system._generate_alert_html("IMMEDIATE", [opportunity], "Cache check")
+        
+        assert "v4 hooks are a whole new design space chat" in updated
+    
+    @pytest.mark.unit
+    def test_total_alerts_sent_keeps_counting_past_history_cap(self, monitor_system):
+        """Test the lifetime alert count isn't capped by the trimmed alert history."""
+        monitor_system._request_save = MagicMock()
+        starting_total = monitor_system.get_monitoring_stats()['total_alerts_sent']
+        
+        with patch('src.bot.scheduling.cron_monitor._MAX_ALERT_HISTORY', 3):
+            for _ in range(5):
+                monitor_system._record_alert("immediate", 1)
+        
+        stats = monitor_system.get_monitoring_stats()
+        assert len(monitor_system.alert_history) == 3
+        assert stats['total_alerts_sent'] == starting_total + 5
+        assert stats['alerts_today']['immediate'] >= 5
+    
+    @pytest.mark.unit
+    def test_feedback_tracking_batch_writes_pending_file_once(self, tmp_path, monkeypatch):
+        """Test batch registration returns IDs in order with a single save."""
+        from src.bot.analytics.feedback_tracker import FeedbackTracker
+        
+        monkeypatch.chdir(tmp_path)
+        tracker = FeedbackTracker()
+        
+        with patch.object(tracker, '_save_pending_feedback') as mock_save:
+            feedback_ids = tracker.create_opportunity_tracking_batch([
+                {'account_username': 'first', 'overall_score': 0.9},
+                {'account_username': 'second', 'overall_score': 0.7}
+            ])
+        
+        mock_save.assert_called_once()
+        assert [tracker.pending_feedback[fid]['account_username'] for fid in feedback_ids] == ['first', 'second']
+
 
 class TestEmailErrorHandling:
     """Test email system error handling."""
@@ -388,6 +561,96 @@ class TestEmailErrorHandling:
             
             # Verify the system attempted to connect
             mock_smtp.assert_called_once()
+    
+    @pytest.mark.unit
+    def test_smtp_connection_reused_until_server_drops_it(self, monitor_system_with_invalid_config):
+        """Test alerts share one SMTP login and reconnect after a failed NOOP."""
+        monitor = monitor_system_with_invalid_config
+        msg = MIMEMultipart('alternative')
+        
+        with patch('smtplib.SMTP') as mock_smtp:
+            server = mock_smtp.return_value
+            server.noop.return_value = (250, b"OK")
+            server.send_message.return_value = {}
+            
+            monitor._deliver_message(msg, ["invalid@invalid.com"])
+            monitor._deliver_message(msg, ["invalid@invalid.com"])
+            assert mock_smtp.call_count == 1
+            assert server.login.call_count == 1
+            
+            server.noop.side_effect = smtplib.SMTPServerDisconnected("idle timeout")
+            monitor._deliver_message(msg, ["invalid@invalid.com"])
+            assert mock_smtp.call_count == 2
+            
+            monitor._close_smtp()
+            server.quit.assert_called_once()
+    
+    @pytest.mark.unit
+    def test_batch_delivery_keeps_per_message_results(self, monitor_system_with_invalid_config):
+        """Test a socket error fails only its own message and the next one reconnects."""
+        monitor = monitor_system_with_invalid_config
+        first, second, third = (MIMEMultipart('alternative') for _ in range(3))
+        
+        with patch('smtplib.SMTP') as mock_smtp:
+            server = mock_smtp.return_value
+            server.send_message.side_effect = [{}, ConnectionResetError("reset by peer"), {}]
+            
+            results = monitor._deliver_batch([(msg, ["invalid@invalid.com"]) for msg in (first, second, third)])
+            
+            assert results[0] == "250 OK"
+            assert isinstance(results[1], ConnectionResetError)
+            assert results[2] == "250 OK"
+            assert mock_smtp.call_count == 2
+            
+            # A failed reconnect is reported for that message too
+            server.send_message.side_effect = smtplib.SMTPServerDisconnected("gone")
+            mock_smtp.side_effect = OSError("connection refused")
+            results = monitor._deliver_batch([(first, ["invalid@invalid.com"])])
+            assert isinstance(results[0], OSError)
+            assert monitor._smtp is None
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_priority_alert_sent_when_feedback_registration_fails(self, monitor_system_with_invalid_config):
+        """Test the priority alert still goes out if the feedback tracker can't register it."""
+        monitor = monitor_system_with_invalid_config
+        opportunity = AlertOpportunity(
+            account_username="test", account_tier=1, content_text="Uniswap v4 hooks",
+            content_url="https://twitter.com/test/status/1", timestamp="test", overall_score=0.9,
+            ai_blockchain_relevance=0.8, technical_depth=0.7,
+            opportunity_type="test", suggested_response_type="test",
+            time_sensitivity="test", strategic_context="test",
+            suggested_response="test"
+        )
+        tracker = MagicMock()
+        tracker.create_opportunity_tracking_batch.side_effect = OSError("disk full")
+        monitor._generate_original_content = AsyncMock(return_value={'content': 'gm chat', 'content_type': 'unhinged_take'})
+        monitor._send_detailed_alert_with_original_content = AsyncMock()
+        
+        with patch('src.bot.scheduling.cron_monitor.get_feedback_tracker', return_value=tracker):
+            await monitor._send_priority_alerts([opportunity])
+        
+        sent_opportunities, original_content = monitor._send_detailed_alert_with_original_content.await_args.args
+        assert sent_opportunities == [opportunity]
+        assert opportunity.feedback_urls
+        assert 'feedback_id' not in original_content
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_background_task_failure_is_logged(self, monitor_system_with_invalid_config):
+        """Test an exception in a background alert task is logged when the task finishes."""
+        monitor = monitor_system_with_invalid_config
+        
+        async def failing_alert():
+            raise RuntimeError("smtp exploded")
+        
+        with patch('src.bot.scheduling.cron_monitor.logger') as mock_logger:
+            task = monitor._run_in_background(failing_alert())
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+        
+        assert not monitor._background_tasks
+        assert "smtp exploded" in mock_logger.error.call_args.args[0]
 
 
 if __name__ == "__main__":
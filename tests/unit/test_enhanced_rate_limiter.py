@@ -0,0 +1,243 @@
+"""
+Tests for the Enhanced Rate Limiter
+
+Covers the priority queue dispatcher, single-ID lookup batching, the LRU
+response cache and the cache flush on shutdown.
+"""
+
+import asyncio
+import time
+import pytest
+import orjson
+from unittest.mock import AsyncMock
+
+from src.bot.utils import enhanced_rate_limiter
+from src.bot.utils.enhanced_rate_limiter import EnhancedRateLimiter, PriorityRequest
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    """Rate limiter with its cache directory under tmp_path"""
+    return EnhancedRateLimiter(cache_dir=str(tmp_path / "cache"))
+
+
+def make_request(endpoint, priority, delay=0.0, tag=None):
+    """Queued request due `delay` seconds from now, resolved through its own future"""
+    return PriorityRequest(
+        endpoint=endpoint,
+        params={'tag': tag or priority},
+        priority=priority,
+        scheduled_at=time.monotonic() + delay,
+        cache_ttl=0,
+        done=asyncio.get_running_loop().create_future()
+    )
+
+
+def record_executions(limiter):
+    """Replace request execution with a stub that logs the order requests run in"""
+    executed = []
+    
+    async def execute(endpoint, params, cache_ttl, cache_key=None):
+        executed.append(params['tag'])
+        return params['tag']
+    
+    limiter._execute_request = execute
+    return executed
+
+
+class TestPriorityDispatch:
+    """Test the queue dispatcher's ordering and wake-ups."""
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_due_requests_run_in_priority_order(self, limiter):
+        """Requests that are due together run highest priority first, FIFO within a priority."""
+        executed = record_executions(limiter)
+        requests = [
+            make_request('search_tweets', 3, tag='p3'),
+            make_request('search_tweets', 1, tag='p1-first'),
+            make_request('search_tweets', 5, tag='p5'),
+            make_request('search_tweets', 1, tag='p1-second'),
+        ]
+        
+        for request in requests:
+            limiter._push_request(request)
+        await asyncio.wait_for(asyncio.gather(*(r.done for r in requests)), 1)
+        
+        assert executed == ['p1-first', 'p1-second', 'p3', 'p5']
+        await asyncio.wait_for(limiter._dispatcher, 1)
+        assert limiter.priority_queue == []
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_dispatcher_wakes_when_backoff_expires(self, limiter):
+        """A request blocked by backoff runs as soon as the backoff ends, not on a fixed poll."""
+        executed = record_executions(limiter)
+        limiter.backoff_until['search_tweets'] = time.monotonic() + 0.05
+        request = make_request('search_tweets', 1)
+        
+        started = time.monotonic()
+        limiter._push_request(request)
+        await asyncio.wait_for(request.done, 1)
+        elapsed = time.monotonic() - started
+        
+        assert executed == [1]
+        assert 0.05 <= elapsed < 0.5
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_new_request_interrupts_dispatcher_sleep(self, limiter):
+        """Queueing a due request wakes a dispatcher sleeping until a later scheduled one."""
+        executed = record_executions(limiter)
+        later = make_request('search_tweets', 3, delay=60, tag='later')
+        limiter._push_request(later)
+        await asyncio.sleep(0)
+        
+        urgent = make_request('search_tweets', 1, tag='urgent')
+        limiter._push_request(urgent)
+        await asyncio.wait_for(urgent.done, 1)
+        
+        assert executed == ['urgent']
+        assert not later.done.done()
+        assert limiter.priority_queue[0][3] is later
+        limiter._dispatcher.cancel()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_requests_are_skipped(self, limiter):
+        """A request whose waiter went away is dropped rather than executed."""
+        executed = record_executions(limiter)
+        cancelled = make_request('search_tweets', 1, tag='cancelled')
+        kept = make_request('search_tweets', 2, tag='kept')
+        cancelled.done.cancel()
+        
+        limiter._push_request(cancelled)
+        limiter._push_request(kept)
+        await asyncio.wait_for(kept.done, 1)
+        
+        assert executed == ['kept']
+
+
+class TestLookupBatching:
+    """Test coalescing of single-ID lookups."""
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_single_id_lookups_share_one_request(self, limiter):
+        """Lookups within the batch window go out as one deduplicated multi-ID request."""
+        limiter._queue_priority_request = AsyncMock(return_value=(
+            {'data': [{'id': '1', 'name': 'one'}, {'id': '2', 'name': 'two'}]}, False
+        ))
+        
+        results = await asyncio.gather(
+            limiter.get_cached_or_request('user_lookup', {'id': 1}, priority=3),
+            limiter.get_cached_or_request('user_lookup', {'id': '2'}, priority=1),
+            limiter.get_cached_or_request('user_lookup', {'id': 1}, priority=4),
+        )
+        
+        limiter._queue_priority_request.assert_awaited_once_with('user_lookup', {'ids': '1,2'}, 1, 0)
+        assert results == [
+            ({'id': '1', 'name': 'one'}, False),
+            ({'id': '2', 'name': 'two'}, False),
+            ({'id': '1', 'name': 'one'}, False),
+        ]
+        
+        # Each ID's result is cached under its own single-ID key
+        assert await limiter.get_cached_or_request('user_lookup', {'id': '2'}) == ({'id': '2', 'name': 'two'}, True)
+        await limiter.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting_for_window(self, limiter, monkeypatch):
+        """A batch that reaches the ID cap is flushed immediately."""
+        monkeypatch.setattr(enhanced_rate_limiter, '_BATCH_MAX_IDS', 2)
+        monkeypatch.setattr(enhanced_rate_limiter, '_BATCH_WINDOW_SECONDS', 60)
+        limiter._queue_priority_request = AsyncMock(return_value=({'data': [{'id': '1'}, {'id': '2'}]}, False))
+        
+        results = await asyncio.wait_for(asyncio.gather(
+            limiter.get_cached_or_request('tweet_lookup', {'id': 1}, cache_ttl=0),
+            limiter.get_cached_or_request('tweet_lookup', {'id': 2}, cache_ttl=0),
+        ), 1)
+        
+        assert results == [({'id': '1'}, False), ({'id': '2'}, False)]
+        assert limiter._batch_timers == {}
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_waiter(self, limiter):
+        """An error from the combined request is raised to each batched caller."""
+        limiter._queue_priority_request = AsyncMock(side_effect=RuntimeError("lookup failed"))
+        
+        results = await asyncio.gather(
+            limiter.get_cached_or_request('user_lookup', {'id': 1}),
+            limiter.get_cached_or_request('user_lookup', {'id': 2}),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not limiter.request_cache
+
+
+class TestResponseCache:
+    """Test the LRU response cache and its persistence."""
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, limiter, monkeypatch):
+        """Past the entry cap the least recently used response is dropped, counting cache hits as use."""
+        monkeypatch.setattr(enhanced_rate_limiter, '_CACHE_MAX_ENTRIES', 2)
+        await limiter.get_cached_or_request('search_tweets', {'q': 'first'})
+        await limiter.get_cached_or_request('search_tweets', {'q': 'second'})
+        
+        # A hit makes 'first' the most recently used
+        _, from_cache = await limiter.get_cached_or_request('search_tweets', {'q': 'first'})
+        assert from_cache
+        await limiter.get_cached_or_request('search_tweets', {'q': 'third'})
+        
+        keys = [limiter._generate_cache_key('search_tweets', {'q': q}) for q in ('first', 'second', 'third')]
+        assert list(limiter.request_cache) == [keys[0], keys[2]]
+        assert limiter._cache_bytes == sum(entry.size_bytes for entry in limiter.request_cache.values())
+        await limiter.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_byte_cap_evicts_oldest_entries(self, limiter, monkeypatch):
+        """Entries are evicted oldest first once the encoded size cap is exceeded."""
+        await limiter.get_cached_or_request('search_tweets', {'q': 'sized'})
+        entry_size = next(iter(limiter.request_cache.values())).size_bytes
+        monkeypatch.setattr(enhanced_rate_limiter, '_CACHE_MAX_BYTES', entry_size * 2)
+        
+        await limiter.get_cached_or_request('search_tweets', {'q': 'other'})
+        await limiter.get_cached_or_request('search_tweets', {'q': 'third'})
+        
+        assert len(limiter.request_cache) <= 2
+        assert limiter._cache_bytes <= entry_size * 2
+        assert limiter._generate_cache_key('search_tweets', {'q': 'sized'}) not in limiter.request_cache
+        await limiter.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_cache_entries(self, limiter, tmp_path):
+        """Entries still waiting on the flush window are written when the limiter closes."""
+        await limiter.get_cached_or_request('search_tweets', {'q': 'Uniswap  v4'})
+        assert not limiter.cache_file.exists()
+        
+        await limiter.close()
+        
+        assert limiter._cache_flusher is None
+        saved = orjson.loads(limiter.cache_file.read_bytes())
+        assert list(saved) == list(limiter.request_cache)
+        
+        # A fresh limiter serves the entry from disk, under the normalized query
+        reloaded = EnhancedRateLimiter(cache_dir=str(tmp_path / "cache"))
+        _, from_cache = await reloaded.get_cached_or_request('search_tweets', {'q': 'uniswap v4'})
+        assert from_cache
+        await reloaded.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close_without_pending_entries_skips_write(self, limiter):
+        """Closing with nothing dirty leaves the cache file alone."""
+        await limiter.close()
+        
+        assert not limiter.cache_file.exists()
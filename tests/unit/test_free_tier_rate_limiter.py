@@ -0,0 +1,189 @@
+"""
+Tests for the Free Tier Rate Limiter
+
+Covers daily quota rollover, the coalesced state flush, waking of
+wait_until_available callers and isolation of the memoized status summary.
+"""
+
+import asyncio
+import atexit
+import time
+import pytest
+import orjson
+
+from src.bot.utils import free_tier_rate_limiter
+from src.bot.utils.free_tier_rate_limiter import FreeTierRateLimiter
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    """Rate limiter with its state directory under tmp_path"""
+    return FreeTierRateLimiter(state_dir=str(tmp_path / "rate_limits"))
+
+
+def saved_state(limiter):
+    """State as last written to disk"""
+    return orjson.loads(limiter.state_file.read_bytes())
+
+
+class TestDailyRollover:
+    """Test the daily quota reset."""
+    
+    @pytest.mark.unit
+    def test_new_day_resets_usage_and_failures(self, limiter):
+        """Usage recorded on an earlier day is cleared on the first check of a new day."""
+        state = limiter.limits_state['search_tweets']
+        state.daily_used = state.daily_quota
+        state.consecutive_failures = 2
+        state.last_reset = '2000-01-01'
+        limiter._last_reset_check_day = ''
+        
+        can_request, reason = limiter.can_make_request('search_tweets')
+        
+        assert can_request, reason
+        assert state.daily_used == 0
+        assert state.consecutive_failures == 0
+        assert state.last_reset == time.strftime('%Y-%m-%d')
+        assert saved_state(limiter)['search_tweets']['daily_used'] == 0
+    
+    @pytest.mark.unit
+    def test_same_day_keeps_usage(self, limiter):
+        """Usage from today survives repeated checks."""
+        limiter.record_request_attempt('user_lookup')
+        limiter.can_make_request('user_lookup')
+        
+        assert limiter.limits_state['user_lookup'].daily_used == 1
+    
+    @pytest.mark.unit
+    def test_exhausted_quota_blocks_requests(self, limiter):
+        """An endpoint that used its daily quota is refused until the reset."""
+        for _ in range(limiter.daily_quotas['get_me']):
+            limiter.record_request_attempt('get_me')
+        
+        can_request, reason = limiter.can_make_request('get_me')
+        
+        assert not can_request
+        assert reason.startswith("Daily quota exhausted")
+
+
+class TestStateFlush:
+    """Test coalesced persistence of rate limit state."""
+    
+    @pytest.mark.unit
+    def test_events_are_created_lazily(self, limiter):
+        """No asyncio events exist until something needs them inside a loop."""
+        limiter.record_request_attempt('search_tweets')
+        limiter._flush_state()
+        
+        assert limiter._state_dirty is None
+        assert limiter._flush_now is None
+        assert limiter._endpoint_events == {}
+    
+    @pytest.mark.unit
+    def test_exit_hook_is_registered_once(self, tmp_path, monkeypatch):
+        """Creating limiters doesn't add an exit hook per instance."""
+        registered = []
+        monkeypatch.setattr(atexit, 'register', registered.append)
+        
+        first = FreeTierRateLimiter(state_dir=str(tmp_path / "a"))
+        second = FreeTierRateLimiter(state_dir=str(tmp_path / "b"))
+        
+        assert registered == []
+        assert first in free_tier_rate_limiter._LIVE_LIMITERS
+        assert second in free_tier_rate_limiter._LIVE_LIMITERS
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_changes_in_loop_are_coalesced(self, limiter, monkeypatch):
+        """Routine changes inside a loop wait for the flusher instead of writing inline."""
+        writes = []
+        monkeypatch.setattr(limiter, '_write_state', writes.append)
+        
+        limiter.record_request_attempt('search_tweets')
+        limiter.record_request_attempt('user_lookup')
+        await asyncio.sleep(0.05)
+        
+        assert writes == []
+        assert limiter._state_dirty.is_set()
+        limiter._flusher.cancel()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rate_limit_hit_is_flushed_immediately(self, limiter):
+        """A rate limit block is written without waiting out the save interval."""
+        limiter.record_rate_limit_hit('search_tweets', retry_after=600)
+        
+        for _ in range(100):
+            if not limiter._state_dirty.is_set() and saved_state(limiter)['search_tweets']['blocked_until']:
+                break
+            await asyncio.sleep(0.01)
+        
+        assert saved_state(limiter)['search_tweets']['blocked_until'] == limiter.limits_state['search_tweets'].blocked_until
+        limiter._flusher.cancel()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_exit_hook_writes_pending_state(self, limiter):
+        """State still waiting on the flusher is written by the exit hook."""
+        limiter.record_request_attempt('user_timeline')
+        limiter._flusher.cancel()
+        
+        free_tier_rate_limiter._flush_live_limiters()
+        
+        assert not limiter._state_dirty.is_set()
+        assert saved_state(limiter)['user_timeline']['daily_used'] == 1
+
+
+class TestWaitUntilAvailable:
+    """Test waking of callers blocked on an endpoint."""
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_state_change_releases_waiters(self, limiter):
+        """Every waiter on an endpoint rechecks it as soon as its state changes."""
+        limiter.limits_state['search_tweets'].blocked_until = time.time() + 3600
+        waiters = [asyncio.create_task(limiter.wait_until_available('search_tweets', max_wait=60)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert not any(waiter.done() for waiter in waiters)
+        
+        limiter.force_reset_endpoint('search_tweets')
+        
+        assert await asyncio.wait_for(asyncio.gather(*waiters), 1) == [True, True, True]
+        limiter._flusher.cancel()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_wait_gives_up_after_max_wait(self, limiter):
+        """A waiter returns False once max_wait passes without the endpoint opening."""
+        limiter.limits_state['search_tweets'].blocked_until = time.time() + 3600
+        
+        assert await asyncio.wait_for(limiter.wait_until_available('search_tweets', max_wait=0.05), 1) is False
+
+
+class TestStatusSummary:
+    """Test the memoized status summary."""
+    
+    @pytest.mark.unit
+    def test_callers_get_isolated_copies(self, limiter):
+        """Mutating a returned summary doesn't leak into later calls."""
+        first = limiter.get_status_summary()
+        first['total_daily_requests'] = 99
+        first['endpoints']['search_tweets']['daily_used'] = 99
+        del first['endpoints']['get_me']
+        
+        second = limiter.get_status_summary()
+        
+        assert second['total_daily_requests'] == 0
+        assert second['endpoints']['search_tweets']['daily_used'] == 0
+        assert 'get_me' in second['endpoints']
+    
+    @pytest.mark.unit
+    def test_summary_reflects_state_changes(self, limiter):
+        """A recorded request invalidates the memoized summary."""
+        limiter.get_status_summary()
+        
+        limiter.record_request_attempt('search_tweets')
+        summary = limiter.get_status_summary()
+        
+        assert summary['endpoints']['search_tweets']['daily_used'] == 1
+        assert summary['total_daily_requests'] == 1
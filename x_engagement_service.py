@@ -833,6 +833,9 @@ class XEngagementService:
                 await asyncio.sleep(60)  # Wait before retrying
         
         # Cleanup
+        if self.monitor:
+            # End the persistent SMTP session kept open between alerts
+            await asyncio.to_thread(self.monitor._close_smtp)
         self.health_server.stop()
         logger.info("🛑 X Engagement Bot service stopped")
     